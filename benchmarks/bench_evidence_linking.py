@@ -0,0 +1,69 @@
+"""Benchmark evidence linking in ``extract_claims`` on synthetic sections.
+
+Run with ``python -m benchmarks.bench_evidence_linking``. Every sentence is
+classified for evidence exactly once per section, so regex work grows linearly
+with section size. The remaining growth comes from the output itself: each
+claim still receives its own list of (shared) ``Evidence`` objects, which is
+reported as ``links``.
+"""
+
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from pipeline.claim_extract import extract_claims
+
+
+SENTENCE_TEMPLATES = [
+    "We show that hippocampal neurons encode a novel spatial map.",
+    "Decoding accuracy improved by {n}% across sessions.",
+    "Responses were recorded from layer {n} of the visual cortex.",
+    "The effect was robust (p < 0.0{n}) in all animals.",
+    "Animals were trained for {n} days before recording.",
+    "We report a new form of synaptic plasticity in the striatum.",
+    "See Figure {n} for the full distribution.",
+    "Data were preprocessed with a standard pipeline.",
+]
+
+
+def synthetic_section(n_sentences: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    sentences = [
+        rng.choice(SENTENCE_TEMPLATES).format(n=rng.randint(1, 9))
+        for _ in range(n_sentences)
+    ]
+    return " ".join(sentences)
+
+
+def _time(text: str, repeat: int) -> Tuple[float, int]:
+    best = float("inf")
+    links = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        claims = extract_claims("results", text, None, "pdf")
+        best = min(best, time.perf_counter() - start)
+        links = sum(len(claim.evidence) for claim in claims)
+    return best, links
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 2500, 5000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'sentences':>10} {'links':>12} {'seconds':>10} {'us/sentence':>12}")
+    rows: List[float] = []
+    for size in args.sizes:
+        text = synthetic_section(size)
+        elapsed, links = _time(text, args.repeat)
+        per_sentence = elapsed / size * 1e6
+        rows.append(per_sentence)
+        print(f"{size:>10} {links:>12} {elapsed:>10.4f} {per_sentence:>12.2f}")
+
+    print(f"per-sentence cost ratio (largest/smallest): {rows[-1] / rows[0]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark incremental leaderboard updates against full recomputation.
+
+Run with ``python -m benchmarks.bench_incremental_leaderboard``. Builds an
+``IncrementalLeaderboard`` over a synthetic graph, then times adding a single
+new paper with its citations, and compares with a from-scratch
+``compute_impact_leaderboard`` on the same graph.
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.bench_pagerank import synthetic_graph
+from pipeline.leaderboard import (
+    CitationCounts,
+    IncrementalLeaderboard,
+    InfluenceEdge,
+    LeaderboardPaper,
+    compute_impact_leaderboard,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--papers", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--updates", type=int, default=20)
+    parser.add_argument("--citations", type=int, default=10, help="Citations per added paper")
+    args = parser.parse_args()
+
+    papers, edges = synthetic_graph(args.papers, args.edges)
+    start = time.perf_counter()
+    board = IncrementalLeaderboard(papers, edges)
+    print(f"initial build: {time.perf_counter() - start:8.3f}s")
+
+    rng = random.Random(1)
+    timings = []
+    for i in range(args.updates):
+        paper = LeaderboardPaper(
+            paper_id=f"new{i}",
+            novelty_score=rng.random(),
+            evidence_score=rng.random(),
+            citations=CitationCounts(openalex=rng.randint(0, 50)),
+        )
+        new_edges = [
+            InfluenceEdge(paper.paper_id, f"p{rng.randrange(args.papers)}", "citation", 1.0)
+            for _ in range(args.citations)
+        ]
+        start = time.perf_counter()
+        board.update(add_papers=[paper], add_edges=new_edges)
+        timings.append(time.perf_counter() - start)
+        papers.append(paper)
+        edges.extend(new_edges)
+
+    timings.sort()
+    print(
+        f"add paper + {args.citations} edges: median {timings[len(timings) // 2] * 1e3:.2f}ms, "
+        f"max {timings[-1] * 1e3:.2f}ms, rebuilds {board.rebuilds - 1}, "
+        f"L1 error bound {board.error_bound():.2e}"
+    )
+
+    start = time.perf_counter()
+    reference = compute_impact_leaderboard(papers, edges)
+    print(f"full recompute: {time.perf_counter() - start:8.3f}s")
+
+    incremental = {item["paper_id"]: item["pagerank_score"] for item in board.leaderboard()}
+    diff = max(abs(item["pagerank_score"] - incremental[item["paper_id"]]) for item in reference)
+    print(f"max |incremental - full| pagerank_score: {diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark JSON encoding of extraction payloads.
+
+Run with ``python -m benchmarks.bench_json`` (uses ``extraction.json`` at the
+repo root) or ``--input PATH``. ``--scale N`` repeats the claim lists N times
+to mimic larger papers. Reports the encode time per payload for the previous
+paths (``json.dumps(indent=2)`` in the CLI, ``jsonable_encoder`` followed by
+``json.dumps`` in FastAPI) and for ``pipeline.jsonio.dumps`` on each backend.
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from pipeline import jsonio
+
+CLAIM_LISTS = ("all_claims", "key_ideas", "breakthroughs")
+
+
+def load_payload(path: Path, scale: int) -> Dict:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    for name in CLAIM_LISTS:
+        if isinstance(payload.get(name), list):
+            payload[name] = payload[name] * scale
+    return payload
+
+
+def encoders() -> List[Tuple[str, Callable[[Dict], bytes]]]:
+    cases: List[Tuple[str, Callable[[Dict], bytes]]] = [
+        ("json indent=2 (old CLI)", lambda p: json.dumps(p, indent=2).encode("utf-8")),
+    ]
+    try:
+        from fastapi.encoders import jsonable_encoder
+
+        cases.append(
+            (
+                "jsonable_encoder+json (old API)",
+                lambda p: json.dumps(jsonable_encoder(p), ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+            )
+        )
+    except ImportError:
+        pass
+    cases.append(("jsonio stdlib", lambda p: jsonio.dumps(p, backend="stdlib")))
+    if jsonio.orjson is not None:
+        cases.append(("jsonio orjson", lambda p: jsonio.dumps(p, backend="orjson")))
+        cases.append(("jsonio orjson pretty", lambda p: jsonio.dumps(p, pretty=True, backend="orjson")))
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--input", type=Path, default=Path("extraction.json"))
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    payload = load_payload(args.input, args.scale)
+    print(f"{args.input}: {sum(len(payload.get(name) or []) for name in CLAIM_LISTS)} claims")
+
+    baseline = None
+    for label, encode in encoders():
+        size = len(encode(payload))
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            encode(payload)
+        per_call = (time.perf_counter() - start) / args.repeat
+        baseline = baseline or per_call
+        print(f"{label:>32}: {per_call * 1000:8.3f} ms  {size / 1024:8.1f} KiB  {baseline / per_call:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark the leaderboard PageRank engines on a synthetic citation graph.
+
+Run with ``python -m benchmarks.bench_pagerank --papers 100000 --edges 1000000``.
+The pure-Python reference engine is only timed when ``--python`` is given,
+since it takes minutes at that scale.
+"""
+
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from pipeline.leaderboard import (
+    CitationCounts,
+    InfluenceEdge,
+    LeaderboardPaper,
+    compute_impact_leaderboard,
+)
+
+
+def synthetic_graph(n_papers: int, n_edges: int, seed: int = 0) -> Tuple[List[LeaderboardPaper], List[InfluenceEdge]]:
+    rng = random.Random(seed)
+    papers = [
+        LeaderboardPaper(
+            paper_id=f"p{i}",
+            novelty_score=rng.random(),
+            evidence_score=rng.random(),
+            citations=CitationCounts(openalex=int(rng.paretovariate(1.2)) if rng.random() < 0.8 else None),
+        )
+        for i in range(n_papers)
+    ]
+    edges = []
+    for _ in range(n_edges):
+        # Cite older papers (lower index) preferentially, like a real corpus.
+        source = rng.randrange(1, n_papers)
+        target = int(source * rng.random() ** 2)
+        kind = "citation" if rng.random() < 0.8 else "llm_inferred"
+        edges.append(InfluenceEdge(f"p{source}", f"p{target}", kind, rng.random()))
+    return papers, edges
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--papers", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--python", action="store_true", help="Also time the pure-Python reference engine")
+    args = parser.parse_args()
+
+    papers, edges = synthetic_graph(args.papers, args.edges)
+    engines = ["numpy", "python"] if args.python else ["numpy"]
+    results = {}
+    for engine in engines:
+        start = time.perf_counter()
+        ranked = compute_impact_leaderboard(papers, edges, engine=engine)
+        elapsed = time.perf_counter() - start
+        results[engine] = {item["paper_id"]: item["pagerank_score"] for item in ranked}
+        print(f"{engine:>7}: {elapsed:8.2f}s for {args.papers} papers / {args.edges} edges")
+
+    if len(results) == 2:
+        diff = max(abs(results["numpy"][pid] - results["python"][pid]) for pid in results["numpy"])
+        print(f"max |numpy - python| pagerank_score: {diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Compare PDF text backends on throughput and claim agreement.
+
+Run with ``python -m benchmarks.bench_pdf_backends`` (synthetic corpus) or
+``--corpus DIR`` to use every ``*.pdf`` in a directory. Each installed PDF
+backend extracts every document; the report gives pages/sec, the number of
+claims found, and how well each backend's claims agree with the first
+backend's (Jaccard overlap of whitespace-normalized claim sentences).
+The ``text`` backend reads text dumps rather than PDFs and is not compared.
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Set
+
+from benchmarks.bench_pdf_pages import WORDS
+from pipeline.claim_extract import extract_claims
+from pipeline.text_extract import AUTO_PDF_BACKENDS, PDF_BACKENDS, extract_pdf_pages
+
+CLAIM_TEMPLATES = (
+    "We show that {a} {b} increases {c} activity (p < 0.01).",
+    "Here we report the first {a} map of {b} {c} circuits.",
+    "Our results demonstrate a novel {a} mechanism in {b} neurons.",
+    "We found that {a} decoding accuracy rose by 12% (Figure 3).",
+)
+
+
+def synthetic_corpus(directory: Path, n_docs: int, pages: int, seed: int = 0) -> List[Path]:
+    import fitz  # type: ignore
+
+    rng = random.Random(seed)
+    paths = []
+    for doc_index in range(n_docs):
+        doc = fitz.open()
+        for _ in range(pages):
+            sentences = []
+            for _ in range(40):
+                if rng.random() < 0.2:
+                    template = rng.choice(CLAIM_TEMPLATES)
+                    sentences.append(template.format(a=rng.choice(WORDS), b=rng.choice(WORDS), c=rng.choice(WORDS)))
+                else:
+                    sentences.append(" ".join(rng.choice(WORDS) for _ in range(12)).capitalize() + ".")
+            doc.new_page().insert_textbox(fitz.Rect(40, 40, 570, 800), " ".join(sentences), fontsize=8)
+        path = directory / f"paper{doc_index:02d}.pdf"
+        doc.save(str(path))
+        doc.close()
+        paths.append(path)
+    return paths
+
+
+def _claim_set(pages) -> Set[str]:
+    claims = set()
+    for page, text in pages:
+        for claim in extract_claims("pdf_page", text, page, "pdf"):
+            claims.add(" ".join(claim.text.split()))
+    return claims
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", type=Path, help="Directory of PDFs (default: generate a synthetic corpus)")
+    parser.add_argument("--docs", type=int, default=5)
+    parser.add_argument("--pages", type=int, default=10)
+    args = parser.parse_args()
+
+    backends = [name for name in AUTO_PDF_BACKENDS if PDF_BACKENDS[name].available()]
+    if not backends:
+        raise SystemExit("No PDF backend installed.")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.corpus:
+            paths = sorted(args.corpus.glob("*.pdf"))
+        else:
+            paths = synthetic_corpus(Path(temp_dir), args.docs, args.pages)
+
+        claims: Dict[str, List[Set[str]]] = {}
+        for backend in backends:
+            n_pages = 0
+            start = time.perf_counter()
+            per_doc = []
+            for path in paths:
+                pages = extract_pdf_pages(str(path), backend=backend)
+                n_pages += len(pages)
+                per_doc.append(pages)
+            elapsed = time.perf_counter() - start
+            claims[backend] = [_claim_set(pages) for pages in per_doc]
+            total = sum(len(found) for found in claims[backend])
+            print(f"{backend:>10}: {n_pages} pages in {elapsed:6.2f}s  {n_pages / elapsed:8.1f} pages/sec  {total} claims")
+
+    reference = backends[0]
+    for backend in backends[1:]:
+        overlaps = []
+        for ours, theirs in zip(claims[backend], claims[reference]):
+            union = ours | theirs
+            overlaps.append(len(ours & theirs) / len(union) if union else 1.0)
+        mean = sum(overlaps) / len(overlaps) if overlaps else 1.0
+        print(f"{backend} vs {reference}: mean claim Jaccard {mean:.3f} over {len(overlaps)} documents")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark parallel PDF page text extraction.
+
+Run with ``python -m benchmarks.bench_pdf_pages --pages 100``. A synthetic
+PDF of dense text pages is generated with pymupdf, then extracted with 1, 2,
+4 and 8 worker processes, reporting pages/sec. Scaling is bounded by the
+machine's core count, and each run pays process start-up, so parallelism
+only helps on long documents.
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from pipeline.text_extract import extract_pdf_pages
+
+WORDS = (
+    "neuron synapse cortex hippocampal dynamics we show novel increase significant "
+    "figure accuracy decoding model circuit memory encoding results analysis"
+).split()
+
+
+def synthetic_pdf(path: Path, n_pages: int, seed: int = 0) -> None:
+    try:
+        import fitz  # type: ignore
+    except ImportError as exc:
+        raise ImportError("This benchmark needs pymupdf to generate its PDF.") from exc
+
+    rng = random.Random(seed)
+    doc = fitz.open()
+    for _ in range(n_pages):
+        page = doc.new_page()
+        sentences = [" ".join(rng.choice(WORDS) for _ in range(14)).capitalize() + "." for _ in range(60)]
+        page.insert_textbox(fitz.Rect(40, 40, 570, 800), " ".join(sentences), fontsize=8)
+    doc.save(str(path))
+    doc.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_path = Path(temp_dir) / "synthetic.pdf"
+        synthetic_pdf(pdf_path, args.pages)
+
+        baseline = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            pages = extract_pdf_pages(str(pdf_path), workers=workers)
+            elapsed = time.perf_counter() - start
+            if baseline is None:
+                baseline = pages
+            elif pages != baseline:
+                raise SystemExit(f"workers={workers} produced different page text")
+            print(f"workers={workers}: {elapsed:7.2f}s  {len(pages) / elapsed:8.1f} pages/sec")
+
+
+if __name__ == "__main__":
+    main()
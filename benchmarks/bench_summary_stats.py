@@ -0,0 +1,121 @@
+"""Benchmark Allen cell summaries on synthetic specimen rows.
+
+Run with ``python -m benchmarks.bench_summary_stats --cells 50000``. The
+baseline is the dict-iterating analysis the summary replaces: one pass per
+label column for the counts, then per feature a pass collecting values by
+region and dendrite type and ``statistics`` per group. The vectorized
+``get_summary_stats`` is timed from rows (including the conversion to
+arrays) and from a table that is already columnar, and the results are
+compared with the baseline.
+"""
+
+import argparse
+import math
+import random
+import statistics
+import time
+from typing import Any, Dict, List
+
+from pipeline.datasets.allen_brain import SUMMARY_FEATURES, get_summary_stats
+from pipeline.datasets.tables import to_arrays
+
+REGIONS = ["Primary visual area", "Primary motor area", "Anterior cingulate area", "Middle temporal gyrus", None]
+DENDRITE_TYPES = ["spiny", "aspiny", "sparsely spiny", None]
+
+
+def synthetic_cells(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    cells = []
+    for i in range(n):
+        cell = {
+            "specimen__id": 300_000_000 + i,
+            "donor__species": rng.choice(["Mus musculus", "Homo Sapiens"]),
+            "structure__name": rng.choice(REGIONS),
+            "tag__dendrite_type": rng.choice(DENDRITE_TYPES),
+        }
+        for feature in SUMMARY_FEATURES:
+            cell[feature] = rng.gauss(50, 15) if rng.random() < 0.9 else None
+        cells.append(cell)
+    return cells
+
+
+def _describe(values: List[float]) -> Dict[str, Any]:
+    if not values:
+        return {"count": 0, "mean": None, "std": None, "min": None, "median": None, "max": None}
+    return {
+        "count": len(values),
+        "mean": statistics.fmean(values),
+        "std": statistics.pstdev(values),
+        "min": min(values),
+        "median": statistics.median(values),
+        "max": max(values),
+    }
+
+
+def loop_summary(cells: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def label(cell: Dict[str, Any], key: str) -> str:
+        return cell.get(key) or "unknown"
+
+    counts: Dict[str, Dict[str, int]] = {"species": {}, "brain_regions": {}, "dendrite_types": {}}
+    for name, key in (("species", "donor__species"), ("brain_regions", "structure__name"), ("dendrite_types", "tag__dendrite_type")):
+        for cell in cells:
+            value = label(cell, key)
+            counts[name][value] = counts[name].get(value, 0) + 1
+
+    features: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for feature in SUMMARY_FEATURES:
+        features[feature] = {}
+        for group, key in (("by_region", "structure__name"), ("by_dendrite_type", "tag__dendrite_type")):
+            values: Dict[str, List[float]] = {}
+            for cell in cells:
+                bucket = values.setdefault(label(cell, key), [])
+                if cell.get(feature) is not None:
+                    bucket.append(cell[feature])
+            features[feature][group] = {name: _describe(bucket) for name, bucket in values.items()}
+    return {"total_cells": len(cells), **counts, "features": features}
+
+
+def _agree(expected: Dict[str, Any], actual: Dict[str, Any]) -> bool:
+    for feature, groups in expected["features"].items():
+        for group, summaries in groups.items():
+            for name, summary in summaries.items():
+                other = actual["features"][feature][group][name]
+                for stat, value in summary.items():
+                    if value is None or other[stat] is None:
+                        if value != other[stat]:
+                            return False
+                    elif not math.isclose(value, other[stat], rel_tol=1e-9):
+                        return False
+    return all(expected[key] == actual[key] for key in ("total_cells", "species", "brain_regions", "dendrite_types"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cells", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cells = synthetic_cells(args.cells)
+    table = to_arrays(cells)
+    print(f"{len(cells)} cells, {len(SUMMARY_FEATURES)} features")
+
+    def best(run) -> float:
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    baseline = best(lambda: loop_summary(cells))
+    print(f"{'dict loops':>22}: {baseline:7.3f}s")
+    for label, source in (("vectorized, from rows", cells), ("vectorized, table", table)):
+        elapsed = best(lambda: get_summary_stats(source))
+        print(f"{label:>22}: {elapsed:7.3f}s  {baseline / elapsed:5.1f}x")
+
+    if not _agree(loop_summary(cells), get_summary_stats(table)):
+        raise SystemExit("vectorized summary disagrees with the dict loops")
+
+
+if __name__ == "__main__":
+    main()
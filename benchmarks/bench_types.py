@@ -0,0 +1,98 @@
+"""Benchmark memory and serialization of Claim/Evidence objects.
+
+Run with ``python -m benchmarks.bench_types --claims 100000``. The slotted
+types in ``pipeline.types`` are compared with the previous layout: plain
+dataclasses serialized through ``dataclasses.asdict``, reproduced here. Each
+synthetic claim has two cues, a five-entry score dict and three evidence
+sentences shared with the rest of its section, as ``extract_claims`` makes.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from pipeline.types import Claim, Evidence
+
+
+@dataclass
+class LegacyEvidence:
+    text: str
+    section: str
+    page: Optional[int]
+    source: str
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+@dataclass
+class LegacyClaim:
+    text: str
+    section: str
+    page: Optional[int]
+    source: str
+    cues: List[str] = field(default_factory=list)
+    evidence: List[LegacyEvidence] = field(default_factory=list)
+    scores: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["evidence"] = [e.to_dict() for e in self.evidence]
+        return data
+
+
+def build(n_claims: int, claim_cls: Callable, evidence_cls: Callable) -> List:
+    claims = []
+    evidence: List = []
+    for i in range(n_claims):
+        if i % 20 == 0:
+            page = i // 20
+            evidence = [
+                evidence_cls(text=f"Accuracy rose by {page}.{k}% (Figure {k}).", section="results", page=page, source="pdf")
+                for k in range(3)
+            ]
+        claims.append(
+            claim_cls(
+                text=f"We show a novel effect number {i} in hippocampal neurons.",
+                section="results",
+                page=i // 20,
+                source="pdf",
+                cues=["we show", "novel"],
+                evidence=list(evidence),
+                scores={"novelty": 0.8, "evidence": 0.0, "neuroscience": 1.0, "section_weight": 1.3, "total": 0.65},
+            )
+        )
+    return claims
+
+
+def measure(label: str, n_claims: int, claim_cls: Callable, evidence_cls: Callable) -> None:
+    gc.collect()
+    tracemalloc.start()
+    claims = build(n_claims, claim_cls, evidence_cls)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for claim in claims:
+        claim.to_dict()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:>8}: {size / n_claims:7.0f} B/claim ({size / 2**20:6.1f} MiB total), "
+        f"to_dict {n_claims / elapsed:10.0f} claims/sec"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--claims", type=int, default=100_000)
+    args = parser.parse_args()
+
+    measure("legacy", args.claims, LegacyClaim, LegacyEvidence)
+    measure("slotted", args.claims, Claim, Evidence)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,103 @@
 from __future__ import annotations
 
-import tempfile
-import uuid
+import os
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
-from urllib.parse import quote
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
-from fastapi import FastAPI, File, HTTPException, UploadFile
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
-import httpx
 
-from pipeline.extract import run_pipeline
+from pipeline.cache import ExtractionCache, default_cache
+from pipeline.citation_cache import CitationCache, default_citation_cache
+from pipeline.extract import ExtractionEvent, collect_result, stream_pipeline
+from pipeline.jsonio import dumps, dumps_line
 from pipeline.leaderboard import (
     CitationCounts,
     InfluenceEdge,
     LeaderboardPaper,
     compute_impact_leaderboard,
 )
+from pipeline.openalex import OPENALEX_BASE_URL, OpenAlexClient
+from pipeline.text_extract import PdfDocument, resolve_pdf_backend
+from pipeline.types import ExtractionResult
+from pipeline.workpool import PoolFullError, WorkerLostError, WorkPool
 
 MAX_PAGES = 100
+TOP_KEY_IDEAS = 5
+TOP_BREAKTHROUGHS = 3
+
+# Extraction runs in a bounded pool so CPU-bound parsing never blocks the event
+# loop; requests beyond workers + queue depth, or whose worker process
+# crashed, are rejected with 503.
+EXTRACT_POOL_KIND = os.environ.get("AGENTSCIENCE_EXTRACT_POOL", "thread")
+EXTRACT_WORKERS = int(os.environ.get("AGENTSCIENCE_EXTRACT_WORKERS", "2"))
+EXTRACT_QUEUE_DEPTH = int(os.environ.get("AGENTSCIENCE_EXTRACT_QUEUE_DEPTH", "8"))
+EXTRACT_RETRY_AFTER_SECONDS = 5
+# Processes per extraction for PDF page text; only pays off on long PDFs.
+PDF_WORKERS = int(os.environ.get("AGENTSCIENCE_PDF_WORKERS", "1"))
+PDF_BACKEND = os.environ.get("AGENTSCIENCE_PDF_BACKEND", "auto")
+
+OPENALEX_URL = os.environ.get("AGENTSCIENCE_OPENALEX_URL", OPENALEX_BASE_URL)
+OPENALEX_CONCURRENCY = int(os.environ.get("AGENTSCIENCE_OPENALEX_CONCURRENCY", "8"))
+OPENALEX_DEADLINE_SECONDS = float(os.environ.get("AGENTSCIENCE_OPENALEX_DEADLINE", "10"))
+_openalex_client: Optional[OpenAlexClient] = None
+
+
+# Caches are opened on first use, not at import, so importing the app never
+# touches the disk. Each pool process opens its own.
+@lru_cache(maxsize=1)
+def _extraction_cache() -> Optional[ExtractionCache]:
+    return default_cache()
+
+
+@lru_cache(maxsize=1)
+def _citation_cache() -> Optional[CitationCache]:
+    return default_citation_cache()
+
+
+def _openalex() -> OpenAlexClient:
+    global _openalex_client
+    if _openalex_client is None:
+        _openalex_client = OpenAlexClient(
+            OPENALEX_URL,
+            max_concurrency=OPENALEX_CONCURRENCY,
+            deadline=OPENALEX_DEADLINE_SECONDS,
+            cache=_citation_cache(),
+        )
+    return _openalex_client
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI):
+    global _openalex_client
+    yield
+    EXTRACT_POOL.shutdown()
+    if _openalex_client is not None:
+        await _openalex_client.aclose()
+        _openalex_client = None
 
-app = FastAPI(title="AgentScience Extraction API", version="0.1.0")
+
+app = FastAPI(title="AgentScience Extraction API", version="0.1.0", lifespan=_lifespan)
 UI_PATH = Path(__file__).with_name("ui.html")
+EXTRACT_POOL = WorkPool(EXTRACT_POOL_KIND, workers=EXTRACT_WORKERS, queue_depth=EXTRACT_QUEUE_DEPTH)
+
+
+class PageLimitError(ValueError):
+    pass
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with ``pipeline.jsonio`` (orjson when installed).
+
+    Endpoints return it directly, so FastAPI skips ``jsonable_encoder`` on
+    payloads that are already plain dicts and lists.
+    """
+
+    def render(self, content) -> bytes:
+        return dumps(content)
 
 
 class CitationCountsPayload(BaseModel):
@@ -55,120 +130,143 @@ class LeaderboardRequest(BaseModel):
     impact_weights: Optional[Dict[str, float]] = None
     damping: float = 0.85
     iterations: int = 80
+    engine: str = "auto"
+    top_k: Optional[int] = None
+    offset: int = 0
+    limit: Optional[int] = None
+    fields: Optional[List[str]] = None
 
 
-def _pdf_page_count(pdf_bytes: bytes) -> int:
-    try:
-        import fitz  # type: ignore
+async def _read_uploads(pdf: UploadFile, tex: Optional[UploadFile]) -> Tuple[bytes, Optional[bytes]]:
+    if pdf.content_type not in ("application/pdf", "application/x-pdf"):
+        raise HTTPException(status_code=400, detail="`pdf` must be a PDF file.")
 
-        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
-            return doc.page_count
-    except ImportError as exc:
-        raise HTTPException(
-            status_code=500,
-            detail="PDF page counting requires pymupdf to be installed.",
-        ) from exc
+    pdf_bytes = await pdf.read()
+    if not pdf_bytes:
+        raise HTTPException(status_code=400, detail="`pdf` is empty.")
 
+    tex_bytes = await tex.read() if tex else None
+    return pdf_bytes, tex_bytes
 
-def _openalex_citation_count(doi: Optional[str], title: Optional[str]) -> Optional[int]:
-    headers = {"User-Agent": "AgentScience/0.1"}
-    timeout = httpx.Timeout(5.0)
-    try:
-        with httpx.Client(timeout=timeout) as client:
-            if doi:
-                doi_url = f"https://api.openalex.org/works/https://doi.org/{quote(doi)}"
-                res = client.get(doi_url, headers=headers)
-                if res.status_code == 200:
-                    data = res.json()
-                    cited_by = data.get("cited_by_count")
-                    if isinstance(cited_by, int):
-                        return cited_by
-
-            if title:
-                res = client.get(
-                    "https://api.openalex.org/works",
-                    params={"search": title, "per-page": 1},
-                    headers=headers,
-                )
-                if res.status_code == 200:
-                    data = res.json()
-                    results = data.get("results") or []
-                    if results:
-                        cited_by = results[0].get("cited_by_count")
-                        if isinstance(cited_by, int):
-                            return cited_by
-    except Exception:
-        return None
-    return None
-
-
-def _openalex_citations_for_idea(idea_text: str) -> Optional[int]:
-    if not idea_text:
-        return None
-    query = " ".join(idea_text.split())
-    if len(query) > 280:
-        query = query[:280]
-    headers = {"User-Agent": "AgentScience/0.1"}
-    timeout = httpx.Timeout(5.0)
+
+def _unavailable_error(exc: Exception) -> HTTPException:
+    if isinstance(exc, WorkerLostError):
+        detail = "Extraction worker crashed; retry later."
+    else:
+        detail = "Extraction queue is full; retry later."
+    return HTTPException(status_code=503, detail=detail, headers={"Retry-After": str(EXTRACT_RETRY_AFTER_SECONDS)})
+
+
+def _pdf_backend(requested: Optional[str]) -> str:
     try:
-        with httpx.Client(timeout=timeout) as client:
-            res = client.get(
-                "https://api.openalex.org/works",
-                params={"search": query, "per-page": 1},
-                headers=headers,
-            )
-            if res.status_code == 200:
-                data = res.json()
-                results = data.get("results") or []
-                if results:
-                    cited_by = results[0].get("cited_by_count")
-                    if isinstance(cited_by, int):
-                        return cited_by
-    except Exception:
-        return None
-    return None
+        backend = resolve_pdf_backend(requested or PDF_BACKEND)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except ImportError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    if backend == "text":
+        raise HTTPException(status_code=400, detail="The `text` backend reads plain text; uploads must be PDFs.")
+    return backend
 
 
 @app.post("/extract")
-async def extract(pdf: UploadFile = File(...), tex: Optional[UploadFile] = File(default=None)):
-    if pdf.content_type not in ("application/pdf", "application/x-pdf"):
-        raise HTTPException(status_code=400, detail="`pdf` must be a PDF file.")
+async def extract(
+    pdf: UploadFile = File(...),
+    tex: Optional[UploadFile] = File(default=None),
+    backend: Optional[str] = Form(default=None),
+):
+    pdf_bytes, tex_bytes = await _read_uploads(pdf, tex)
+    pdf_backend = _pdf_backend(backend)
 
-    pdf_bytes = await pdf.read()
-    if not pdf_bytes:
-        raise HTTPException(status_code=400, detail="`pdf` is empty.")
+    try:
+        result = await EXTRACT_POOL.run(_run_extraction, pdf_bytes, tex_bytes, pdf_backend)
+    except (PoolFullError, WorkerLostError) as exc:
+        raise _unavailable_error(exc) from exc
+    except PageLimitError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return FastJSONResponse(await _openalex().enrich(result.to_dict()))
 
-    if _pdf_page_count(pdf_bytes) > MAX_PAGES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"PDF exceeds max page count of {MAX_PAGES}.",
+
+@app.post("/extract/stream")
+async def extract_stream(
+    pdf: UploadFile = File(...),
+    tex: Optional[UploadFile] = File(default=None),
+    backend: Optional[str] = Form(default=None),
+):
+    """NDJSON variant of ``/extract``.
+
+    One ``{"event": "claims", ...}`` line is sent per page (or TeX section) as
+    soon as it is parsed, followed by ``{"event": "result", "result": ...}``
+    with the same payload ``/extract`` returns. Failures after the stream has
+    started are reported as a final ``{"event": "error", "detail": ...}`` line.
+    """
+    pdf_bytes, tex_bytes = await _read_uploads(pdf, tex)
+    pdf_backend = _pdf_backend(backend)
+
+    events = EXTRACT_POOL.stream(_stream_extraction, pdf_bytes, tex_bytes, pdf_backend)
+    # Pull the first event before responding so admission and page-limit
+    # errors still map to proper status codes.
+    try:
+        first = await events.__anext__()
+    except (PoolFullError, WorkerLostError) as exc:
+        raise _unavailable_error(exc) from exc
+    except PageLimitError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return StreamingResponse(_ndjson_events(first, events), media_type="application/x-ndjson")
+
+
+async def _ndjson_events(first: ExtractionEvent, events: AsyncIterator[ExtractionEvent]) -> AsyncIterator[bytes]:
+    try:
+        yield await _event_line(first)
+        async for event in events:
+            yield await _event_line(event)
+    except Exception as exc:
+        yield dumps_line({"event": "error", "detail": f"{type(exc).__name__}: {exc}"})
+    finally:
+        await events.aclose()
+
+
+async def _event_line(event: ExtractionEvent) -> bytes:
+    if isinstance(event, ExtractionResult):
+        data = {"event": "result", "result": await _openalex().enrich(event.to_dict())}
+    else:
+        data = {"event": "claims", **event.to_dict()}
+    return dumps_line(data)
+
+
+def _run_extraction(pdf_bytes: bytes, tex_bytes: Optional[bytes], pdf_backend: str) -> ExtractionResult:
+    return collect_result(_stream_extraction(pdf_bytes, tex_bytes, pdf_backend))
+
+
+def _stream_extraction(pdf_bytes: bytes, tex_bytes: Optional[bytes], pdf_backend: str) -> Iterator[ExtractionEvent]:
+    # Runs inside EXTRACT_POOL, possibly in another process: keep it a plain
+    # module-level function and signal errors with picklable exceptions.
+
+    # Parse the upload once, straight from memory: the page-count check and
+    # the extraction share this handle, and nothing is written to disk. The
+    # cache is looked up (once) by stream_pipeline before any page is read.
+    with PdfDocument(pdf_bytes, pdf_backend) as document:
+        if document.page_count > MAX_PAGES:
+            raise PageLimitError(f"PDF exceeds max page count of {MAX_PAGES}.")
+
+        yield from stream_pipeline(
+            pdf=document,
+            tex=tex_bytes or None,
+            top_key_ideas=TOP_KEY_IDEAS,
+            top_breakthroughs=TOP_BREAKTHROUGHS,
+            cache=_extraction_cache(),
+            pdf_workers=PDF_WORKERS,
         )
 
-    tex_bytes = await tex.read() if tex else None
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        pdf_path = temp_path / f"{uuid.uuid4()}.pdf"
-        pdf_path.write_bytes(pdf_bytes)
-
-        tex_path: Optional[Path] = None
-        if tex_bytes:
-            tex_path = temp_path / f"{uuid.uuid4()}.tex"
-            tex_path.write_bytes(tex_bytes)
-
-        result = run_pipeline(pdf_path=pdf_path, tex_path=tex_path, top_key_ideas=5, top_breakthroughs=3)
-        payload = result.to_dict()
-        metadata = payload.get("metadata") or {}
-        openalex_count = _openalex_citation_count(metadata.get("doi"), metadata.get("title"))
-        payload["citations"] = {"openalex": openalex_count}
-        for idea in payload.get("key_ideas", []) or []:
-            text = idea.get("text") if isinstance(idea, dict) else None
-            if not text:
-                continue
-            citations = _openalex_citations_for_idea(text)
-            scores = idea.setdefault("scores", {})
-            scores["openalex_citations"] = citations if citations is not None else 0
-        return payload
+@app.get("/openalex/cache-stats")
+async def openalex_cache_stats():
+    cache = _citation_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
 
 
 @app.post("/leaderboard")
@@ -207,11 +305,17 @@ async def leaderboard(payload: LeaderboardRequest):
             impact_weights=payload.impact_weights,
             damping=payload.damping,
             iterations=payload.iterations,
+            engine=payload.engine,
+            top_k=payload.top_k,
+            offset=payload.offset,
+            limit=payload.limit,
+            fields=payload.fields,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    return {"count": len(ranked), "items": ranked}
+    count = len(papers) if payload.top_k is None else min(payload.top_k, len(papers))
+    return FastJSONResponse({"count": count, "offset": payload.offset, "items": ranked})
 
 
 @app.get("/", response_class=HTMLResponse)
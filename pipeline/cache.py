@@ -0,0 +1,150 @@
+"""On-disk SQLite cache for extraction results, and the helpers shared by every cache.
+
+Each subsystem keeps its own SQLite file under ``~/.cache/agentscience``
+(see ``cache_path``): ``extractions.sqlite3`` here, ``openalex.sqlite3``
+for citation lookups (``pipeline.citation_cache``) and ``datasets.sqlite3``
+for dataset responses (``pipeline.datasets.cache``).
+
+Extraction entries are keyed by the SHA-256 of the PDF/TeX bytes plus a
+fingerprint of ``pipeline/config.py``, stored zlib-compressed, and evicted
+least-recently-used first once the cache grows past ``max_bytes``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import uuid
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from pipeline import config
+from pipeline.types import ExtractionResult
+
+
+# Bump when extraction logic changes in a way config.py does not capture.
+CACHE_VERSION = 2
+
+CACHE_DIR = Path.home() / ".cache" / "agentscience"
+
+
+def cache_path(name: str) -> Path:
+    """Default file of the ``name`` cache; every subsystem gets its own."""
+    return CACHE_DIR / f"{name}.sqlite3"
+
+
+DEFAULT_CACHE_PATH = cache_path("extractions")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_PAPER_ID_NAMESPACE = uuid.UUID("6f1c2a4e-8d3b-5e7f-9a0b-1c2d3e4f5a6b")
+
+
+@lru_cache(maxsize=1)
+def config_fingerprint() -> str:
+    digest = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+    digest.update(Path(config.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def content_hash(pdf_bytes: Optional[bytes], tex_bytes: Optional[bytes]) -> str:
+    digest = hashlib.sha256()
+    for part in (pdf_bytes, tex_bytes):
+        digest.update(hashlib.sha256(part).digest() if part is not None else b"\0" * 32)
+    return digest.hexdigest()
+
+
+def paper_id_for(digest: str) -> str:
+    """Deterministic paper ID for a given input content hash."""
+    return str(uuid.uuid5(_PAPER_ID_NAMESPACE, digest))
+
+
+class SQLiteCache:
+    """A cache in one SQLite file, created (with its directory) on first use."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per call keeps the cache safe to share
+        # across threads and picklable into worker processes.
+        return sqlite3.connect(self.path, timeout=30.0)
+
+
+class ExtractionCache(SQLiteCache):
+    def __init__(self, path: Path | str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        super().__init__(path)
+        self.max_bytes = max_bytes
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, payload BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    @staticmethod
+    def key(digest: str, top_key_ideas: int, top_breakthroughs: int, pdf_backend: str = "") -> str:
+        # Backends extract slightly different text, so results are cached per backend.
+        return f"{digest}:{config_fingerprint()}:{top_key_ideas}:{top_breakthroughs}:{pdf_backend}"
+
+    def get(self, key: str) -> Optional[ExtractionResult]:
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute("SELECT payload FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        finally:
+            conn.close()
+        return ExtractionResult.from_dict(json.loads(zlib.decompress(row[0])))
+
+    def put(self, key: str, result: ExtractionResult) -> None:
+        payload = zlib.compress(json.dumps(result.to_compact_dict()).encode("utf-8"))
+        if len(payload) > self.max_bytes:
+            return
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, payload, size, accessed) VALUES (?, ?, ?, ?)",
+                    (key, payload, len(payload), time.time()),
+                )
+                self._evict(conn)
+        finally:
+            conn.close()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        doomed = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed ASC"):
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+
+    def clear(self) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM entries")
+        finally:
+            conn.close()
+
+
+def default_cache() -> Optional[ExtractionCache]:
+    """Cache configured by ``AGENTSCIENCE_CACHE_PATH`` (empty string disables it)."""
+    path = os.environ.get("AGENTSCIENCE_CACHE_PATH", str(DEFAULT_CACHE_PATH))
+    if not path:
+        return None
+    max_mb = os.environ.get("AGENTSCIENCE_CACHE_MAX_MB")
+    max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+    return ExtractionCache(path, max_bytes=max_bytes)
@@ -0,0 +1,121 @@
+"""On-disk TTL cache of OpenAlex citation lookups for ``pipeline.openalex``."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from pipeline.cache import SQLiteCache, cache_path
+
+DEFAULT_CITATION_CACHE_PATH = cache_path("openalex")
+DEFAULT_CITATION_TTL = 7 * 24 * 3600.0
+DEFAULT_CITATION_NEGATIVE_TTL = 24 * 3600.0
+DEFAULT_CITATION_MAX_ENTRIES = 100_000
+
+
+class CitationCache(SQLiteCache):
+    """TTL cache of ``lookup key -> cited_by_count`` with negative caching.
+
+    ``None`` values record lookups that found nothing and expire after
+    ``negative_ttl``. Hit/miss counters are kept per process in ``stats()``.
+    """
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_CITATION_CACHE_PATH,
+        ttl: float = DEFAULT_CITATION_TTL,
+        negative_ttl: float = DEFAULT_CITATION_NEGATIVE_TTL,
+        max_entries: int = DEFAULT_CITATION_MAX_ENTRIES,
+    ) -> None:
+        super().__init__(path)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS lookups ("
+                "key TEXT PRIMARY KEY, cited_by INTEGER, fetched REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS lookups_accessed ON lookups (accessed)")
+
+    def get(self, key: str) -> Tuple[bool, Optional[int]]:
+        """Return ``(found, cited_by)``; ``found`` is False on a miss or expiry."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute("SELECT cited_by, fetched FROM lookups WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    cited_by, fetched = row
+                    ttl = self.ttl if cited_by is not None else self.negative_ttl
+                    if now - fetched > ttl:
+                        conn.execute("DELETE FROM lookups WHERE key = ?", (key,))
+                        self.expired += 1
+                        row = None
+                    else:
+                        conn.execute("UPDATE lookups SET accessed = ? WHERE key = ?", (now, key))
+        finally:
+            conn.close()
+
+        if row is None:
+            self.misses += 1
+            return False, None
+        if row[0] is None:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+        return True, row[0]
+
+    def put(self, key: str, cited_by: Optional[int]) -> None:
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO lookups (key, cited_by, fetched, accessed) VALUES (?, ?, ?, ?)",
+                    (key, cited_by, now, now),
+                )
+                overflow = conn.execute("SELECT COUNT(*) FROM lookups").fetchone()[0] - self.max_entries
+                if overflow > 0:
+                    conn.execute(
+                        "DELETE FROM lookups WHERE key IN (SELECT key FROM lookups ORDER BY accessed ASC LIMIT ?)",
+                        (overflow,),
+                    )
+                    self.evictions += overflow
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        conn = self._connect()
+        try:
+            entries = conn.execute("SELECT COUNT(*) FROM lookups").fetchone()[0]
+        finally:
+            conn.close()
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evictions": self.evictions,
+        }
+
+
+def default_citation_cache() -> Optional[CitationCache]:
+    """Cache configured by ``AGENTSCIENCE_OPENALEX_CACHE_*`` (empty path disables it)."""
+    path = os.environ.get("AGENTSCIENCE_OPENALEX_CACHE_PATH", str(DEFAULT_CITATION_CACHE_PATH))
+    if not path:
+        return None
+    return CitationCache(
+        path,
+        ttl=float(os.environ.get("AGENTSCIENCE_OPENALEX_CACHE_TTL", DEFAULT_CITATION_TTL)),
+        negative_ttl=float(os.environ.get("AGENTSCIENCE_OPENALEX_CACHE_NEGATIVE_TTL", DEFAULT_CITATION_NEGATIVE_TTL)),
+        max_entries=int(os.environ.get("AGENTSCIENCE_OPENALEX_CACHE_MAX_ENTRIES", DEFAULT_CITATION_MAX_ENTRIES)),
+    )
@@ -1,17 +1,15 @@
 import re
-from typing import List
-
-from pipeline.config import (
-    BREAKTHROUGH_CUES,
-    CUE_PHRASES,
-    EVIDENCE_PATTERNS,
-    NEUROSCIENCE_KEYWORDS,
-    SECTION_WEIGHTS,
-)
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+from pipeline.config import EVIDENCE_PATTERNS, SECTION_WEIGHTS
+from pipeline.matching import match_phrases
 from pipeline.types import Claim, Evidence
 
 
 _SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_NOVELTY_CUES = ("novel", "first", "previously unknown")
 
 
 def split_sentences(text: str) -> List[str]:
@@ -19,20 +17,59 @@ def split_sentences(text: str) -> List[str]:
     return [s.strip() for s in raw if len(s.strip()) > 0]
 
 
-def extract_claims(section_name: str, text: str, page: int | None, source: str) -> List[Claim]:
-    sentences = split_sentences(text)
+def _sentence_starts(text: str) -> List[Tuple[str, int]]:
+    """``split_sentences`` plus the offset where each sentence starts in ``text``."""
+    flat = text.replace("\n", " ")
+    spans: List[Tuple[str, int]] = []
+    start = 0
+    for match in _SENTENCE_SPLIT_RE.finditer(flat):
+        _append_span(spans, flat, start, match.start())
+        start = match.end()
+    _append_span(spans, flat, start, len(flat))
+    return spans
+
+
+def _append_span(spans: List[Tuple[str, int]], text: str, start: int, end: int) -> None:
+    piece = text[start:end]
+    stripped = piece.strip()
+    if stripped:
+        spans.append((stripped, start + len(piece) - len(piece.lstrip())))
+
+
+def extract_claims(
+    section_name: str,
+    text: str,
+    page: int | None,
+    source: str,
+    page_breaks: Sequence[Tuple[int, int]] = (),
+) -> List[Claim]:
+    if page_breaks:
+        # Multi-page section: give each sentence the page it starts on.
+        spans = _sentence_starts(text)
+        sentences = [sentence for sentence, _ in spans]
+        offsets = [offset for offset, _ in page_breaks]
+        pages = [
+            page_breaks[idx - 1][1] if (idx := bisect_right(offsets, start)) else page
+            for _, start in spans
+        ]
+    else:
+        sentences = split_sentences(text)
+        pages = [page] * len(sentences)
+    index = _build_evidence_index(sentences, section_name, pages, source)
     claims: List[Claim] = []
-    for sentence in sentences:
-        cues = _find_cues(sentence)
+    for position, sentence in enumerate(sentences):
+        hits = match_phrases(sentence)
+        cues = list(hits.cues)
         if not cues:
             continue
-        evidence = _link_evidence(sentence, sentences, section_name, page, source)
-        scores = _score_claim(sentence, cues, section_name)
+        has_evidence = index.flags[position]
+        evidence = _link_evidence(sentence, has_evidence, index)
+        scores = _score_claim(sentence, cues, section_name, has_evidence, bool(hits.neuroscience))
         claims.append(
             Claim(
                 text=sentence,
                 section=section_name,
-                page=page,
+                page=pages[position],
                 source=source,
                 cues=cues,
                 evidence=evidence,
@@ -43,30 +80,32 @@ def extract_claims(section_name: str, text: str, page: int | None, source: str)
 
 
 def classify_breakthrough(claim: Claim) -> bool:
-    text = claim.text.lower()
-    for cue in BREAKTHROUGH_CUES:
-        if cue in text:
-            return True
+    if match_phrases(claim.text).breakthrough:
+        return True
     return claim.scores.get("novelty", 0.0) >= 0.6 and claim.scores.get("evidence", 0.0) >= 0.4
 
 
-def _find_cues(sentence: str) -> List[str]:
-    lower = sentence.lower()
-    return [cue for cue in CUE_PHRASES if cue in lower]
-
-
-def _score_claim(sentence: str, cues: List[str], section_name: str) -> dict:
-    lower = sentence.lower()
-    evidence = 1.0 if _has_evidence(sentence) else 0.0
+def _score_claim(
+    sentence: str,
+    cues: List[str],
+    section_name: str,
+    has_evidence: bool | None = None,
+    has_neuroscience: bool | None = None,
+) -> dict:
+    if has_evidence is None:
+        has_evidence = _has_evidence(sentence)
+    if has_neuroscience is None:
+        has_neuroscience = bool(match_phrases(sentence).neuroscience)
+    evidence = 1.0 if has_evidence else 0.0
     novelty = 0.0
-    if any(cue in lower for cue in ("novel", "first", "previously unknown")):
+    if any(cue in cues for cue in _NOVELTY_CUES):
         novelty = 0.8
     elif len(cues) >= 2:
         novelty = 0.6
     elif len(cues) == 1:
         novelty = 0.4
 
-    neuroscience = 1.0 if any(k in lower for k in NEUROSCIENCE_KEYWORDS) else 0.3
+    neuroscience = 1.0 if has_neuroscience else 0.3
     section_weight = SECTION_WEIGHTS.get(section_name, SECTION_WEIGHTS["other"])
 
     total = min(1.0, (0.4 * novelty + 0.3 * evidence + 0.2 * neuroscience + 0.1 * section_weight))
@@ -86,11 +125,32 @@ def _has_evidence(sentence: str) -> bool:
     return any(pattern.search(sentence) for pattern in EVIDENCE_PATTERNS)
 
 
-def _link_evidence(claim_sentence: str, sentences: List[str], section: str, page: int | None, source: str) -> List[Evidence]:
-    evidence: List[Evidence] = []
-    for sentence in sentences:
-        if sentence == claim_sentence:
-            continue
-        if _has_evidence(sentence):
-            evidence.append(Evidence(text=sentence, section=section, page=page, source=source))
-    return evidence
+@dataclass
+class _EvidenceIndex:
+    """Evidence status of every sentence in a section, computed once."""
+
+    flags: List[bool]
+    evidence: List[Evidence]
+
+
+def _build_evidence_index(
+    sentences: List[str],
+    section: str,
+    pages: Sequence[int | None],
+    source: str,
+) -> _EvidenceIndex:
+    flags = [_has_evidence(sentence) for sentence in sentences]
+    evidence = [
+        Evidence(text=sentence, section=section, page=page, source=source)
+        for sentence, flag, page in zip(sentences, flags, pages)
+        if flag
+    ]
+    return _EvidenceIndex(flags, evidence)
+
+
+def _link_evidence(claim_sentence: str, claim_has_evidence: bool, index: _EvidenceIndex) -> List[Evidence]:
+    # A claim never cites itself; when it carries no evidence markers it cannot
+    # appear in the index, so the whole section's evidence applies unchanged.
+    if not claim_has_evidence:
+        return list(index.evidence)
+    return [item for item in index.evidence if item.text != claim_sentence]
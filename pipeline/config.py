@@ -1,13 +1,16 @@
 import re
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     name: str
     text: str
     page: Optional[int] = None
+    # For sections spanning several PDF pages: ``(char_offset, page)`` where
+    # each later page starts in ``text``.
+    page_breaks: List[Tuple[int, int]] = field(default_factory=list)
 
 
 SECTION_ALIASES: Dict[str, str] = {
@@ -67,6 +70,11 @@ BREAKTHROUGH_CUES: List[str] = [
     "large-scale",
 ]
 
+# Cue and breakthrough phrases must match whole words (so "new" does not fire
+# inside "renewal"); neuroscience keywords only need to start a word so that
+# plurals like "synapses" still count. Set to False for raw substring matching.
+CUE_WORD_BOUNDARIES: bool = True
+
 EVIDENCE_PATTERNS: List[re.Pattern] = [
     re.compile(r"p\s*<\s*0\.\d+"),
     re.compile(r"p\s*=\s*0\.\d+"),
@@ -3,18 +3,155 @@
 No authentication required. Uses the Allen Brain Map REST API directly
 so agents don't need to install the full AllenSDK.
 
+Requests share the pooled, retrying session in ``pipeline.datasets.session``.
+Every function has an ``async_`` counterpart for fetching many specimens
+concurrently, e.g. ``await asyncio.gather(*(async_get_cell(i) for i in ids))``.
+The ``list_*``/``get_*_features``/``search_cells`` functions return one page;
+their ``iter_*`` counterparts walk the whole result set lazily (see
+``pipeline.datasets.paging``). Feature loaders can return column-oriented
+tables, and ``get_feature_table`` joins cells with their ephys and
+morphology features on specimen ID (see ``pipeline.datasets.tables``).
+
 API docs: https://alleninstitute.github.io/AllenSDK/cell_types.html
 REST base: http://api.brain-map.org/api/v2
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence, Union
 
-import httpx
+from pipeline.datasets.paging import Page, aiter_pages, iter_pages
+from pipeline.datasets.session import get_async_session, get_session
+from pipeline.datasets.tables import (
+    TABLE_FORMATS,
+    Table,
+    as_table,
+    convert,
+    crosstab,
+    describe_by,
+    factorize,
+    group_counts,
+    join_on,
+    label_column,
+    table_length,
+    to_arrays,
+)
 
 BASE_URL = "http://api.brain-map.org/api/v2"
-TIMEOUT = httpx.Timeout(15.0)
+# Specimen IDs per RMA `$in` query in get_cells, and chunks fetched at once.
+CELL_CHUNK_SIZE = 100
+CELL_CHUNK_CONCURRENCY = 8
+# RMA serves at most 2000 rows per query.
+ROWS_PER_PAGE = 2000
+CELL_CRITERIA = "model::ApiCellTypesSpecimenDetail"
+EPHYS_CRITERIA = "model::EphysFeature"
+MORPHOLOGY_CRITERIA = "model::NeuronReconstruction"
+# Cell columns whose distributions get_summary_stats reports by default:
+# rheobase, membrane time constant, input resistance, resting potential.
+SUMMARY_FEATURES = ("ef__threshold_i_long_square", "ef__tau", "ef__ri", "ef__vrest")
+
+
+def _query_url() -> str:
+    return f"{BASE_URL}/data/query.json"
+
+
+def _query(criteria: str, num_rows: int) -> List[Dict[str, Any]]:
+    data = get_session().get_json(_query_url(), params={"criteria": criteria, "num_rows": num_rows})
+    return data.get("msg", [])
+
+
+async def _async_query(criteria: str, num_rows: int) -> List[Dict[str, Any]]:
+    data = await get_async_session().get_json(_query_url(), params={"criteria": criteria, "num_rows": num_rows})
+    return data.get("msg", [])
+
+
+def _page_params(criteria: str, start_row: int, num_rows: int) -> Dict[str, Any]:
+    # RMA has no default row order, so without one pages can overlap or skip
+    # rows. Cell details are keyed by specimen, the feature models by id.
+    key = "specimen__id" if criteria.startswith(CELL_CRITERIA) else "id"
+    ordered = f"{criteria},rma::options[order$eq'{key}']"
+    return {"criteria": ordered, "start_row": start_row, "num_rows": num_rows}
+
+
+def _rma_page(data: Dict[str, Any], start_row: int, num_rows: int) -> Page:
+    rows = data.get("msg", [])
+    next_row = start_row + len(rows)
+    total = data.get("total_rows")
+    if len(rows) < num_rows or (isinstance(total, int) and next_row >= total):
+        return rows, None
+    return rows, next_row
+
+
+def _iter_query(criteria: str, page_size: int, limit: Optional[int]) -> Iterator[Dict[str, Any]]:
+    num_rows = page_size if limit is None else max(1, min(page_size, limit))
+
+    def fetch(start_row: int) -> Page:
+        data = get_session().get_json(_query_url(), params=_page_params(criteria, start_row, num_rows))
+        return _rma_page(data, start_row, num_rows)
+
+    return iter_pages(fetch, 0, limit)
+
+
+def _async_iter_query(criteria: str, page_size: int, limit: Optional[int]) -> AsyncIterator[Dict[str, Any]]:
+    num_rows = page_size if limit is None else max(1, min(page_size, limit))
+
+    async def fetch(start_row: int) -> Page:
+        data = await get_async_session().get_json(_query_url(), params=_page_params(criteria, start_row, num_rows))
+        return _rma_page(data, start_row, num_rows)
+
+    return aiter_pages(fetch, 0, limit)
+
+
+def _cell_criteria(specimen_id: int) -> str:
+    return f"{CELL_CRITERIA},rma::criteria,[specimen__id$eq{specimen_id}]"
+
+
+def _first_cell(rows: List[Dict[str, Any]], specimen_id: int) -> Dict[str, Any]:
+    if not rows:
+        raise ValueError(f"No cell found with specimen_id={specimen_id}")
+    return rows[0]
+
+
+def _chunk_criteria(specimen_ids: List[int]) -> str:
+    return f"{CELL_CRITERIA},rma::criteria,[specimen__id$in{','.join(map(str, specimen_ids))}]"
+
+
+def _feature_criteria(model: str, specimen_ids: List[int]) -> str:
+    return f"{model},rma::criteria,[specimen_id$in{','.join(map(str, specimen_ids))}]"
+
+
+def _chunks(specimen_ids: Iterable[int], chunk_size: int) -> List[List[int]]:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    unique = list(dict.fromkeys(int(specimen_id) for specimen_id in specimen_ids))
+    return [unique[start:start + chunk_size] for start in range(0, len(unique), chunk_size)]
+
+
+def _collect_cells(chunks: List[List[int]], results: List[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    found: Dict[int, Dict[str, Any]] = {}
+    for rows in results:
+        for row in rows:
+            found[row.get("specimen__id")] = row
+    requested = [specimen_id for chunk in chunks for specimen_id in chunk]
+    return {
+        "cells": {specimen_id: found[specimen_id] for specimen_id in requested if specimen_id in found},
+        "missing": [specimen_id for specimen_id in requested if specimen_id not in found],
+    }
+
+
+def _search_criteria(species: Optional[str], brain_region: Optional[str]) -> str:
+    filters = []
+    if species:
+        filters.append(f"[donor__species$eq'{species}']")
+    if brain_region:
+        filters.append(f"[structure__acronym$eq'{brain_region}']")
+
+    criteria = CELL_CRITERIA
+    if filters:
+        criteria += ",rma::criteria," + ",".join(filters)
+    return criteria
 
 
 def list_cells(num_rows: int = 25) -> List[Dict[str, Any]]:
@@ -23,65 +160,197 @@ def list_cells(num_rows: int = 25) -> List[Dict[str, Any]]:
     Returns a list of dicts with keys like specimen__id, donor__species,
     structure__name, line_name, etc.
     """
-    url = f"{BASE_URL}/data/query.json"
-    params = {
-        "criteria": "model::ApiCellTypesSpecimenDetail",
-        "num_rows": num_rows,
-    }
-    with httpx.Client(timeout=TIMEOUT) as client:
-        resp = client.get(url, params=params)
-        resp.raise_for_status()
-    data = resp.json()
-    return data.get("msg", [])
+    return _query(CELL_CRITERIA, num_rows)
+
+
+async def async_list_cells(num_rows: int = 25) -> List[Dict[str, Any]]:
+    return await _async_query(CELL_CRITERIA, num_rows)
+
+
+def iter_cells(page_size: int = ROWS_PER_PAGE, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Yield every cell specimen (or the first ``limit``), one page at a time."""
+    return _iter_query(CELL_CRITERIA, page_size, limit)
+
+
+def async_iter_cells(page_size: int = ROWS_PER_PAGE, limit: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+    return _async_iter_query(CELL_CRITERIA, page_size, limit)
 
 
 def get_cell(specimen_id: int) -> Dict[str, Any]:
     """Fetch metadata for a single cell specimen by ID."""
-    url = f"{BASE_URL}/data/query.json"
-    params = {
-        "criteria": f"model::ApiCellTypesSpecimenDetail,rma::criteria,[specimen__id$eq{specimen_id}]",
-        "num_rows": 1,
-    }
-    with httpx.Client(timeout=TIMEOUT) as client:
-        resp = client.get(url, params=params)
-        resp.raise_for_status()
-    data = resp.json()
-    rows = data.get("msg", [])
-    if not rows:
-        raise ValueError(f"No cell found with specimen_id={specimen_id}")
-    return rows[0]
+    return _first_cell(_query(_cell_criteria(specimen_id), 1), specimen_id)
+
+
+async def async_get_cell(specimen_id: int) -> Dict[str, Any]:
+    return _first_cell(await _async_query(_cell_criteria(specimen_id), 1), specimen_id)
+
+
+def get_cells(
+    specimen_ids: Iterable[int],
+    chunk_size: int = CELL_CHUNK_SIZE,
+    max_concurrency: int = CELL_CHUNK_CONCURRENCY,
+) -> Dict[str, Any]:
+    """Fetch many cell specimens with one RMA ``$in`` query per chunk of IDs.
+
+    Chunks run concurrently on the shared session, so N IDs cost
+    ceil(N / chunk_size) requests instead of N. Returns
+    ``{"cells": {specimen_id: metadata}, "missing": [specimen_id, ...]}``,
+    both in the order the IDs were given (duplicates are fetched once).
+    """
+    chunks = _chunks(specimen_ids, chunk_size)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(chunks)))) as pool:
+        results = list(pool.map(lambda chunk: _query(_chunk_criteria(chunk), len(chunk)), chunks))
+    return _collect_cells(chunks, results)
 
 
-def get_ephys_features(num_rows: int = 25) -> List[Dict[str, Any]]:
+async def async_get_cells(
+    specimen_ids: Iterable[int],
+    chunk_size: int = CELL_CHUNK_SIZE,
+    max_concurrency: int = CELL_CHUNK_CONCURRENCY,
+) -> Dict[str, Any]:
+    chunks = _chunks(specimen_ids, chunk_size)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch(chunk: List[int]) -> List[Dict[str, Any]]:
+        async with semaphore:
+            return await _async_query(_chunk_criteria(chunk), len(chunk))
+
+    results = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+    return _collect_cells(chunks, list(results))
+
+
+def get_ephys_features(num_rows: int = 25, format: str = "records") -> Any:
     """Fetch pre-computed electrophysiology features.
 
     Returns features like rheobase, input resistance (ri), membrane time
-    constant (tau), firing rate, etc. as a list of dicts.
+    constant (tau), firing rate, etc. as a list of dicts, or as a
+    ``"numpy"``, ``"pandas"`` or ``"arrow"`` table.
     """
-    url = f"{BASE_URL}/data/query.json"
-    params = {
-        "criteria": "model::EphysFeature",
-        "num_rows": num_rows,
-    }
-    with httpx.Client(timeout=TIMEOUT) as client:
-        resp = client.get(url, params=params)
-        resp.raise_for_status()
-    data = resp.json()
-    return data.get("msg", [])
+    _check_table_format(format)
+    return as_table(_query(EPHYS_CRITERIA, num_rows), format)
 
 
-def get_morphology_features(num_rows: int = 25) -> List[Dict[str, Any]]:
-    """Fetch neuron morphology features (soma depth, dendrite type, etc.)."""
-    url = f"{BASE_URL}/data/query.json"
-    params = {
-        "criteria": "model::NeuronReconstruction",
-        "num_rows": num_rows,
-    }
-    with httpx.Client(timeout=TIMEOUT) as client:
-        resp = client.get(url, params=params)
-        resp.raise_for_status()
-    data = resp.json()
-    return data.get("msg", [])
+async def async_get_ephys_features(num_rows: int = 25, format: str = "records") -> Any:
+    _check_table_format(format)
+    return as_table(await _async_query(EPHYS_CRITERIA, num_rows), format)
+
+
+def iter_ephys_features(page_size: int = ROWS_PER_PAGE, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    return _iter_query(EPHYS_CRITERIA, page_size, limit)
+
+
+def async_iter_ephys_features(
+    page_size: int = ROWS_PER_PAGE,
+    limit: Optional[int] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    return _async_iter_query(EPHYS_CRITERIA, page_size, limit)
+
+
+def get_morphology_features(num_rows: int = 25, format: str = "records") -> Any:
+    """Fetch neuron morphology features (soma depth, dendrite type, etc.), as for ``get_ephys_features``."""
+    _check_table_format(format)
+    return as_table(_query(MORPHOLOGY_CRITERIA, num_rows), format)
+
+
+async def async_get_morphology_features(num_rows: int = 25, format: str = "records") -> Any:
+    _check_table_format(format)
+    return as_table(await _async_query(MORPHOLOGY_CRITERIA, num_rows), format)
+
+
+def iter_morphology_features(page_size: int = ROWS_PER_PAGE, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    return _iter_query(MORPHOLOGY_CRITERIA, page_size, limit)
+
+
+def async_iter_morphology_features(
+    page_size: int = ROWS_PER_PAGE,
+    limit: Optional[int] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    return _async_iter_query(MORPHOLOGY_CRITERIA, page_size, limit)
+
+
+def get_feature_table(
+    limit: Optional[int] = None,
+    page_size: int = ROWS_PER_PAGE,
+    format: str = "numpy",
+) -> Any:
+    """Every cell (or the first ``limit``) joined with its ephys and morphology features.
+
+    One row per cell, keyed by ``specimen__id``. Feature columns are added
+    from the first ``EphysFeature`` and ``NeuronReconstruction`` row of the
+    specimen (NaN/None when it has none); a feature column whose name is
+    already taken gets an ``ephys__`` or ``morphology__`` prefix. Without
+    ``limit`` the three result sets are paged concurrently; with it, only
+    the features of the returned cells are fetched, with one ``$in`` query
+    per chunk of specimen IDs as in ``get_cells``. ``format`` is
+    ``"numpy"``, ``"pandas"`` or ``"arrow"``.
+    """
+    _check_table_format(format, records=False)
+    if limit is None:
+        sources = [
+            iter_cells(page_size),
+            iter_ephys_features(page_size),
+            iter_morphology_features(page_size),
+        ]
+        with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+            cells, ephys, morphology = pool.map(to_arrays, sources)
+        return _join_features(cells, ephys, morphology, format)
+
+    cells = to_arrays(iter_cells(page_size, limit))
+    chunks = _chunks(cells.get("specimen__id", []), CELL_CHUNK_SIZE)
+    queries = [_feature_criteria(model, chunk) for model in (EPHYS_CRITERIA, MORPHOLOGY_CRITERIA) for chunk in chunks]
+    with ThreadPoolExecutor(max_workers=max(1, min(CELL_CHUNK_CONCURRENCY, len(queries)))) as pool:
+        results = list(pool.map(lambda criteria: list(_iter_query(criteria, page_size, None)), queries))
+    ephys, morphology = results[:len(chunks)], results[len(chunks):]
+    return _join_features(cells, _rows_to_arrays(ephys), _rows_to_arrays(morphology), format)
+
+
+async def async_get_feature_table(
+    limit: Optional[int] = None,
+    page_size: int = ROWS_PER_PAGE,
+    format: str = "numpy",
+) -> Any:
+    _check_table_format(format, records=False)
+
+    async def collect(rows: AsyncIterator[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [row async for row in rows]
+
+    if limit is None:
+        cells, ephys, morphology = await asyncio.gather(
+            collect(async_iter_cells(page_size)),
+            collect(async_iter_ephys_features(page_size)),
+            collect(async_iter_morphology_features(page_size)),
+        )
+        return _join_features(to_arrays(cells), to_arrays(ephys), to_arrays(morphology), format)
+
+    cells = to_arrays(await collect(async_iter_cells(page_size, limit)))
+    chunks = _chunks(cells.get("specimen__id", []), CELL_CHUNK_SIZE)
+    semaphore = asyncio.Semaphore(CELL_CHUNK_CONCURRENCY)
+
+    async def fetch(model: str, chunk: List[int]) -> List[Dict[str, Any]]:
+        async with semaphore:
+            return await collect(_async_iter_query(_feature_criteria(model, chunk), page_size, None))
+
+    ephys, morphology = await asyncio.gather(
+        asyncio.gather(*(fetch(EPHYS_CRITERIA, chunk) for chunk in chunks)),
+        asyncio.gather(*(fetch(MORPHOLOGY_CRITERIA, chunk) for chunk in chunks)),
+    )
+    return _join_features(cells, _rows_to_arrays(ephys), _rows_to_arrays(morphology), format)
+
+
+def _check_table_format(format: str, records: bool = True) -> None:
+    # Checked before any request is made.
+    if format not in TABLE_FORMATS or (format == "records" and not records):
+        raise ValueError(f"Unsupported table format: {format}")
+
+
+def _rows_to_arrays(chunks: Iterable[List[Dict[str, Any]]]) -> Table:
+    return to_arrays(row for rows in chunks for row in rows)
+
+
+def _join_features(cells: Table, ephys: Table, morphology: Table, format: str) -> Any:
+    table = join_on(cells, ephys, "specimen__id", "specimen_id", prefix="ephys__")
+    table = join_on(table, morphology, "specimen__id", "specimen_id", prefix="morphology__")
+    return convert(table, format)
 
 
 def search_cells(
@@ -96,34 +365,98 @@ def search_cells(
         brain_region: e.g. "VISp" (primary visual cortex)
         num_rows: max results to return
     """
-    filters = []
-    if species:
-        filters.append(f"[donor__species$eq'{species}']")
-    if brain_region:
-        filters.append(f"[structure__acronym$eq'{brain_region}']")
+    return _query(_search_criteria(species, brain_region), num_rows)
 
-    criteria = "model::ApiCellTypesSpecimenDetail"
-    if filters:
-        criteria += ",rma::criteria," + ",".join(filters)
 
-    url = f"{BASE_URL}/data/query.json"
-    params = {"criteria": criteria, "num_rows": num_rows}
-    with httpx.Client(timeout=TIMEOUT) as client:
-        resp = client.get(url, params=params)
-        resp.raise_for_status()
-    data = resp.json()
-    return data.get("msg", [])
+async def async_search_cells(
+    species: Optional[str] = None,
+    brain_region: Optional[str] = None,
+    num_rows: int = 25,
+) -> List[Dict[str, Any]]:
+    return await _async_query(_search_criteria(species, brain_region), num_rows)
+
+
+def iter_search_cells(
+    species: Optional[str] = None,
+    brain_region: Optional[str] = None,
+    page_size: int = ROWS_PER_PAGE,
+    limit: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """``search_cells`` over every matching cell, one page at a time."""
+    return _iter_query(_search_criteria(species, brain_region), page_size, limit)
 
 
-def get_summary_stats(cells: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
-    """Compute summary statistics from a list of cell specimens.
+def async_iter_search_cells(
+    species: Optional[str] = None,
+    brain_region: Optional[str] = None,
+    page_size: int = ROWS_PER_PAGE,
+    limit: Optional[int] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    return _async_iter_query(_search_criteria(species, brain_region), page_size, limit)
 
-    If cells is None, fetches 100 cells first. Returns counts by species,
-    brain region, and dendrite type.
+
+def get_summary_stats(
+    cells: Union[List[Dict[str, Any]], Table, None] = None,
+    features: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """Compute summary statistics from cell specimens.
+
+    ``cells`` is a list of cell dicts or a numpy table such as
+    ``get_feature_table()``; if None, fetches 100 cells first. Returns
+    counts by species, brain region, dendrite type and region x dendrite
+    type, and per-region and per-dendrite-type distributions (count, mean,
+    std, min, median, max) of each numeric column in ``features``, by
+    default the ``SUMMARY_FEATURES`` present. Everything is computed on
+    arrays; without numpy only the species/region/dendrite counts are given.
     """
     if cells is None:
         cells = list_cells(num_rows=100)
+    return _summarize_cells(cells, features)
+
+
+async def async_get_summary_stats(
+    cells: Union[List[Dict[str, Any]], Table, None] = None,
+    features: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    if cells is None:
+        cells = await async_list_cells(num_rows=100)
+    return _summarize_cells(cells, features)
+
+
+def _summarize_cells(cells: Union[List[Dict[str, Any]], Table], features: Optional[Sequence[str]]) -> Dict[str, Any]:
+    try:
+        table = cells if isinstance(cells, dict) else to_arrays(cells)
+    except ImportError:
+        if features:
+            raise
+        return _count_cells(cells)
+
+    species = factorize(label_column(table, "donor__species"))
+    regions = factorize(label_column(table, "structure__name", "structure__acronym"))
+    dendrite_types = factorize(label_column(table, "tag__dendrite_type"))
+    if features is None:
+        features = [name for name in SUMMARY_FEATURES if name in table]
+    missing = [name for name in features if name not in table]
+    if missing:
+        raise ValueError(f"Unknown feature columns: {', '.join(missing)}")
+
+    return {
+        "total_cells": table_length(table),
+        "species": group_counts(species),
+        "brain_regions": group_counts(regions),
+        "dendrite_types": group_counts(dendrite_types),
+        "region_dendrite_types": crosstab(regions, dendrite_types),
+        "features": {
+            name: {
+                "by_region": describe_by(regions, table[name]),
+                "by_dendrite_type": describe_by(dendrite_types, table[name]),
+            }
+            for name in features
+        },
+    }
+
 
+def _count_cells(cells: List[Dict[str, Any]]) -> Dict[str, Any]:
     species_counts: Dict[str, int] = {}
     region_counts: Dict[str, int] = {}
     dendrite_counts: Dict[str, int] = {}
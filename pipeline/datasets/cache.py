@@ -0,0 +1,217 @@
+"""On-disk HTTP response cache shared by the dataset modules (see ``session``).
+
+Responses are keyed by URL and query parameters, with a TTL per endpoint
+and the server's validators kept for conditional revalidation.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+
+from pipeline.cache import SQLiteCache, cache_path
+from pipeline.jsonio import loads
+
+DEFAULT_DATASET_CACHE_PATH = cache_path("datasets")
+DEFAULT_DATASET_TTL = 24 * 3600.0
+DEFAULT_DATASET_MAX_BYTES = 512 * 1024 * 1024
+# (URL pattern, TTL in seconds); the first pattern found in a request URL wins.
+DATASET_TTLS: Tuple[Tuple[str, float], ...] = (
+    # Allen Cell Types data only changes with a new release, a few times a year.
+    (r"/data/query\.json", 30 * 24 * 3600.0),
+    # Published DANDI versions are immutable; drafts are edited in place.
+    (r"/dandisets/[^/]+/versions/\d+\.\d+\.\d+/", 365 * 24 * 3600.0),
+    (r"/dandisets/[^/]+/versions/draft/", 24 * 3600.0),
+    # Listings and search results change as dandisets are added.
+    (r"/dandisets/", 3600.0),
+)
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fresh: bool
+
+    def json(self) -> Any:
+        return loads(self.body)
+
+    def validators(self) -> Dict[str, str]:
+        """Headers for a conditional GET; empty if the server sent no validators."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DatasetCache(SQLiteCache):
+    """HTTP response cache for the dataset modules.
+
+    Entries outlive their TTL: a stale entry is revalidated with its
+    ``ETag``/``Last-Modified`` when it has one, and is still served in
+    offline mode. Least-recently-used entries are evicted past ``max_bytes``;
+    the total size is kept in a one-row ``usage`` table, updated in the same
+    transaction as each write, so inserts never scan the whole cache.
+    """
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_DATASET_CACHE_PATH,
+        ttls: Sequence[Tuple[str, float]] = DATASET_TTLS,
+        default_ttl: float = DEFAULT_DATASET_TTL,
+        max_bytes: int = DEFAULT_DATASET_MAX_BYTES,
+    ) -> None:
+        super().__init__(path)
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in ttls]
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.stale = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evictions = 0
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT, "
+                "size INTEGER NOT NULL, fetched REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+            conn.execute("CREATE TABLE IF NOT EXISTS usage (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL)")
+            conn.execute("INSERT OR IGNORE INTO usage (id, bytes) SELECT 0, COALESCE(SUM(size), 0) FROM responses")
+
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """The request URL with its query parameters in sorted order."""
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted((name, str(value)) for name, value in params.items()))}"
+
+    def ttl_for(self, key: str) -> float:
+        for pattern, ttl in self.ttls:
+            if pattern.search(key):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """The cached response for ``key``, fresh or stale, or None on a miss."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute(
+                    "SELECT body, etag, last_modified, fetched FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        finally:
+            conn.close()
+
+        if row is None:
+            self.misses += 1
+            return None
+        body, etag, last_modified, fetched = row
+        fresh = now - fetched <= self.ttl_for(key)
+        if fresh:
+            self.hits += 1
+        else:
+            self.stale += 1
+        return CachedResponse(zlib.decompress(body), etag, last_modified, fresh)
+
+    def put(self, key: str, body: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        payload = zlib.compress(body)
+        if len(payload) > self.max_bytes:
+            return
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                replaced = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, body, etag, last_modified, size, fetched, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, payload, etag, last_modified, len(payload), now, now),
+                )
+                growth = len(payload) - (replaced[0] if replaced else 0)
+                conn.execute("UPDATE usage SET bytes = bytes + ? WHERE id = 0", (growth,))
+                self._evict(conn)
+        finally:
+            conn.close()
+
+    def refresh(self, key: str) -> None:
+        """Restart the TTL of an entry the server confirmed unchanged (``304``)."""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("UPDATE responses SET fetched = ? WHERE key = ?", (time.time(), key))
+        finally:
+            conn.close()
+        self.revalidated += 1
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT bytes FROM usage WHERE id = 0").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        doomed = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed ASC"):
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        conn.execute("UPDATE usage SET bytes = ? WHERE id = 0", (total,))
+        self.evictions += len(doomed)
+
+    def clear(self) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM responses")
+                conn.execute("UPDATE usage SET bytes = 0 WHERE id = 0")
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        conn = self._connect()
+        try:
+            entries = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            size = conn.execute("SELECT bytes FROM usage WHERE id = 0").fetchone()[0]
+        finally:
+            conn.close()
+        return {
+            "entries": entries,
+            "bytes": size,
+            "hits": self.hits,
+            "stale": self.stale,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def default_dataset_cache() -> Optional[DatasetCache]:
+    """Cache configured by ``AGENTSCIENCE_DATASET_CACHE_*`` (empty path disables it).
+
+    ``AGENTSCIENCE_DATASET_CACHE_TTL`` replaces the per-endpoint TTLs with one value.
+    """
+    path = os.environ.get("AGENTSCIENCE_DATASET_CACHE_PATH", str(DEFAULT_DATASET_CACHE_PATH))
+    if not path:
+        return None
+    ttl = os.environ.get("AGENTSCIENCE_DATASET_CACHE_TTL")
+    max_mb = os.environ.get("AGENTSCIENCE_DATASET_CACHE_MAX_MB")
+    return DatasetCache(
+        path,
+        ttls=() if ttl else DATASET_TTLS,
+        default_ttl=float(ttl) if ttl else DEFAULT_DATASET_TTL,
+        max_bytes=int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_DATASET_MAX_BYTES,
+    )
@@ -3,18 +3,31 @@
 No authentication required for reading public dandisets.
 Uses the DANDI REST API directly (no dandi-cli install needed).
 
+Requests share the pooled, retrying session in ``pipeline.datasets.session``,
+and every function has an ``async_`` counterpart. ``iter_dandisets`` and
+``iter_assets`` follow the API's ``next`` links lazily instead of stopping
+at the first page (see ``pipeline.datasets.paging``).
+
 API docs: https://api.dandiarchive.org/swagger/
 REST base: https://api.dandiarchive.org/api
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
 
 import httpx
 
+from pipeline.datasets.paging import Page, aiter_pages, iter_pages
+from pipeline.datasets.session import get_async_session, get_session
+
 BASE_URL = "https://api.dandiarchive.org/api"
-TIMEOUT = httpx.Timeout(15.0)
+# The API caps page_size at 100.
+MAX_PAGE_SIZE = 100
+
+# Cursor for the paginated endpoints: the URL and, on the first page only, its query parameters.
+_Cursor = Tuple[str, Optional[Dict[str, Any]]]
 
 
 def list_dandisets(
@@ -29,14 +42,82 @@ def list_dandisets(
         ordering: sort order ("-created", "created", "-name", "name")
         search: optional keyword search (e.g. "hippocampus", "visual cortex")
     """
+    data = get_session().get_json(f"{BASE_URL}/dandisets/", params=_dandiset_params(page_size, ordering, search))
+    return _simplify_dandisets(data)
+
+
+async def async_list_dandisets(
+    page_size: int = 10,
+    ordering: str = "-created",
+    search: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    data = await get_async_session().get_json(
+        f"{BASE_URL}/dandisets/", params=_dandiset_params(page_size, ordering, search)
+    )
+    return _simplify_dandisets(data)
+
+
+def iter_dandisets(
+    ordering: str = "-created",
+    search: Optional[str] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    limit: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield every matching dandiset (or the first ``limit``), in the ``list_dandisets`` shape."""
+    cursor = (f"{BASE_URL}/dandisets/", _dandiset_params(_page_size(page_size, limit), ordering, search))
+    return iter_pages(_page_fetcher(_simplify_dandisets), cursor, limit)
+
+
+def async_iter_dandisets(
+    ordering: str = "-created",
+    search: Optional[str] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    limit: Optional[int] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    cursor = (f"{BASE_URL}/dandisets/", _dandiset_params(_page_size(page_size, limit), ordering, search))
+    return aiter_pages(_async_page_fetcher(_simplify_dandisets), cursor, limit)
+
+
+def _page_size(page_size: int, limit: Optional[int]) -> int:
+    if limit is not None:
+        page_size = min(page_size, limit)
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+
+def _page_fetcher(simplify: Callable[[Dict[str, Any]], List[Dict[str, Any]]]) -> Callable[[_Cursor], Page]:
+    def fetch(cursor: _Cursor) -> Page:
+        url, params = cursor
+        data = get_session().get_json(url, params=params)
+        return simplify(data), _next_cursor(data)
+
+    return fetch
+
+
+def _async_page_fetcher(
+    simplify: Callable[[Dict[str, Any]], List[Dict[str, Any]]],
+) -> Callable[[_Cursor], Awaitable[Page]]:
+    async def fetch(cursor: _Cursor) -> Page:
+        url, params = cursor
+        data = await get_async_session().get_json(url, params=params)
+        return simplify(data), _next_cursor(data)
+
+    return fetch
+
+
+def _next_cursor(data: Dict[str, Any]) -> Optional[_Cursor]:
+    # `next` is an absolute URL that already carries every query parameter.
+    next_url = data.get("next")
+    return (next_url, None) if next_url else None
+
+
+def _dandiset_params(page_size: int, ordering: str, search: Optional[str]) -> Dict[str, Any]:
     params: Dict[str, Any] = {"page_size": page_size, "ordering": ordering}
     if search:
         params["search"] = search
+    return params
+
 
-    with httpx.Client(timeout=TIMEOUT) as client:
-        resp = client.get(f"{BASE_URL}/dandisets/", params=params)
-        resp.raise_for_status()
-    data = resp.json()
+def _simplify_dandisets(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     results = data.get("results", [])
 
     # Flatten version info for easier use
@@ -58,10 +139,11 @@ def list_dandisets(
 
 def get_dandiset(dandiset_id: str, version: str = "draft") -> Dict[str, Any]:
     """Get metadata for a specific dandiset."""
-    with httpx.Client(timeout=TIMEOUT) as client:
-        resp = client.get(f"{BASE_URL}/dandisets/{dandiset_id}/versions/{version}/")
-        resp.raise_for_status()
-    return resp.json()
+    return get_session().get_json(f"{BASE_URL}/dandisets/{dandiset_id}/versions/{version}/")
+
+
+async def async_get_dandiset(dandiset_id: str, version: str = "draft") -> Dict[str, Any]:
+    return await get_async_session().get_json(f"{BASE_URL}/dandisets/{dandiset_id}/versions/{version}/")
 
 
 def list_assets(
@@ -78,18 +160,63 @@ def list_assets(
         page_size: max results
         path_prefix: filter by path prefix (e.g. "sub-anm372795/")
     """
+    data = get_session().get_json(
+        f"{BASE_URL}/dandisets/{dandiset_id}/versions/{version}/assets/",
+        params=_asset_params(page_size, path_prefix),
+    )
+    return _simplify_assets(data)
+
+
+async def async_list_assets(
+    dandiset_id: str,
+    version: str = "draft",
+    page_size: int = 10,
+    path_prefix: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    data = await get_async_session().get_json(
+        f"{BASE_URL}/dandisets/{dandiset_id}/versions/{version}/assets/",
+        params=_asset_params(page_size, path_prefix),
+    )
+    return _simplify_assets(data)
+
+
+def iter_assets(
+    dandiset_id: str,
+    version: str = "draft",
+    path_prefix: Optional[str] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    limit: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield every asset in a dandiset (or the first ``limit``), in the ``list_assets`` shape."""
+    cursor = (
+        f"{BASE_URL}/dandisets/{dandiset_id}/versions/{version}/assets/",
+        _asset_params(_page_size(page_size, limit), path_prefix),
+    )
+    return iter_pages(_page_fetcher(_simplify_assets), cursor, limit)
+
+
+def async_iter_assets(
+    dandiset_id: str,
+    version: str = "draft",
+    path_prefix: Optional[str] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    limit: Optional[int] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    cursor = (
+        f"{BASE_URL}/dandisets/{dandiset_id}/versions/{version}/assets/",
+        _asset_params(_page_size(page_size, limit), path_prefix),
+    )
+    return aiter_pages(_async_page_fetcher(_simplify_assets), cursor, limit)
+
+
+def _asset_params(page_size: int, path_prefix: Optional[str]) -> Dict[str, Any]:
     params: Dict[str, Any] = {"page_size": page_size}
     if path_prefix:
         params["path"] = path_prefix
+    return params
 
-    with httpx.Client(timeout=TIMEOUT) as client:
-        resp = client.get(
-            f"{BASE_URL}/dandisets/{dandiset_id}/versions/{version}/assets/",
-            params=params,
-        )
-        resp.raise_for_status()
-    data = resp.json()
 
+def _simplify_assets(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     assets = []
     for a in data.get("results", []):
         assets.append({
@@ -108,10 +235,24 @@ def get_asset_download_url(
     version: str = "draft",
 ) -> str:
     """Get a direct S3 download URL for an asset (no auth needed)."""
-    with httpx.Client(timeout=TIMEOUT, follow_redirects=False) as client:
-        resp = client.get(
-            f"{BASE_URL}/dandisets/{dandiset_id}/versions/{version}/assets/{asset_id}/download/",
-        )
+    resp = get_session().get(_download_url(dandiset_id, asset_id, version), follow_redirects=False)
+    return _redirect_location(resp)
+
+
+async def async_get_asset_download_url(
+    dandiset_id: str,
+    asset_id: str,
+    version: str = "draft",
+) -> str:
+    resp = await get_async_session().get(_download_url(dandiset_id, asset_id, version), follow_redirects=False)
+    return _redirect_location(resp)
+
+
+def _download_url(dandiset_id: str, asset_id: str, version: str) -> str:
+    return f"{BASE_URL}/dandisets/{dandiset_id}/versions/{version}/assets/{asset_id}/download/"
+
+
+def _redirect_location(resp: httpx.Response) -> str:
     if resp.status_code in (301, 302, 307):
         return resp.headers.get("location", "")
     resp.raise_for_status()
@@ -123,6 +264,10 @@ def search_dandisets(query: str, page_size: int = 5) -> List[Dict[str, Any]]:
     return list_dandisets(page_size=page_size, search=query)
 
 
+async def async_search_dandisets(query: str, page_size: int = 5) -> List[Dict[str, Any]]:
+    return await async_list_dandisets(page_size=page_size, search=query)
+
+
 # Small recommended dandisets for quick iteration
 RECOMMENDED_DANDISETS = {
     "000006": {
@@ -147,6 +292,19 @@ def get_summary(dandiset_id: str = "000006") -> Dict[str, Any]:
     """Get a quick summary of a dandiset: name, size, file count, first few files."""
     meta = get_dandiset(dandiset_id)
     assets = list_assets(dandiset_id, page_size=5)
+    return _summary(dandiset_id, meta, assets)
+
+
+async def async_get_summary(dandiset_id: str = "000006") -> Dict[str, Any]:
+    """``get_summary`` with the metadata and asset requests made concurrently."""
+    meta, assets = await asyncio.gather(
+        async_get_dandiset(dandiset_id),
+        async_list_assets(dandiset_id, page_size=5),
+    )
+    return _summary(dandiset_id, meta, assets)
+
+
+def _summary(dandiset_id: str, meta: Dict[str, Any], assets: List[Dict[str, Any]]) -> Dict[str, Any]:
     return {
         "identifier": dandiset_id,
         "name": meta.get("name", ""),
@@ -0,0 +1,87 @@
+"""Lazy pagination over dataset result sets.
+
+``iter_pages`` turns a page-fetching function into a row generator. While
+the caller consumes one page, the next is already being fetched on a
+background thread (or as a task, for ``aiter_pages``), so at most two pages
+are held at a time. ``to_columns`` and ``to_dataframe`` collect rows for
+callers who want everything at once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# A page of rows plus the cursor for the next page, or None on the last page.
+Page = Tuple[List[Dict[str, Any]], Optional[Any]]
+
+
+def iter_pages(fetch: Callable[[Any], Page], cursor: Any, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Yield rows from ``fetch(cursor)``, following cursors until exhausted or ``limit`` rows."""
+    if limit is not None and limit <= 0:
+        return
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        pending = pool.submit(fetch, cursor)
+        yielded = 0
+        while pending is not None:
+            rows, cursor = pending.result()
+            more = cursor is not None and rows and (limit is None or yielded + len(rows) < limit)
+            pending = pool.submit(fetch, cursor) if more else None
+            for row in rows:
+                yield row
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+    finally:
+        # An abandoned generator must not wait for a prefetch nobody will read.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    fetch: Callable[[Any], Awaitable[Page]],
+    cursor: Any,
+    limit: Optional[int] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Async ``iter_pages``: the next page is fetched by a task while rows are consumed."""
+    if limit is not None and limit <= 0:
+        return
+    pending: Optional[asyncio.Future] = asyncio.ensure_future(fetch(cursor))
+    try:
+        yielded = 0
+        while pending is not None:
+            rows, cursor = await pending
+            more = cursor is not None and rows and (limit is None or yielded + len(rows) < limit)
+            pending = asyncio.ensure_future(fetch(cursor)) if more else None
+            for row in rows:
+                yield row
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+
+
+def to_columns(rows: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Collect rows into ``{column: values}``; keys missing from a row become None."""
+    columns: Dict[str, List[Any]] = {}
+    count = 0
+    for row in rows:
+        for key in row:
+            if key not in columns:
+                columns[key] = [None] * count
+        for key, values in columns.items():
+            values.append(row.get(key))
+        count += 1
+    return columns
+
+
+def to_dataframe(rows: Iterable[Dict[str, Any]]):
+    """Collect rows into a ``pandas.DataFrame`` (requires pandas)."""
+    try:
+        import pandas as pd  # type: ignore
+    except ImportError as exc:
+        raise ImportError("to_dataframe requires `pandas`. Install with: pip install pandas") from exc
+    return pd.DataFrame(to_columns(rows))
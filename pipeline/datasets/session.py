@@ -0,0 +1,281 @@
+"""Shared HTTP sessions for the dataset modules.
+
+Every dataset call goes through one pooled, keep-alive ``httpx.Client``
+(or, from async code, one ``httpx.AsyncClient`` per event loop), so repeated
+calls reuse connections instead of paying a new handshake each time.
+Transport errors, 429 and 5xx answers are retried with exponential backoff,
+honouring ``Retry-After`` when the server sends one.
+
+JSON responses are kept in a ``DatasetCache`` on disk. Fresh entries are
+served without a request; stale ones are revalidated with ``If-None-Match``
+/ ``If-Modified-Since`` and a ``304`` just restarts their TTL. In offline
+mode only the cache is read, stale or not, and a miss raises
+``OfflineCacheMiss``.
+
+Tuning via environment:
+  AGENTSCIENCE_DATASET_TIMEOUT          request timeout in seconds (default 15)
+  AGENTSCIENCE_DATASET_RETRIES          retries after the first attempt (default 3)
+  AGENTSCIENCE_DATASET_BACKOFF          first backoff delay in seconds (default 0.5)
+  AGENTSCIENCE_DATASET_MAX_CONNECTIONS  pool size (default 20)
+  AGENTSCIENCE_DATASET_OFFLINE          set to 1 to serve only from the cache
+  AGENTSCIENCE_DATASET_CACHE_*          cache location, TTL and size (see ``default_dataset_cache``)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+from pipeline.datasets.cache import CachedResponse, DatasetCache, default_dataset_cache
+
+USER_AGENT = "AgentScience/0.1"
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_BACKOFF_SECONDS = 30.0
+
+TIMEOUT_SECONDS = float(os.environ.get("AGENTSCIENCE_DATASET_TIMEOUT", "15"))
+RETRIES = int(os.environ.get("AGENTSCIENCE_DATASET_RETRIES", "3"))
+BACKOFF_SECONDS = float(os.environ.get("AGENTSCIENCE_DATASET_BACKOFF", "0.5"))
+MAX_CONNECTIONS = int(os.environ.get("AGENTSCIENCE_DATASET_MAX_CONNECTIONS", "20"))
+OFFLINE = os.environ.get("AGENTSCIENCE_DATASET_OFFLINE", "") not in ("", "0")
+
+
+class OfflineCacheMiss(LookupError):
+    """Raised in offline mode for a request with no cached response."""
+
+
+class _RetryPolicy:
+    def __init__(self, retries: int, backoff: float) -> None:
+        self.retries = retries
+        self.backoff = backoff
+
+    def should_retry(self, attempt: int, response: Optional[httpx.Response]) -> bool:
+        if attempt >= self.retries:
+            return False
+        return response is None or response.status_code in RETRY_STATUSES
+
+    def delay(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), MAX_BACKOFF_SECONDS)
+        return min(self.backoff * 2**attempt, MAX_BACKOFF_SECONDS)
+
+
+def _client_options(timeout: float, max_connections: int) -> Dict[str, Any]:
+    return {
+        "timeout": httpx.Timeout(timeout),
+        "headers": {"User-Agent": USER_AGENT},
+        "limits": httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        "follow_redirects": True,
+    }
+
+
+def _lookup(cache: Optional[DatasetCache], offline: bool, key: str) -> Optional[CachedResponse]:
+    entry = cache.get(key) if cache is not None else None
+    if entry is None and offline:
+        raise OfflineCacheMiss(f"No cached response for {key} (AGENTSCIENCE_DATASET_OFFLINE is set)")
+    return entry
+
+
+def _conditional_headers(entry: Optional[CachedResponse]) -> Optional[Dict[str, str]]:
+    return entry.validators() if entry is not None else None
+
+
+def _store(cache: Optional[DatasetCache], key: str, entry: Optional[CachedResponse], response: httpx.Response) -> Any:
+    if entry is not None and response.status_code == 304:
+        cache.refresh(key)
+        return entry.json()
+    response.raise_for_status()
+    if cache is not None:
+        cache.put(key, response.content, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return response.json()
+
+
+class DatasetSession:
+    """Pooled, retrying ``httpx.Client``; safe to share between threads.
+
+    ``get_json`` goes through ``cache`` when one is given; ``get`` never does.
+    """
+
+    def __init__(
+        self,
+        timeout: float = TIMEOUT_SECONDS,
+        retries: int = RETRIES,
+        backoff: float = BACKOFF_SECONDS,
+        max_connections: int = MAX_CONNECTIONS,
+        cache: Optional[DatasetCache] = None,
+        offline: bool = OFFLINE,
+    ) -> None:
+        self.retry = _RetryPolicy(retries, backoff)
+        self.cache = cache
+        self.offline = offline
+        self._client = httpx.Client(**_client_options(timeout, max_connections))
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        follow_redirects: bool = True,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """GET with retries; the final response is returned whatever its status."""
+        attempt = 0
+        while True:
+            try:
+                response = self._client.get(url, params=params, headers=headers, follow_redirects=follow_redirects)
+            except httpx.TransportError:
+                if not self.retry.should_retry(attempt, None):
+                    raise
+                response = None
+            if response is not None and not self.retry.should_retry(attempt, response):
+                return response
+            time.sleep(self.retry.delay(attempt, response))
+            attempt += 1
+
+    def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        key = DatasetCache.key(url, params)
+        entry = _lookup(self.cache, self.offline, key)
+        if entry is not None and (entry.fresh or self.offline):
+            return entry.json()
+        response = self.get(url, params=params, headers=_conditional_headers(entry))
+        return _store(self.cache, key, entry, response)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class AsyncDatasetSession:
+    """``DatasetSession`` for async callers, on one ``httpx.AsyncClient``."""
+
+    def __init__(
+        self,
+        timeout: float = TIMEOUT_SECONDS,
+        retries: int = RETRIES,
+        backoff: float = BACKOFF_SECONDS,
+        max_connections: int = MAX_CONNECTIONS,
+        cache: Optional[DatasetCache] = None,
+        offline: bool = OFFLINE,
+    ) -> None:
+        self.retry = _RetryPolicy(retries, backoff)
+        self.cache = cache
+        self.offline = offline
+        self._client = httpx.AsyncClient(**_client_options(timeout, max_connections))
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        follow_redirects: bool = True,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                response = await self._client.get(url, params=params, headers=headers, follow_redirects=follow_redirects)
+            except httpx.TransportError:
+                if not self.retry.should_retry(attempt, None):
+                    raise
+                response = None
+            if response is not None and not self.retry.should_retry(attempt, response):
+                return response
+            await asyncio.sleep(self.retry.delay(attempt, response))
+            attempt += 1
+
+    async def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        key = DatasetCache.key(url, params)
+        entry = await self._off_loop(_lookup, self.cache, self.offline, key)
+        if entry is not None and (entry.fresh or self.offline):
+            return entry.json()
+        response = await self.get(url, params=params, headers=_conditional_headers(entry))
+        return await self._off_loop(_store, self.cache, key, entry, response)
+
+    async def _off_loop(self, function: Callable[..., Any], *args: Any) -> Any:
+        # DatasetCache does blocking SQLite I/O, so it runs on a worker thread.
+        if self.cache is None:
+            return function(*args)
+        return await asyncio.to_thread(function, *args)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+_lock = threading.Lock()
+_session: Optional[DatasetSession] = None
+# One async session per running loop; an entry goes away with its loop.
+_async_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncDatasetSession]" = (
+    weakref.WeakKeyDictionary()
+)
+_cache: Optional[DatasetCache] = None
+_cache_loaded = False
+
+
+def _shared_cache() -> Optional[DatasetCache]:
+    # Callers hold _lock.
+    global _cache, _cache_loaded
+    if not _cache_loaded:
+        _cache = default_dataset_cache()
+        _cache_loaded = True
+    return _cache
+
+
+def get_cache() -> Optional[DatasetCache]:
+    """The response cache shared by every session, or None if disabled."""
+    with _lock:
+        return _shared_cache()
+
+
+def cache_stats() -> Dict[str, int]:
+    """``DatasetCache.stats()`` for the shared cache (empty if disabled)."""
+    cache = get_cache()
+    return cache.stats() if cache is not None else {}
+
+
+def get_session() -> DatasetSession:
+    """The process-wide session, created on first use."""
+    global _session
+    with _lock:
+        if _session is None:
+            _session = DatasetSession(cache=_shared_cache())
+        return _session
+
+
+def get_async_session() -> AsyncDatasetSession:
+    """The session for the running event loop.
+
+    An ``httpx.AsyncClient`` cannot outlive its loop, so each loop (e.g.
+    each ``asyncio.run``, or loops on different threads) gets its own
+    session. Its connections are only released by
+    ``await aclose_async_session()`` on that loop, so call it before the
+    loop finishes; a session whose loop is gone is dropped unclosed.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        session = _async_sessions.get(loop)
+        if session is None:
+            session = _async_sessions[loop] = AsyncDatasetSession(cache=_shared_cache())
+        return session
+
+
+def close_session() -> None:
+    """Close the sync session; the next one re-reads the cache settings."""
+    global _session, _cache, _cache_loaded
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+        _cache = None
+        _cache_loaded = False
+
+
+async def aclose_async_session() -> None:
+    """Close the running loop's session, if it has one."""
+    with _lock:
+        session = _async_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.aclose()
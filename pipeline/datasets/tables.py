@@ -0,0 +1,217 @@
+"""Column-oriented tables of dataset rows.
+
+A table is ``{column: numpy array}``: int64 for integer columns, float64
+(NaN where missing) for other numeric columns and object arrays for the
+rest. ``join_on`` left-joins two tables on a key column with one sorted
+lookup. ``factorize`` turns a label column (see ``label_column``) into
+integer group codes once, and ``group_counts``/``crosstab``/``describe_by``
+compute group-by counts and per-group distributions from the codes with
+array operations instead of a Python loop over rows. ``as_table`` hands
+the result to pandas or pyarrow when asked. Needs numpy.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pipeline.datasets.paging import to_columns
+
+TABLE_FORMATS = ("records", "numpy", "pandas", "arrow")
+DISTRIBUTION_STATS = ("count", "mean", "std", "min", "median", "max")
+
+# Column name -> numpy array, all of the same length.
+Table = Dict[str, Any]
+# Sorted group names and each row's index into them, from factorize().
+Groups = Tuple[List[str], Any]
+
+
+def _numpy():
+    try:
+        import numpy as np  # type: ignore
+    except ImportError as exc:
+        raise ImportError("Columnar tables require `numpy`. Install with: pip install numpy") from exc
+    return np
+
+
+def to_arrays(rows: Iterable[Dict[str, Any]]) -> Table:
+    """Collect rows into a table of numpy arrays (see the module docstring for dtypes)."""
+    np = _numpy()
+    return {name: _column_array(np, values) for name, values in to_columns(rows).items()}
+
+
+def _column_array(np, values: List[Any]):
+    kinds = {type(value) for value in values if value is not None}
+    # bool is its own type here, so flags stay object columns.
+    if kinds and kinds <= {int} and None not in values:
+        return np.array(values, dtype=np.int64)
+    if kinds and kinds <= {int, float}:
+        return np.array(values, dtype=np.float64)
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def table_length(table: Table) -> int:
+    return len(next(iter(table.values()))) if table else 0
+
+
+def as_table(rows: List[Dict[str, Any]], format: str = "numpy") -> Any:
+    """Return ``rows`` unchanged (``"records"``) or as a numpy/pandas/pyarrow table."""
+    if format not in TABLE_FORMATS:
+        raise ValueError(f"Unsupported table format: {format}")
+    if format == "records":
+        return rows
+    return convert(to_arrays(rows), format)
+
+
+def convert(table: Table, format: str) -> Any:
+    """Hand a numpy table to pandas (``DataFrame``) or pyarrow (``Table``, NaN as null)."""
+    if format == "numpy":
+        return table
+    if format == "pandas":
+        try:
+            import pandas as pd  # type: ignore
+        except ImportError as exc:
+            raise ImportError("format='pandas' requires `pandas`. Install with: pip install pandas") from exc
+        return pd.DataFrame(table)
+    if format == "arrow":
+        try:
+            import pyarrow as pa  # type: ignore
+        except ImportError as exc:
+            raise ImportError("format='arrow' requires `pyarrow`. Install with: pip install pyarrow") from exc
+        return pa.table({name: pa.array(column, from_pandas=True) for name, column in table.items()})
+    raise ValueError(f"Unsupported table format: {format}")
+
+
+def join_on(left: Table, right: Table, on: str, right_on: Optional[str] = None, prefix: str = "") -> Table:
+    """Left join: every ``left`` row gets the first ``right`` row with the same key.
+
+    Unmatched rows get NaN (numeric) or None; integer columns become float64
+    when any row is unmatched. A right column whose name is already in
+    ``left`` is renamed ``prefix + name``.
+    """
+    np = _numpy()
+    right_key = right_on or on
+    n = table_length(left)
+    left_keys = left[on] if on in left else np.full(n, None, dtype=object)
+    right_keys = right.get(right_key, np.empty(0, dtype=np.int64))
+
+    order = np.argsort(right_keys, kind="stable")
+    sorted_keys = right_keys[order]
+    if len(sorted_keys):
+        positions = np.minimum(np.searchsorted(sorted_keys, left_keys), len(sorted_keys) - 1)
+        matched = sorted_keys[positions] == left_keys
+        index = order[positions]
+    else:
+        matched = np.zeros(n, dtype=bool)
+        index = np.zeros(n, dtype=np.int64)
+
+    joined = dict(left)
+    for name, column in right.items():
+        if name == right_key:
+            continue
+        joined[prefix + name if name in joined else name] = _take(np, column, index, matched)
+    return joined
+
+
+def _take(np, column, index, matched):
+    complete = bool(matched.all())
+    if column.dtype.kind in "iu" and not complete:
+        column = column.astype(np.float64)
+    fill = np.nan if column.dtype.kind == "f" else None
+    if not len(column):
+        return np.full(len(index), fill, dtype=column.dtype)
+    taken = column[index]
+    if not complete:
+        taken[~matched] = fill
+    return taken
+
+
+def label_column(table: Table, *columns: str, missing: str = "unknown"):
+    """String label per row: the first non-empty value among ``columns``, else ``missing``."""
+    np = _numpy()
+    result = np.full(table_length(table), missing, dtype=object)
+    unset = np.ones(len(result), dtype=bool)
+    for name in columns:
+        if name not in table:
+            continue
+        values = table[name]
+        if values.dtype.kind == "f":
+            present = unset & ~np.isnan(values)
+        elif values.dtype == object:
+            present = unset & (values != None) & (values != "")  # noqa: E711 -- elementwise
+        else:
+            present = unset.copy()
+        result[present] = values[present]
+        unset &= ~present
+    return result.astype(str)
+
+
+def factorize(labels) -> Groups:
+    """Sorted distinct labels and each row's code into them (one sort, reused per statistic)."""
+    np = _numpy()
+    names, codes = np.unique(np.asarray(labels), return_inverse=True)
+    return names.tolist(), codes.reshape(-1)
+
+
+def group_counts(groups: Groups) -> Dict[str, int]:
+    """``{label: rows}``, most common first."""
+    np = _numpy()
+    names, codes = groups
+    counts = np.bincount(codes, minlength=len(names))
+    order = np.argsort(-counts, kind="stable")
+    return {names[i]: int(counts[i]) for i in order.tolist()}
+
+
+def crosstab(rows: Groups, columns: Groups) -> Dict[str, Dict[str, int]]:
+    """``{row label: {column label: rows}}``, leaving out empty cells."""
+    np = _numpy()
+    (row_names, row_codes), (column_names, column_codes) = rows, columns
+    cells = np.bincount(row_codes * len(column_names) + column_codes, minlength=len(row_names) * len(column_names))
+    grid = cells.reshape(len(row_names), len(column_names))
+    table: Dict[str, Dict[str, int]] = {}
+    for i, j in zip(*np.nonzero(grid)):
+        table.setdefault(row_names[i], {})[column_names[j]] = int(grid[i, j])
+    return table
+
+
+def describe_by(groups: Groups, values) -> Dict[str, Dict[str, Optional[float]]]:
+    """Per-group count, mean, std, min, median and max of ``values``, ignoring NaN.
+
+    Values are sorted once by (group, value), so every statistic is a
+    bincount or an index into that order. Groups with no values get
+    ``count`` 0 and None for the rest.
+    """
+    np = _numpy()
+    names, codes = groups
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(values)
+    codes, values = codes[valid], values[valid]
+    # Sort by value, then stably by group code (a radix sort on small ints).
+    order = np.argsort(values)
+    order = order[np.argsort(codes[order], kind="stable")]
+    codes, values = codes[order], values[order]
+
+    count = np.bincount(codes, minlength=len(names))
+    divisor = np.maximum(count, 1)
+    mean = np.bincount(codes, weights=values, minlength=len(names)) / divisor
+    deviation = values - mean[codes]
+    std = np.sqrt(np.bincount(codes, weights=deviation * deviation, minlength=len(names)) / divisor)
+
+    summary: Dict[str, Dict[str, Optional[float]]] = {}
+    for name in names:
+        summary[name] = dict.fromkeys(DISTRIBUTION_STATS)
+        summary[name]["count"] = 0
+    present = np.flatnonzero(count)
+    size = count[present]
+    start = (np.cumsum(count) - count)[present]
+    low, high = values[start], values[start + size - 1]
+    median = (values[start + (size - 1) // 2] + values[start + size // 2]) / 2
+    for i, group in enumerate(present.tolist()):
+        summary[names[group]] = {
+            "count": int(size[i]),
+            "mean": float(mean[group]),
+            "std": float(std[group]),
+            "min": float(low[i]),
+            "median": float(median[i]),
+            "max": float(high[i]),
+        }
+    return summary
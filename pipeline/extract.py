@@ -1,20 +1,32 @@
 import argparse
-import json
-import uuid
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from itertools import groupby
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 
-from pipeline.claim_extract import extract_claims
+from pipeline.cache import ExtractionCache, content_hash, default_cache, paper_id_for
+from pipeline.claim_extract import classify_breakthrough, extract_claims
+from pipeline.config import Section
+from pipeline.jsonio import dumps, dumps_line, loads
 from pipeline.report import render_report
-from pipeline.scoring import select_breakthroughs, select_key_ideas
+from pipeline.scoring import RunningTopK
 from pipeline.text_extract import (
+    PdfDocument,
+    PDF_BACKENDS,
+    PdfSource,
     extract_metadata_from_tex,
-    extract_pdf_pages,
+    iter_pdf_pages,
+    iter_sections_from_pdf,
     parse_latex_sections,
-    sections_from_pdf,
+    resolve_pdf_backend,
 )
 from pipeline.types import ExtractionResult, PaperMetadata, Claim
 
+PdfInput = Union[PdfSource, PdfDocument]
+
 
 def _mean_score(claims: List[Claim], key: str) -> float | None:
     values = [claim.scores[key] for claim in claims if key in claim.scores]
@@ -23,40 +35,98 @@ def _mean_score(claims: List[Claim], key: str) -> float | None:
     return round(sum(values) / len(values), 6)
 
 
-def _load_tex(tex_path: Path | None) -> tuple[PaperMetadata, List]:
-    if not tex_path:
+def _load_tex(tex_bytes: bytes | None) -> tuple[PaperMetadata, List]:
+    if not tex_bytes:
         return PaperMetadata(), []
-    tex_text = tex_path.read_text(encoding="utf-8", errors="ignore")
+    tex_text = tex_bytes.decode("utf-8", errors="ignore")
     metadata = extract_metadata_from_tex(tex_text)
     sections = parse_latex_sections(tex_text)
     return metadata, sections
 
 
-def _load_pdf(pdf_path: Path | None) -> List:
-    if not pdf_path:
-        return []
-    pages = extract_pdf_pages(str(pdf_path))
-    return sections_from_pdf(pages)
+def _iter_pdf_sections(pdf: PdfInput | None, workers: int = 1, backend: str | None = None) -> Iterator[Section]:
+    if pdf is None:
+        return iter(())
+    return iter_sections_from_pdf(iter_pdf_pages(pdf, workers=workers, backend=backend))
 
 
-def run_pipeline(
-    pdf_path: Path | None,
-    tex_path: Path | None,
+def _input_bytes(value: PdfInput | None) -> bytes | None:
+    if value is None or isinstance(value, bytes):
+        return value
+    if isinstance(value, PdfDocument):
+        return value.source if isinstance(value.source, bytes) else Path(value.source).read_bytes()
+    return Path(value).read_bytes()
+
+
+@dataclass
+class PageClaims:
+    """Claims extracted from one section (one page for PDFs), in document order."""
+
+    section: str
+    page: Optional[int]
+    claims: List[Claim]
+
+    def to_dict(self) -> Dict:
+        return {"section": self.section, "page": self.page, "claims": [c.to_dict() for c in self.claims]}
+
+
+ExtractionEvent = Union[PageClaims, ExtractionResult]
+
+
+def stream_pipeline(
+    pdf: PdfInput | None,
+    tex: Path | bytes | None,
     top_key_ideas: int,
     top_breakthroughs: int,
-) -> ExtractionResult:
-    metadata, tex_sections = _load_tex(tex_path)
-    pdf_sections = _load_pdf(pdf_path) if not tex_sections else []
+    cache: ExtractionCache | None = None,
+    pdf_workers: int = 1,
+    pdf_backend: str | None = None,
+) -> Iterator[ExtractionEvent]:
+    """Yield a ``PageClaims`` per section as it is parsed, then the ``ExtractionResult``.
+
+    PDFs are read one page at a time and key ideas/breakthroughs are kept as
+    running top-K selections, so page text never accumulates in memory.
+    ``pdf_workers > 1`` extracts page ranges in a process pool, and
+    ``pdf_backend`` picks the text extractor (see ``PDF_BACKENDS``).
+
+    ``pdf`` may be a path, the raw PDF bytes or an open ``PdfDocument``
+    (left open for the caller), and ``tex`` a path or the raw TeX bytes, so
+    uploads never need a temp file. The PDF backend is only
+    resolved when the PDF is actually parsed, i.e. when there are no TeX
+    sections, so papers with TeX need no PDF library.
+    """
+    pdf_bytes = _input_bytes(pdf)
+    tex_bytes = _input_bytes(tex)
+    digest = content_hash(pdf_bytes, tex_bytes)
+    metadata, tex_sections = _load_tex(tex_bytes)
 
-    sections = tex_sections or pdf_sections
+    if tex_sections:
+        pdf_backend = None
+    elif isinstance(pdf, PdfDocument):
+        pdf_backend = pdf.backend
+    elif pdf is not None:
+        pdf_backend = resolve_pdf_backend(pdf_backend)
+    cache_key = ExtractionCache.key(digest, top_key_ideas, top_breakthroughs, pdf_backend or "")
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            yield from replay_result(cached)
+            return
+
+    sections = iter(tex_sections) if tex_sections else _iter_pdf_sections(pdf, pdf_workers, pdf_backend)
     source = "tex" if tex_sections else "pdf"
 
     claims: List[Claim] = []
+    key_ideas = RunningTopK(top_key_ideas)
+    breakthroughs = RunningTopK(top_breakthroughs)
     for section in sections:
-        claims.extend(extract_claims(section.name, section.text, section.page, source))
-
-    key_ideas = select_key_ideas(claims, top_n=top_key_ideas)
-    breakthroughs = select_breakthroughs(claims, top_n=top_breakthroughs)
+        section_claims = extract_claims(section.name, section.text, section.page, source, section.page_breaks)
+        for claim in section_claims:
+            key_ideas.push(claim)
+            if classify_breakthrough(claim):
+                breakthroughs.push(claim)
+        claims.extend(section_claims)
+        yield PageClaims(section=section.name, page=section.page, claims=section_claims)
 
     leaderboard_fields = {
         "impact_score": None,
@@ -65,33 +135,323 @@ def run_pipeline(
         "evidence_score": _mean_score(claims, "evidence"),
     }
 
-    return ExtractionResult(
-        paper_id=str(uuid.uuid4()),
+    result = ExtractionResult(
+        paper_id=paper_id_for(digest),
         metadata=metadata,
-        key_ideas=key_ideas,
-        breakthroughs=breakthroughs,
+        key_ideas=key_ideas.items(),
+        breakthroughs=breakthroughs.items(),
         all_claims=claims,
         leaderboard_fields=leaderboard_fields,
     )
+    if cache is not None:
+        cache.put(cache_key, result)
+    yield result
+
+
+def replay_result(result: ExtractionResult) -> Iterator[ExtractionEvent]:
+    """Re-emit a finished (e.g. cached) result as ``stream_pipeline`` events."""
+    for (section, page), claims in groupby(result.all_claims, key=lambda claim: (claim.section, claim.page)):
+        yield PageClaims(section=section, page=page, claims=list(claims))
+    yield result
+
+
+def collect_result(events: Iterable[ExtractionEvent]) -> ExtractionResult:
+    result = None
+    for result in events:
+        pass
+    if not isinstance(result, ExtractionResult):
+        raise RuntimeError("Extraction stream ended without a result.")
+    return result
+
+
+def run_pipeline(
+    pdf: PdfInput | None,
+    tex: Path | bytes | None,
+    top_key_ideas: int,
+    top_breakthroughs: int,
+    cache: ExtractionCache | None = None,
+    pdf_workers: int = 1,
+    pdf_backend: str | None = None,
+) -> ExtractionResult:
+    return collect_result(
+        stream_pipeline(
+            pdf,
+            tex,
+            top_key_ideas,
+            top_breakthroughs,
+            cache=cache,
+            pdf_workers=pdf_workers,
+            pdf_backend=pdf_backend,
+        )
+    )
+
+
+def serialize_result(result: ExtractionResult, compact: bool = True) -> Dict:
+    """Compact layout by default; ``ExtractionResult.from_dict`` reads both."""
+    return result.to_compact_dict() if compact else result.to_dict()
+
+
+def load_result(path: Path) -> ExtractionResult:
+    return ExtractionResult.from_dict(loads(path.read_bytes()))
+
+
+@dataclass
+class BatchJob:
+    pdf_path: Optional[Path] = None
+    tex_path: Optional[Path] = None
+
+    def label(self) -> Dict[str, Optional[str]]:
+        return {
+            "pdf": str(self.pdf_path) if self.pdf_path else None,
+            "tex": str(self.tex_path) if self.tex_path else None,
+        }
+
+
+def jobs_from_dir(input_dir: Path) -> List[BatchJob]:
+    """Pair every PDF and TeX file in a directory by file stem."""
+    jobs: Dict[str, BatchJob] = {}
+    for path in sorted(input_dir.iterdir()):
+        suffix = path.suffix.lower()
+        if suffix == ".pdf":
+            jobs.setdefault(path.stem, BatchJob()).pdf_path = path
+        elif suffix == ".tex":
+            jobs.setdefault(path.stem, BatchJob()).tex_path = path
+    return list(jobs.values())
+
+
+def jobs_from_manifest(manifest_path: Path) -> List[BatchJob]:
+    """Read a JSONL manifest of ``{"pdf": ..., "tex": ...}`` objects.
+
+    Relative paths are resolved against the manifest's directory.
+    """
+    base = manifest_path.parent
+    jobs: List[BatchJob] = []
+    for line_no, line in enumerate(manifest_path.read_text(encoding="utf-8").splitlines(), start=1):
+        if not line.strip():
+            continue
+        entry = loads(line)
+        pdf = entry.get("pdf")
+        tex = entry.get("tex")
+        if not pdf and not tex:
+            raise ValueError(f"{manifest_path}:{line_no}: entry needs `pdf` and/or `tex`")
+        jobs.append(
+            BatchJob(
+                pdf_path=base / pdf if pdf else None,
+                tex_path=base / tex if tex else None,
+            )
+        )
+    return jobs
+
+
+def _run_batch_job(
+    job: BatchJob,
+    top_key_ideas: int,
+    top_breakthroughs: int,
+    cache: Optional[ExtractionCache] = None,
+    compact: bool = True,
+    pdf_backend: Optional[str] = None,
+) -> Dict:
+    try:
+        result = run_pipeline(
+            job.pdf_path,
+            job.tex_path,
+            top_key_ideas,
+            top_breakthroughs,
+            cache=cache,
+            pdf_backend=pdf_backend,
+        )
+    except Exception as exc:
+        return _failed_record(job, exc)
+    record: Dict = dict(job.label())
+    record["result"] = serialize_result(result, compact)
+    return record
+
+
+def _failed_record(job: BatchJob, exc: BaseException) -> Dict:
+    record: Dict = dict(job.label())
+    record["error"] = f"{type(exc).__name__}: {exc}"
+    return record
+
+
+def _run_isolated(job: BatchJob, *args) -> Dict:
+    # In a pool of its own, a worker crash can only be this job's.
+    with ProcessPoolExecutor(max_workers=1) as solo:
+        try:
+            return solo.submit(_run_batch_job, job, *args).result()
+        except BrokenProcessPool as exc:
+            return _failed_record(job, exc)
+
+
+def run_batch(
+    jobs: Iterable[BatchJob],
+    out_path: Path,
+    top_key_ideas: int,
+    top_breakthroughs: int,
+    workers: Optional[int] = None,
+    cache: Optional[ExtractionCache] = None,
+    compact: bool = True,
+    pdf_backend: Optional[str] = None,
+) -> Dict[str, int]:
+    """Extract many papers in a process pool, streaming JSONL as they finish.
+
+    Each output line holds the job's ``pdf``/``tex`` paths plus either
+    ``result`` or ``error``; a failing paper never aborts the batch. Each
+    worker resolves the PDF backend only for papers it parses from PDF, so
+    a missing PDF library fails just those papers. At most two jobs per
+    worker are submitted at a time, so memory stays flat however long
+    ``jobs`` is.
+
+    A worker process that dies (e.g. a crash inside a PDF library) breaks
+    the pool and fails every job in it. Those jobs are then rerun one at a
+    time, so only the paper that crashed is recorded as failed, and the
+    batch goes on in a fresh pool.
+    """
+    counts = {"ok": 0, "failed": 0}
+    window = 2 * (workers or os.cpu_count() or 1)
+    futures: Dict[Future, BatchJob] = {}
+    pool = ProcessPoolExecutor(max_workers=workers)
+
+    with out_path.open("wb") as out:
+
+        def write(record: Dict) -> None:
+            counts["failed" if "error" in record else "ok"] += 1
+            out.write(dumps_line(record))
+
+        def recover() -> None:
+            nonlocal pool
+            wait(futures)
+            suspects = []
+            for future, job in futures.items():
+                try:
+                    write(future.result())
+                except BrokenProcessPool:
+                    suspects.append(job)
+                except Exception as exc:
+                    write(_failed_record(job, exc))
+            futures.clear()
+            pool.shutdown()
+            for job in suspects:
+                write(_run_isolated(job, top_key_ideas, top_breakthroughs, cache, compact, pdf_backend))
+            out.flush()
+            pool = ProcessPoolExecutor(max_workers=workers)
+
+        def write_finished() -> None:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    record = future.result()
+                except BrokenProcessPool:
+                    recover()
+                    return
+                except Exception as exc:
+                    record = _failed_record(futures[future], exc)
+                del futures[future]
+                write(record)
+            out.flush()
+
+        def submit(job: BatchJob) -> None:
+            args = (job, top_key_ideas, top_breakthroughs, cache, compact, pdf_backend)
+            try:
+                future = pool.submit(_run_batch_job, *args)
+            except BrokenProcessPool:
+                recover()
+                future = pool.submit(_run_batch_job, *args)
+            futures[future] = job
+
+        try:
+            for job in jobs:
+                if len(futures) >= window:
+                    write_finished()
+                submit(job)
+            while futures:
+                write_finished()
+        finally:
+            pool.shutdown(cancel_futures=True)
+    return counts
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Extract key ideas and breakthroughs from neuroscience papers.")
     parser.add_argument("--pdf", type=Path, help="Path to paper PDF")
     parser.add_argument("--tex", type=Path, help="Path to main LaTeX source")
-    parser.add_argument("--out", type=Path, default=Path("extraction.json"), help="Output JSON path")
+    parser.add_argument("--input-dir", type=Path, help="Batch mode: extract every PDF/TeX pair (matched by stem) in a directory")
+    parser.add_argument("--manifest", type=Path, help="Batch mode: JSONL file of {\"pdf\": ..., \"tex\": ...} entries")
+    parser.add_argument("--workers", type=int, help="Batch mode: worker process count (default: CPU count)")
+    parser.add_argument(
+        "--out",
+        type=Path,
+        help="Output JSON path (default extraction.json), or JSONL in batch mode (default extractions.jsonl)",
+    )
+    parser.add_argument(
+        "--pdf-workers",
+        type=int,
+        default=1,
+        help="Processes used to extract PDF page text in parallel (single-paper mode)",
+    )
+    parser.add_argument(
+        "--pdf-backend",
+        choices=["auto", *PDF_BACKENDS],
+        help="PDF text extractor (default: $AGENTSCIENCE_PDF_BACKEND or auto, which prefers pymupdf)",
+    )
     parser.add_argument("--report", type=Path, default=Path("report.md"), help="Output markdown report path")
     parser.add_argument("--top-key-ideas", type=int, default=5)
     parser.add_argument("--top-breakthroughs", type=int, default=3)
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        help="Extraction cache database (default: $AGENTSCIENCE_CACHE_PATH or ~/.cache/agentscience)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Always re-extract; neither read nor write the cache")
+    parser.add_argument(
+        "--legacy-output",
+        action="store_true",
+        help="Write the verbose layout with evidence repeated under every claim instead of the compact layout",
+    )
+    parser.add_argument("--pretty", action="store_true", help="Indent the JSON output (default: compact, one line)")
 
     args = parser.parse_args()
 
+    if args.no_cache:
+        cache = None
+    elif args.cache:
+        cache = ExtractionCache(args.cache)
+    else:
+        cache = default_cache()
+
+    if args.input_dir or args.manifest:
+        if args.pdf or args.tex:
+            raise SystemExit("--pdf/--tex cannot be combined with --input-dir/--manifest")
+        jobs = jobs_from_dir(args.input_dir) if args.input_dir else []
+        if args.manifest:
+            jobs.extend(jobs_from_manifest(args.manifest))
+        counts = run_batch(
+            jobs,
+            args.out or Path("extractions.jsonl"),
+            args.top_key_ideas,
+            args.top_breakthroughs,
+            workers=args.workers,
+            cache=cache,
+            compact=not args.legacy_output,
+            pdf_backend=args.pdf_backend,
+        )
+        print(f"Extracted {counts['ok']} papers, {counts['failed']} failed.")
+        return
+
     if not args.pdf and not args.tex:
-        raise SystemExit("Provide --pdf and/or --tex")
+        raise SystemExit("Provide --pdf and/or --tex, or --input-dir/--manifest")
 
-    result = run_pipeline(args.pdf, args.tex, args.top_key_ideas, args.top_breakthroughs)
+    result = run_pipeline(
+        args.pdf,
+        args.tex,
+        args.top_key_ideas,
+        args.top_breakthroughs,
+        cache=cache,
+        pdf_workers=args.pdf_workers,
+        pdf_backend=args.pdf_backend,
+    )
 
-    args.out.write_text(json.dumps(result.to_dict(), indent=2), encoding="utf-8")
+    out_path = args.out or Path("extraction.json")
+    out_path.write_bytes(dumps(serialize_result(result, not args.legacy_output), pretty=args.pretty))
     args.report.write_text(render_report(result), encoding="utf-8")
 
 
@@ -0,0 +1,53 @@
+"""JSON encoding for CLI and API output.
+
+``orjson`` is used when installed and the standard library otherwise; both
+paths produce the same documents. Output is compact by default since most
+consumers are machines, and ``pretty=True`` gives two-space indentation.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# Set AGENTSCIENCE_JSON=stdlib to bypass orjson even when it is installed.
+JSON_BACKEND = "orjson" if orjson is not None and os.environ.get("AGENTSCIENCE_JSON") != "stdlib" else "stdlib"
+
+_ORJSON_OPTIONS = 0 if orjson is None else orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    # numpy scalars and arrays reach the stdlib encoder from the leaderboard.
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any, pretty: bool = False, backend: str = "") -> bytes:
+    """Encode ``value`` as UTF-8 JSON bytes."""
+    if (backend or JSON_BACKEND) == "orjson":
+        if orjson is None:
+            raise ImportError("orjson is not installed. Install with: pip install orjson")
+        return orjson.dumps(value, option=_ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if pretty else 0))
+    if pretty:
+        text = json.dumps(value, indent=2, ensure_ascii=False, default=_default)
+    else:
+        text = json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=_default)
+    return text.encode("utf-8")
+
+
+def dumps_line(value: Any) -> bytes:
+    """One NDJSON/JSONL record, newline included."""
+    return dumps(value) + b"\n"
+
+
+def loads(data: Any) -> Any:
+    if JSON_BACKEND == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
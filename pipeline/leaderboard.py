@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import heapq
+from array import array
 from dataclasses import dataclass, field
-from math import log1p
-from typing import Dict, List, Optional
+from math import log1p, nan
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 DEFAULT_EDGE_WEIGHTS: Dict[str, float] = {
@@ -16,6 +19,24 @@ DEFAULT_IMPACT_WEIGHTS: Dict[str, float] = {
     "novelty": 0.1,
 }
 
+PAGERANK_ENGINES = ("auto", "python", "numpy")
+
+CITATION_POLICIES = ("max", "mean")
+CITATION_SOURCES = ("openalex", "semantic_scholar", "scholar_csv")
+# Citation counts at or above this give the full citation signal.
+CITATION_SIGNAL_CAP = 10000
+
+LEADERBOARD_FIELDS = (
+    "paper_id",
+    "title",
+    "doi",
+    "pagerank_score",
+    "novelty_score",
+    "evidence_score",
+    "impact_score",
+    "citations",
+)
+
 
 @dataclass
 class CitationCounts:
@@ -65,87 +86,228 @@ def compute_impact_leaderboard(
     damping: float = 0.85,
     iterations: int = 80,
     tolerance: float = 1e-9,
+    engine: str = "auto",
+    top_k: Optional[int] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    fields: Optional[Sequence[str]] = None,
 ) -> List[Dict]:
+    """Rank papers by weighted PageRank blended with evidence and novelty.
+
+    ``engine`` selects the PageRank implementation: ``"numpy"`` runs a sparse
+    vectorized power iteration (using scipy.sparse when installed),
+    ``"python"`` is the pure-Python reference, and ``"auto"`` picks numpy
+    when it is importable.
+
+    ``top_k`` caps the ranking to its best entries and ``offset``/``limit``
+    page through it; only the returned rows are selected (by heap, not a
+    full sort) and built. ``fields`` restricts each row to a subset of
+    ``LEADERBOARD_FIELDS``.
+    """
     if not papers:
         return []
 
     edge_weights = edge_weights or DEFAULT_EDGE_WEIGHTS
     impact_weights = impact_weights or DEFAULT_IMPACT_WEIGHTS
     _validate_impact_weights(impact_weights)
+    _validate_page(top_k, offset, limit)
+    _resolve_fields(fields)
+    engine = _resolve_engine(engine)
 
     paper_ids = [paper.paper_id for paper in papers]
-    priors = _build_priors(papers, citation_policy)
-    graph = _build_weighted_graph(papers, edges, edge_weights)
-    pagerank = _weighted_pagerank(
+    citations = resolve_citations(papers, citation_policy, vectorized=engine == "numpy")
+    priors = _build_priors(papers, citations)
+    pagerank = _compute_pagerank(
         paper_ids=paper_ids,
-        graph=graph,
+        edges=edges,
+        edge_weights=edge_weights,
         priors=priors,
         damping=damping,
         iterations=iterations,
         tolerance=tolerance,
+        engine=engine,
+    )
+    return _rank_papers(
+        papers,
+        pagerank,
+        citation_policy,
+        impact_weights,
+        top_k=top_k,
+        offset=offset,
+        limit=limit,
+        fields=fields,
+        citations=citations,
     )
 
+
+def _compute_pagerank(
+    paper_ids: List[str],
+    edges: List[InfluenceEdge],
+    edge_weights: Dict[str, float],
+    priors: Dict[str, float],
+    damping: float,
+    iterations: int,
+    tolerance: float,
+    engine: str,
+    initial: Optional[Dict[str, float]] = None,
+) -> Dict[str, float]:
+    if engine == "numpy":
+        return _weighted_pagerank_numpy(
+            paper_ids=paper_ids,
+            edges=_build_edge_arrays(paper_ids, edges, edge_weights),
+            priors=priors,
+            damping=damping,
+            iterations=iterations,
+            tolerance=tolerance,
+            initial=initial,
+        )
+    return _weighted_pagerank(
+        paper_ids=paper_ids,
+        graph=_build_weighted_graph(paper_ids, edges, edge_weights),
+        priors=priors,
+        damping=damping,
+        iterations=iterations,
+        tolerance=tolerance,
+        initial=initial,
+    )
+
+
+def _rank_papers(
+    papers: Iterable[LeaderboardPaper],
+    pagerank: Dict[str, float],
+    citation_policy: str,
+    impact_weights: Dict[str, float],
+    top_k: Optional[int] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    fields: Optional[Sequence[str]] = None,
+    citations: Optional[ResolvedCitations] = None,
+) -> List[Dict]:
+    """``citations`` are the precomputed counts for ``papers``; without them
+    only the returned rows are resolved."""
+    papers = list(papers)
+    _validate_page(top_k, offset, limit)
+    selected_fields = _resolve_fields(fields)
+
     max_pr = max(pagerank.values()) if pagerank else 1.0
     if max_pr <= 0.0:
         max_pr = 1.0
 
-    ranked: List[Dict] = []
-    for paper in papers:
-        pr_norm = pagerank.get(paper.paper_id, 0.0) / max_pr
-        novelty = _clamp01(paper.novelty_score)
-        evidence = _clamp01(paper.evidence_score)
-        direct_citations = resolve_citation_count(paper.citations, citation_policy)
-        inherited_citations = resolve_inherited_citations(
-            paper.reference_citations,
+    # Scoring is cheap; only the rows actually returned get an output dict.
+    pr_norms = [pagerank.get(paper.paper_id, 0.0) / max_pr for paper in papers]
+    scores = [
+        _impact_score(pr_norm, paper.evidence_score, paper.novelty_score, impact_weights)
+        for paper, pr_norm in zip(papers, pr_norms)
+    ]
+
+    return [
+        _paper_row(
+            papers[index],
+            pr_norms[index],
+            scores[index],
             citation_policy,
-            paper.reference_weights,
+            selected_fields,
+            None if citations is None else citations.counts(index),
         )
-        effective_citations = direct_citations if direct_citations > 0 else inherited_citations
+        for index in _page_indices(scores, top_k, offset, limit)
+    ]
+
 
-        impact = (
+def _impact_score(pr_norm: float, evidence: float, novelty: float, impact_weights: Dict[str, float]) -> float:
+    return round(
+        _clamp01(
             impact_weights["pagerank"] * pr_norm
-            + impact_weights["evidence"] * evidence
-            + impact_weights["novelty"] * novelty
-        )
+            + impact_weights["evidence"] * _clamp01(evidence)
+            + impact_weights["novelty"] * _clamp01(novelty)
+        ),
+        6,
+    )
 
-        ranked.append(
-            {
-                "paper_id": paper.paper_id,
-                "title": paper.title,
-                "doi": paper.doi,
-                "pagerank_score": round(pr_norm, 6),
-                "novelty_score": round(novelty, 6),
-                "evidence_score": round(evidence, 6),
-                "impact_score": round(_clamp01(impact), 6),
-                "citations": {
-                    "resolved": effective_citations,
-                    "direct": direct_citations,
-                    "inherited": inherited_citations,
-                    "openalex": paper.citations.openalex,
-                    "semantic_scholar": paper.citations.semantic_scholar,
-                    "scholar_csv": paper.citations.scholar_csv,
-                },
-            }
-        )
 
-    ranked.sort(key=lambda item: item["impact_score"], reverse=True)
-    return ranked
+def _page_indices(scores: Sequence[float], top_k: Optional[int], offset: int, limit: Optional[int]) -> List[int]:
+    """Indices of the requested page of ``scores``, best first."""
+    stop = len(scores) if top_k is None else min(top_k, len(scores))
+    if limit is not None:
+        stop = min(stop, offset + limit)
+    if offset >= stop:
+        return []
+    order = range(len(scores))
+    if stop < len(scores):
+        # heapq.nlargest is stable, so ties keep input order exactly like the full sort.
+        selected = heapq.nlargest(stop, order, key=scores.__getitem__)
+    else:
+        selected = sorted(order, key=scores.__getitem__, reverse=True)
+    return selected[offset:stop]
 
 
-def _build_priors(papers: List[LeaderboardPaper], citation_policy: str) -> Dict[str, float]:
-    raw: Dict[str, float] = {}
-    for paper in papers:
-        direct_citations = resolve_citation_count(paper.citations, citation_policy)
-        inherited_citations = resolve_inherited_citations(
-            paper.reference_citations,
-            citation_policy,
-            paper.reference_weights,
+def _validate_page(top_k: Optional[int], offset: int, limit: Optional[int]) -> None:
+    if offset < 0:
+        raise ValueError("offset must be >= 0.")
+    if (top_k is not None and top_k < 0) or (limit is not None and limit < 0):
+        raise ValueError("top_k and limit must be >= 0.")
+
+
+def _resolve_fields(fields: Optional[Sequence[str]]) -> Tuple[str, ...]:
+    if fields is None:
+        return LEADERBOARD_FIELDS
+    unknown = [name for name in fields if name not in LEADERBOARD_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown leaderboard fields: {unknown}")
+    return tuple(name for name in LEADERBOARD_FIELDS if name in fields)
+
+
+def _paper_row(
+    paper: LeaderboardPaper,
+    pr_norm: float,
+    impact: float,
+    citation_policy: str,
+    fields: Tuple[str, ...],
+    counts: Optional[Tuple[int, int]] = None,
+) -> Dict:
+    row: Dict = {}
+    for name in fields:
+        if name == "paper_id":
+            row[name] = paper.paper_id
+        elif name == "title":
+            row[name] = paper.title
+        elif name == "doi":
+            row[name] = paper.doi
+        elif name == "pagerank_score":
+            row[name] = round(pr_norm, 6)
+        elif name == "novelty_score":
+            row[name] = round(_clamp01(paper.novelty_score), 6)
+        elif name == "evidence_score":
+            row[name] = round(_clamp01(paper.evidence_score), 6)
+        elif name == "impact_score":
+            row[name] = impact
+        elif name == "citations":
+            row[name] = _citation_summary(paper, citation_policy, counts)
+    return row
+
+
+def _citation_summary(paper: LeaderboardPaper, citation_policy: str, counts: Optional[Tuple[int, int]] = None) -> Dict:
+    """``counts`` is the precomputed ``(direct, inherited)`` pair, if any."""
+    if counts is None:
+        counts = (
+            resolve_citation_count(paper.citations, citation_policy),
+            resolve_inherited_citations(paper.reference_citations, citation_policy, paper.reference_weights),
         )
-        citation_count = direct_citations if direct_citations > 0 else inherited_citations
-        citation_signal = _citation_signal(citation_count)
-        novelty = _clamp01(paper.novelty_score)
-        evidence = _clamp01(paper.evidence_score)
-        raw[paper.paper_id] = 0.6 * citation_signal + 0.25 * evidence + 0.15 * novelty
+    direct_citations, inherited_citations = counts
+    return {
+        "resolved": direct_citations if direct_citations > 0 else inherited_citations,
+        "direct": direct_citations,
+        "inherited": inherited_citations,
+        "openalex": paper.citations.openalex,
+        "semantic_scholar": paper.citations.semantic_scholar,
+        "scholar_csv": paper.citations.scholar_csv,
+    }
+
+
+def _build_priors(papers: List[LeaderboardPaper], citations: ResolvedCitations) -> Dict[str, float]:
+    raw: Dict[str, float] = {
+        paper.paper_id: _prior_from_signal(signal, paper.novelty_score, paper.evidence_score)
+        for paper, signal in zip(papers, citations.signal)
+    }
 
     total = sum(raw.values())
     if total <= 0:
@@ -154,9 +316,28 @@ def _build_priors(papers: List[LeaderboardPaper], citation_policy: str) -> Dict[
     return {paper_id: score / total for paper_id, score in raw.items()}
 
 
+def _raw_prior(paper: LeaderboardPaper, citation_policy: str) -> float:
+    direct_citations = resolve_citation_count(paper.citations, citation_policy)
+    inherited_citations = resolve_inherited_citations(
+        paper.reference_citations,
+        citation_policy,
+        paper.reference_weights,
+    )
+    return _prior_score(direct_citations, inherited_citations, paper.novelty_score, paper.evidence_score)
+
+
+def _prior_score(direct_citations: int, inherited_citations: int, novelty: float, evidence: float) -> float:
+    citation_count = direct_citations if direct_citations > 0 else inherited_citations
+    return _prior_from_signal(_citation_signal(citation_count), novelty, evidence)
+
+
+def _prior_from_signal(citation_signal: float, novelty: float, evidence: float) -> float:
+    return 0.6 * citation_signal + 0.25 * _clamp01(evidence) + 0.15 * _clamp01(novelty)
+
+
 def _citation_signal(citation_count: int) -> float:
     # Log scaling avoids domination by very old or highly cited outliers.
-    return _clamp01(log1p(max(0, citation_count)) / log1p(10000))
+    return _clamp01(log1p(max(0, citation_count)) / log1p(CITATION_SIGNAL_CAP))
 
 
 def resolve_inherited_citations(
@@ -191,13 +372,131 @@ def _normalize_reference_weights(values: List[int], weights: Optional[List[float
     return normalized
 
 
+@dataclass
+class ResolvedCitations:
+    """Citation counts for a list of papers, resolved once and shared by
+    prior construction and output rows.
+
+    ``effective`` is the direct count, or the inherited one for papers with
+    no direct citations, and ``signal`` is its log-scaled prior input.
+    """
+
+    direct: List[int]
+    inherited: List[int]
+    effective: List[int]
+    signal: List[float]
+
+    @classmethod
+    def from_counts(cls, direct: Sequence[int], inherited: Sequence[int], vectorized: bool = False) -> ResolvedCitations:
+        if vectorized:
+            import numpy as np  # type: ignore
+
+            direct_array = np.asarray(direct, dtype=np.int64)
+            inherited_array = np.asarray(inherited, dtype=np.int64)
+            effective = np.where(direct_array > 0, direct_array, inherited_array)
+            # Few distinct counts occur, and scoring them with math.log1p keeps
+            # the signal bit-identical to the per-paper path (np.log1p can
+            # differ in the last ulp).
+            unique, inverse = np.unique(effective, return_inverse=True)
+            table = np.array([_citation_signal(count) for count in unique.tolist()], dtype=np.float64)
+            signal = table[inverse]
+            return cls(direct_array.tolist(), inherited_array.tolist(), effective.tolist(), signal.tolist())
+
+        effective = [d if d > 0 else i for d, i in zip(direct, inherited)]
+        return cls(list(direct), list(inherited), effective, [_citation_signal(count) for count in effective])
+
+    def counts(self, index: int) -> Tuple[int, int]:
+        return self.direct[index], self.inherited[index]
+
+
+def resolve_citations(
+    papers: Sequence[LeaderboardPaper],
+    citation_policy: str = "max",
+    vectorized: bool = False,
+) -> ResolvedCitations:
+    """Resolve every paper's direct and inherited citations in one pass.
+
+    Gives the same counts as calling ``resolve_citation_count`` and
+    ``resolve_inherited_citations`` per paper. With ``vectorized`` all
+    counts, references and weights are gathered into numpy arrays once and
+    resolved with array operations (needs numpy).
+    """
+    if citation_policy not in CITATION_POLICIES:
+        raise ValueError(f"Unsupported citation policy: {citation_policy}")
+    if vectorized:
+        import numpy as np  # type: ignore
+
+        direct, inherited = _resolve_citations_numpy(np, papers, citation_policy)
+    else:
+        direct = [resolve_citation_count(paper.citations, citation_policy) for paper in papers]
+        inherited = [
+            resolve_inherited_citations(paper.reference_citations, citation_policy, paper.reference_weights)
+            for paper in papers
+        ]
+    return ResolvedCitations.from_counts(direct, inherited, vectorized)
+
+
+def _resolve_citations_numpy(np, papers: Sequence[LeaderboardPaper], citation_policy: str):
+    n = len(papers)
+    direct = _resolve_count_matrix(np, _citation_matrix(np, [paper.citations for paper in papers]), citation_policy)
+
+    # Flatten every paper's references into one table, tagged with the owning paper.
+    owners: List[int] = []
+    references: List[CitationCounts] = []
+    weights: List[Optional[float]] = []
+    for index, paper in enumerate(papers):
+        if not paper.reference_citations:
+            continue
+        count = len(paper.reference_citations)
+        if paper.reference_weights is None:
+            weights.extend([1.0] * count)
+        elif len(paper.reference_weights) != count:
+            raise ValueError("reference_weights length must match reference_citations length.")
+        else:
+            weights.extend(paper.reference_weights)
+        owners.extend([index] * count)
+        references.extend(paper.reference_citations)
+
+    # None weights become NaN here and count as 0, like _normalize_reference_weights.
+    weight = np.array(weights, dtype=np.float64)
+    weight = np.where(np.isnan(weight), 0.0, np.maximum(weight, 0.0))
+    resolved = _resolve_count_matrix(np, _citation_matrix(np, references), citation_policy)
+    owner = np.asarray(owners, dtype=np.int64)
+    weight_total = np.bincount(owner, weights=weight, minlength=n)
+    weighted_sum = np.bincount(owner, weights=resolved * weight, minlength=n)
+    has_weight = weight_total > 0
+    inherited = np.where(has_weight, np.rint(weighted_sum / np.where(has_weight, weight_total, 1.0)), 0.0)
+    return direct.astype(np.int64), inherited.astype(np.int64)
+
+
+def _citation_matrix(np, citations: Sequence[CitationCounts]):
+    """One row per ``CitationCounts``, one column per source; missing counts are NaN."""
+    matrix = np.empty((len(citations), len(CITATION_SOURCES)), dtype=np.float64)
+    for column, source in enumerate(CITATION_SOURCES):
+        # Filling column by column from a generator avoids a list of row tuples.
+        values = map(attrgetter(source), citations)
+        matrix[:, column] = np.fromiter(
+            (nan if value is None else value for value in values), dtype=np.float64, count=len(citations)
+        )
+    return matrix
+
+
+def _resolve_count_matrix(np, matrix, citation_policy: str):
+    """Vectorized ``resolve_citation_count`` over the rows of ``_citation_matrix``."""
+    present = ~np.isnan(matrix)
+    values = np.where(present, np.maximum(np.trunc(matrix), 0.0), 0.0)
+    if citation_policy == "max":
+        return values.max(axis=1, initial=0.0)
+    return np.rint(values.sum(axis=1) / np.maximum(present.sum(axis=1), 1))
+
+
 def _build_weighted_graph(
-    papers: List[LeaderboardPaper],
+    paper_ids: List[str],
     edges: List[InfluenceEdge],
     edge_weights: Dict[str, float],
 ) -> Dict[str, Dict[str, float]]:
-    valid_ids = {paper.paper_id for paper in papers}
-    graph: Dict[str, Dict[str, float]] = {paper.paper_id: {} for paper in papers}
+    valid_ids = set(paper_ids)
+    graph: Dict[str, Dict[str, float]] = {paper_id: {} for paper_id in paper_ids}
 
     for edge in edges:
         if edge.source_id not in valid_ids or edge.target_id not in valid_ids:
@@ -205,9 +504,7 @@ def _build_weighted_graph(
         if edge.source_id == edge.target_id:
             continue
 
-        base = edge_weights.get(edge.kind, edge_weights.get("llm_inferred", 0.3))
-        confidence = _clamp01(edge.confidence)
-        weight = max(0.0, base) * max(0.05, confidence)
+        weight = _edge_weight(edge, edge_weights)
         if weight <= 0:
             continue
 
@@ -223,13 +520,14 @@ def _weighted_pagerank(
     damping: float,
     iterations: int,
     tolerance: float,
+    initial: Optional[Dict[str, float]] = None,
 ) -> Dict[str, float]:
     n = len(paper_ids)
     if n == 0:
         return {}
 
     damping = min(max(damping, 0.01), 0.99)
-    rank = {paper_id: 1.0 / n for paper_id in paper_ids}
+    rank = _start_vector(paper_ids, initial)
 
     for _ in range(iterations):
         next_rank = {paper_id: (1.0 - damping) * priors.get(paper_id, 0.0) for paper_id in paper_ids}
@@ -260,6 +558,139 @@ def _weighted_pagerank(
     return rank
 
 
+def _start_vector(paper_ids: List[str], initial: Optional[Dict[str, float]]) -> Dict[str, float]:
+    """Uniform start, or a warm start from a previous solution renormalized to sum to 1."""
+    n = len(paper_ids)
+    if initial:
+        rank = {paper_id: max(0.0, initial.get(paper_id, 0.0)) for paper_id in paper_ids}
+        total = sum(rank.values())
+        if total > 0:
+            return {paper_id: value / total for paper_id, value in rank.items()}
+    return {paper_id: 1.0 / n for paper_id in paper_ids}
+
+
+def _resolve_engine(engine: str) -> str:
+    if engine not in PAGERANK_ENGINES:
+        raise ValueError(f"Unsupported PageRank engine: {engine}")
+    if engine != "auto":
+        return engine
+    try:
+        import numpy  # type: ignore  # noqa: F401
+    except ImportError:
+        return "python"
+    return "numpy"
+
+
+def _edge_weight(edge: InfluenceEdge, edge_weights: Dict[str, float]) -> float:
+    return _kind_weight(edge.kind, edge.confidence, edge_weights)
+
+
+def _kind_weight(kind: str, confidence: float, edge_weights: Dict[str, float]) -> float:
+    base = edge_weights.get(kind, edge_weights.get("llm_inferred", 0.3))
+    return max(0.0, base) * max(0.05, _clamp01(confidence))
+
+
+def _build_edge_arrays(
+    paper_ids: List[str],
+    edges: List[InfluenceEdge],
+    edge_weights: Dict[str, float],
+) -> Tuple[List[int], List[int], List[float]]:
+    """Integer-indexed ``(sources, targets, weights)`` with the same filtering as ``_build_weighted_graph``."""
+    index = {paper_id: position for position, paper_id in enumerate(paper_ids)}
+    sources: List[int] = []
+    targets: List[int] = []
+    weights: List[float] = []
+    for edge in edges:
+        source = index.get(edge.source_id)
+        target = index.get(edge.target_id)
+        if source is None or target is None or source == target:
+            continue
+        weight = _edge_weight(edge, edge_weights)
+        if weight <= 0:
+            continue
+        sources.append(source)
+        targets.append(target)
+        weights.append(weight)
+    return sources, targets, weights
+
+
+def _weighted_pagerank_numpy(
+    paper_ids: List[str],
+    edges: Tuple[List[int], List[int], List[float]],
+    priors: Dict[str, float],
+    damping: float,
+    iterations: int,
+    tolerance: float,
+    initial: Optional[Dict[str, float]] = None,
+) -> Dict[str, float]:
+    try:
+        import numpy as np  # type: ignore
+    except ImportError as exc:
+        raise ImportError("The numpy PageRank engine requires `numpy`.") from exc
+
+    if not paper_ids:
+        return {}
+
+    prior = np.array([priors.get(paper_id, 0.0) for paper_id in paper_ids], dtype=np.float64)
+    start = _start_vector(paper_ids, initial)
+    rank = np.array([start[paper_id] for paper_id in paper_ids], dtype=np.float64)
+    rank = _pagerank_vector(np, edges, prior, rank, damping, iterations, tolerance)
+    return dict(zip(paper_ids, rank.tolist()))
+
+
+def _pagerank_vector(np, edges, prior, rank, damping: float, iterations: int, tolerance: float):
+    """Power iteration over index arrays; ``prior`` and the start ``rank`` are float64 vectors."""
+    n = len(prior)
+    damping = min(max(damping, 0.01), 0.99)
+    sources = np.asarray(edges[0], dtype=np.int64)
+    targets = np.asarray(edges[1], dtype=np.int64)
+    weights = np.asarray(edges[2], dtype=np.float64)
+
+    # Row-normalize once: each edge carries its share of the source's out-weight.
+    out_weight = np.bincount(sources, weights=weights, minlength=n)
+    sinks = out_weight <= 0
+    transition = _column_stochastic(np, sources, targets, weights / out_weight[sources], n)
+
+    teleport = (1.0 - damping) * prior
+    for _ in range(iterations):
+        next_rank = teleport + damping * transition(rank)
+        sink_mass = damping * rank[sinks].sum()
+        if sink_mass > 0:
+            next_rank += sink_mass * prior
+
+        delta = np.abs(next_rank - rank).sum()
+        rank = next_rank
+        if delta <= tolerance:
+            break
+
+    total = rank.sum()
+    if total > 0:
+        rank = rank / total
+    return rank
+
+
+def _column_stochastic(np, sources, targets, shares, n: int):
+    """Return ``rank -> rank propagated along edges``.
+
+    Uses a CSR matrix when scipy is installed, otherwise a weighted bincount
+    over the edge arrays.
+    """
+    try:
+        from scipy.sparse import csr_matrix  # type: ignore
+    except ImportError:
+        csr_matrix = None
+
+    if csr_matrix is not None:
+        # Rows are targets, so one sparse mat-vec gathers all incoming mass.
+        matrix = csr_matrix((shares, (targets, sources)), shape=(n, n))
+        return matrix.dot
+
+    def propagate(rank):
+        return np.bincount(targets, weights=shares * rank[sources], minlength=n)
+
+    return propagate
+
+
 def _validate_impact_weights(impact_weights: Dict[str, float]) -> None:
     required = {"pagerank", "evidence", "novelty"}
     missing = required.difference(impact_weights.keys())
@@ -274,3 +705,513 @@ def _validate_impact_weights(impact_weights: Dict[str, float]) -> None:
 
 def _clamp01(value: float) -> float:
     return max(0.0, min(1.0, float(value)))
+
+
+class IncrementalLeaderboard:
+    """Leaderboard that keeps its graph and PageRank solution between updates.
+
+    PageRank with sink mass sent back to the priors equals the normalized
+    solution ``z / sum(z)`` of the linear system
+    ``z = (1 - d) * q + d * P^T z``, where ``q`` are the unnormalized priors
+    and sinks simply drop their mass. Every update (new paper, removed edge,
+    ...) perturbs that system only around the touched nodes, so instead of
+    re-running the power iteration the stored ``z`` is repaired by forward
+    push: residual mass is pushed along out-edges until no node holds more
+    than ``push_tolerance * sum(z)``. If a repair would need more than
+    ``max_pushes`` pushes, the full engine re-converges from the previous
+    solution instead.
+    """
+
+    def __init__(
+        self,
+        papers: Iterable[LeaderboardPaper] = (),
+        edges: Iterable[InfluenceEdge] = (),
+        citation_policy: str = "max",
+        edge_weights: Optional[Dict[str, float]] = None,
+        impact_weights: Optional[Dict[str, float]] = None,
+        damping: float = 0.85,
+        iterations: int = 80,
+        tolerance: float = 1e-9,
+        engine: str = "auto",
+        push_tolerance: float = 1e-8,
+        max_pushes: Optional[int] = None,
+    ) -> None:
+        self.citation_policy = citation_policy
+        self.edge_weights = edge_weights or DEFAULT_EDGE_WEIGHTS
+        self.impact_weights = impact_weights or DEFAULT_IMPACT_WEIGHTS
+        _validate_impact_weights(self.impact_weights)
+        self.damping = min(max(damping, 0.01), 0.99)
+        self.iterations = iterations
+        self.tolerance = tolerance
+        self.engine = _resolve_engine(engine)
+        self.push_tolerance = push_tolerance
+        self.max_pushes = max_pushes
+        self.pushes = 0
+        self.rebuilds = 0
+
+        self._papers: Dict[str, LeaderboardPaper] = {}
+        self._raw: Dict[str, float] = {}
+        self._positive_priors = 0
+        self._out: Dict[str, Dict[str, float]] = {}
+        self._out_total: Dict[str, float] = {}
+        self._in: Dict[str, set] = {}
+        self._z: Dict[str, float] = {}
+        self._z_total = 0.0
+        self._residual: Dict[str, float] = {}
+        self._queue: Dict[str, None] = {}
+
+        for paper in papers:
+            self._insert_paper(paper)
+        for edge in edges:
+            self._insert_edge(edge)
+        self._rebuild()
+
+    def __len__(self) -> int:
+        return len(self._papers)
+
+    # -- updates -----------------------------------------------------------
+
+    def update(
+        self,
+        add_papers: Iterable[LeaderboardPaper] = (),
+        add_edges: Iterable[InfluenceEdge] = (),
+        remove_edges: Iterable[InfluenceEdge] = (),
+        remove_papers: Iterable[str] = (),
+    ) -> None:
+        """Apply a batch of changes in the order listed, then re-converge once.
+
+        Adding a paper that already exists replaces its metadata and scores.
+        Edges with unknown endpoints, self-loops or zero weight are ignored,
+        as in ``compute_impact_leaderboard``.
+        """
+        regime = self._positive_priors > 0
+        for paper in add_papers:
+            self._apply_add_paper(paper)
+        for edge in add_edges:
+            self._apply_add_edge(edge)
+        for edge in remove_edges:
+            self._apply_remove_edge(edge)
+        for paper_id in remove_papers:
+            self._apply_remove_paper(paper_id)
+
+        if not self._papers or (self._positive_priors > 0) != regime:
+            # Switching between citation-based and uniform priors changes
+            # every node's source term at once.
+            self._rebuild()
+            return
+        self._converge()
+
+    def add_paper(self, paper: LeaderboardPaper) -> None:
+        self.update(add_papers=[paper])
+
+    def remove_paper(self, paper_id: str) -> None:
+        self.update(remove_papers=[paper_id])
+
+    def add_edge(self, edge: InfluenceEdge) -> bool:
+        """Add an edge; returns False if it is ignored."""
+        accepted = self._valid_edge_weight(edge) > 0
+        self.update(add_edges=[edge])
+        return accepted
+
+    def remove_edge(self, edge: InfluenceEdge) -> bool:
+        """Remove one previously added edge with the same endpoints, kind and confidence."""
+        accepted = self._valid_edge_weight(edge) > 0 and edge.target_id in self._out.get(edge.source_id, {})
+        self.update(remove_edges=[edge])
+        return accepted
+
+    def _apply_add_paper(self, paper: LeaderboardPaper) -> None:
+        if paper.paper_id in self._papers:
+            old_prior = self._prior(paper.paper_id)
+            self._set_raw(paper.paper_id, _raw_prior(paper, self.citation_policy))
+            self._papers[paper.paper_id] = paper
+        else:
+            old_prior = 0.0
+            self._insert_paper(paper)
+            self._z[paper.paper_id] = 0.0
+        self._add_residual(paper.paper_id, (1.0 - self.damping) * (self._prior(paper.paper_id) - old_prior))
+
+    def _apply_remove_paper(self, paper_id: str) -> None:
+        if paper_id not in self._papers:
+            raise KeyError(paper_id)
+        for source in list(self._in[paper_id]):
+            row = dict(self._out[source])
+            del row[paper_id]
+            self._replace_row(source, row)
+        self._replace_row(paper_id, {})
+
+        self._set_raw(paper_id, 0.0)
+        del self._papers[paper_id], self._raw[paper_id], self._out[paper_id]
+        del self._out_total[paper_id], self._in[paper_id]
+        self._z_total -= self._z.pop(paper_id)
+        self._residual.pop(paper_id, None)
+        self._queue.pop(paper_id, None)
+
+    def _apply_add_edge(self, edge: InfluenceEdge) -> None:
+        weight = self._valid_edge_weight(edge)
+        if weight <= 0:
+            return
+        row = dict(self._out[edge.source_id])
+        row[edge.target_id] = row.get(edge.target_id, 0.0) + weight
+        self._replace_row(edge.source_id, row)
+
+    def _apply_remove_edge(self, edge: InfluenceEdge) -> None:
+        weight = self._valid_edge_weight(edge)
+        row = dict(self._out.get(edge.source_id, {}))
+        if weight <= 0 or edge.target_id not in row:
+            return
+        remaining = row[edge.target_id] - weight
+        if remaining <= 1e-12:
+            del row[edge.target_id]
+        else:
+            row[edge.target_id] = remaining
+        self._replace_row(edge.source_id, row)
+
+    # -- results -----------------------------------------------------------
+
+    def pagerank(self) -> Dict[str, float]:
+        total = self._z_total
+        if total <= 0:
+            return {paper_id: 0.0 for paper_id in self._papers}
+        return {paper_id: value / total for paper_id, value in self._z.items()}
+
+    def leaderboard(
+        self,
+        top_k: Optional[int] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Dict]:
+        return _rank_papers(
+            self._papers.values(),
+            self.pagerank(),
+            self.citation_policy,
+            self.impact_weights,
+            top_k=top_k,
+            offset=offset,
+            limit=limit,
+            fields=fields,
+        )
+
+    def error_bound(self) -> float:
+        """Upper bound on the L1 error added by incremental updates since the last full solve."""
+        if self._z_total <= 0:
+            return 0.0
+        return sum(abs(value) for value in self._residual.values()) / ((1.0 - self.damping) * self._z_total)
+
+    # -- internals ---------------------------------------------------------
+
+    def _insert_paper(self, paper: LeaderboardPaper) -> None:
+        self._papers[paper.paper_id] = paper
+        self._raw[paper.paper_id] = 0.0
+        self._set_raw(paper.paper_id, _raw_prior(paper, self.citation_policy))
+        self._out.setdefault(paper.paper_id, {})
+        self._out_total.setdefault(paper.paper_id, 0.0)
+        self._in.setdefault(paper.paper_id, set())
+
+    def _insert_edge(self, edge: InfluenceEdge) -> None:
+        weight = self._valid_edge_weight(edge)
+        if weight <= 0:
+            return
+        row = self._out[edge.source_id]
+        row[edge.target_id] = row.get(edge.target_id, 0.0) + weight
+        self._out_total[edge.source_id] += weight
+        self._in[edge.target_id].add(edge.source_id)
+
+    def _valid_edge_weight(self, edge: InfluenceEdge) -> float:
+        if edge.source_id not in self._papers or edge.target_id not in self._papers:
+            return 0.0
+        if edge.source_id == edge.target_id:
+            return 0.0
+        return _edge_weight(edge, self.edge_weights)
+
+    def _set_raw(self, paper_id: str, value: float) -> None:
+        self._positive_priors += (value > 0) - (self._raw[paper_id] > 0)
+        self._raw[paper_id] = value
+
+    def _prior(self, paper_id: str) -> float:
+        # All-zero raw priors fall back to uniform, as in _build_priors.
+        return self._raw[paper_id] if self._positive_priors > 0 else 1.0
+
+    def _add_residual(self, paper_id: str, amount: float) -> None:
+        if amount == 0.0:
+            return
+        self._residual[paper_id] = self._residual.get(paper_id, 0.0) + amount
+        self._queue[paper_id] = None
+
+    def _replace_row(self, source: str, row: Dict[str, float]) -> None:
+        """Swap a node's out-edges and move the residual its mass now owes."""
+        old_row = self._out[source]
+        old_total = self._out_total[source]
+        new_total = sum(row.values())
+        mass = self.damping * self._z.get(source, 0.0)
+        for target, weight in old_row.items():
+            self._add_residual(target, -mass * weight / old_total)
+            if target not in row:
+                self._in[target].discard(source)
+        for target, weight in row.items():
+            self._add_residual(target, mass * weight / new_total)
+            self._in[target].add(source)
+        self._out[source] = row
+        self._out_total[source] = new_total
+
+    def _converge(self) -> None:
+        budget = self.max_pushes if self.max_pushes is not None else max(1000, len(self._papers))
+        pushes = 0
+        residual = self._residual
+        while self._queue:
+            threshold = self.push_tolerance * max(self._z_total, 1e-300)
+            paper_id = next(iter(self._queue))
+            del self._queue[paper_id]
+            amount = residual.get(paper_id, 0.0)
+            if abs(amount) <= threshold:
+                continue
+            if pushes >= budget:
+                self.pushes += pushes
+                self._rebuild(warm=True)
+                return
+            pushes += 1
+            del residual[paper_id]
+            self._z[paper_id] += amount
+            self._z_total += amount
+            total = self._out_total[paper_id]
+            if total > 0:
+                share = self.damping * amount / total
+                for target, weight in self._out[paper_id].items():
+                    residual[target] = residual.get(target, 0.0) + share * weight
+                    self._queue[target] = None
+        self.pushes += pushes
+
+    def _rebuild(self, warm: bool = False) -> None:
+        """Solve from scratch with the full engine, then rescale to ``z``."""
+        self.rebuilds += 1
+        paper_ids = list(self._papers)
+        self._residual = {}
+        self._queue = {}
+        if not paper_ids:
+            self._z, self._z_total = {}, 0.0
+            return
+
+        priors = {paper_id: self._prior(paper_id) for paper_id in paper_ids}
+        prior_total = sum(priors.values())
+        normalized = {paper_id: value / prior_total for paper_id, value in priors.items()}
+        initial = self.pagerank() if warm else None
+        if self.engine == "numpy":
+            index = {paper_id: position for position, paper_id in enumerate(paper_ids)}
+            sources: List[int] = []
+            targets: List[int] = []
+            weights: List[float] = []
+            for source, row in self._out.items():
+                for target, weight in row.items():
+                    sources.append(index[source])
+                    targets.append(index[target])
+                    weights.append(weight)
+            rank = _weighted_pagerank_numpy(
+                paper_ids, (sources, targets, weights), normalized,
+                self.damping, self.iterations, self.tolerance, initial,
+            )
+        else:
+            rank = _weighted_pagerank(
+                paper_ids, self._out, normalized,
+                self.damping, self.iterations, self.tolerance, initial,
+            )
+
+        # sum(z) solves (1 - d) * sum(z) + d * sink_mass(z) = (1 - d) * sum(q).
+        d = self.damping
+        sink_share = sum(rank[paper_id] for paper_id in paper_ids if self._out_total[paper_id] <= 0)
+        scale = (1.0 - d) * prior_total / ((1.0 - d) + d * sink_share)
+        self._z = {paper_id: rank[paper_id] * scale for paper_id in paper_ids}
+        self._z_total = sum(self._z.values())
+
+
+# Stored in the int64 citation columns of a PaperTable for an absent count.
+_MISSING_COUNT = -(2**63)
+
+
+class PaperTable:
+    """Papers and edges stored column-wise, for ranking graphs loaded in bulk.
+
+    ``add_paper`` and ``add_edge`` take plain dicts shaped like the
+    ``/leaderboard`` payload (citations either nested under ``citations`` or
+    as top-level ``openalex``/``semantic_scholar``/``scholar_csv`` columns).
+    Each record is reduced on arrival to a few numbers in typed arrays: the
+    direct and inherited citation counts and the edge weight are resolved
+    immediately, so no per-paper object outlives its record. Edges must be
+    added after the papers they join; edges with unknown endpoints,
+    self-loops or zero weight are dropped, as in ``compute_impact_leaderboard``.
+    """
+
+    def __init__(self, citation_policy: str = "max", edge_weights: Optional[Dict[str, float]] = None) -> None:
+        if citation_policy not in CITATION_POLICIES:
+            raise ValueError(f"Unsupported citation policy: {citation_policy}")
+        self.citation_policy = citation_policy
+        self.edge_weights = edge_weights or DEFAULT_EDGE_WEIGHTS
+        self.paper_ids: List[str] = []
+        self.titles: List[Optional[str]] = []
+        self.dois: List[Optional[str]] = []
+        self.novelty = array("d")
+        self.evidence = array("d")
+        self.direct = array("q")
+        self.inherited = array("q")
+        self.citations = {source: array("q") for source in CITATION_SOURCES}
+        self.sources = array("q")
+        self.targets = array("q")
+        self.weights = array("d")
+        self._index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.paper_ids)
+
+    def add_paper(self, record: Dict) -> None:
+        paper_id = record.get("paper_id")
+        if not paper_id:
+            raise ValueError("Paper record needs a `paper_id`.")
+        paper_id = str(paper_id)
+        if paper_id in self._index:
+            raise ValueError(f"Duplicate paper_id: {paper_id}")
+
+        citations = _citation_counts(record.get("citations") or record)
+        reference_citations = [_citation_counts(item or {}) for item in record.get("reference_citations") or []]
+        novelty = float(record.get("novelty_score") or 0.0)
+        evidence = float(record.get("evidence_score") or 0.0)
+        direct = resolve_citation_count(citations, self.citation_policy)
+        inherited = resolve_inherited_citations(
+            reference_citations,
+            self.citation_policy,
+            record.get("reference_weights"),
+        )
+
+        self._index[paper_id] = len(self.paper_ids)
+        self.paper_ids.append(paper_id)
+        self.titles.append(record.get("title"))
+        self.dois.append(record.get("doi"))
+        self.novelty.append(novelty)
+        self.evidence.append(evidence)
+        self.direct.append(direct)
+        self.inherited.append(inherited)
+        for source in CITATION_SOURCES:
+            value = getattr(citations, source)
+            self.citations[source].append(_MISSING_COUNT if value is None else value)
+
+    def add_edge(self, record: Dict) -> bool:
+        """Add one edge; returns False if it is dropped."""
+        source = self._index.get(str(record.get("source_id")))
+        target = self._index.get(str(record.get("target_id")))
+        if source is None or target is None or source == target:
+            return False
+        confidence = record.get("confidence")
+        weight = _kind_weight(
+            record.get("kind") or "citation",
+            1.0 if confidence is None else confidence,
+            self.edge_weights,
+        )
+        if weight <= 0:
+            return False
+        self.sources.append(source)
+        self.targets.append(target)
+        self.weights.append(weight)
+        return True
+
+    def paper(self, index: int) -> LeaderboardPaper:
+        """Rebuild one paper for output; its resolved counts live in ``direct``/``inherited``."""
+        counts = {source: self.citations[source][index] for source in CITATION_SOURCES}
+        return LeaderboardPaper(
+            paper_id=self.paper_ids[index],
+            title=self.titles[index],
+            doi=self.dois[index],
+            novelty_score=self.novelty[index],
+            evidence_score=self.evidence[index],
+            citations=CitationCounts(
+                **{source: None if value == _MISSING_COUNT else value for source, value in counts.items()}
+            ),
+        )
+
+    def resolved_citations(self, vectorized: bool = False) -> ResolvedCitations:
+        return ResolvedCitations.from_counts(self.direct, self.inherited, vectorized)
+
+    def priors(self, citations: ResolvedCitations) -> List[float]:
+        raw = [
+            _prior_from_signal(signal, novelty, evidence)
+            for signal, novelty, evidence in zip(citations.signal, self.novelty, self.evidence)
+        ]
+        total = sum(raw)
+        if total <= 0:
+            return [1.0 / len(self)] * len(self)
+        return [value / total for value in raw]
+
+
+def _citation_counts(data: Dict) -> CitationCounts:
+    return CitationCounts(**{source: _optional_int(data.get(source)) for source in CITATION_SOURCES})
+
+
+def _optional_int(value) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+def rank_paper_table(
+    table: PaperTable,
+    impact_weights: Optional[Dict[str, float]] = None,
+    damping: float = 0.85,
+    iterations: int = 80,
+    tolerance: float = 1e-9,
+    engine: str = "auto",
+    top_k: Optional[int] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> List[Dict]:
+    """``compute_impact_leaderboard`` for a ``PaperTable``; returns the same rows."""
+    if not len(table):
+        return []
+
+    impact_weights = impact_weights or DEFAULT_IMPACT_WEIGHTS
+    _validate_impact_weights(impact_weights)
+    _validate_page(top_k, offset, limit)
+    selected_fields = _resolve_fields(fields)
+    engine = _resolve_engine(engine)
+
+    citations = table.resolved_citations(vectorized=engine == "numpy")
+    priors = table.priors(citations)
+    edges = (table.sources, table.targets, table.weights)
+    if engine == "numpy":
+        import numpy as np  # type: ignore
+
+        start = np.full(len(table), 1.0 / len(table))
+        pagerank = _pagerank_vector(
+            np, edges, np.asarray(priors, dtype=np.float64), start, damping, iterations, tolerance
+        ).tolist()
+    else:
+        graph: Dict[str, Dict[str, float]] = {paper_id: {} for paper_id in table.paper_ids}
+        for source, target, weight in zip(*edges):
+            row = graph[table.paper_ids[source]]
+            target_id = table.paper_ids[target]
+            row[target_id] = row.get(target_id, 0.0) + weight
+        ranks = _weighted_pagerank(
+            table.paper_ids,
+            graph,
+            dict(zip(table.paper_ids, priors)),
+            damping,
+            iterations,
+            tolerance,
+        )
+        pagerank = [ranks[paper_id] for paper_id in table.paper_ids]
+
+    max_pr = max(pagerank)
+    if max_pr <= 0.0:
+        max_pr = 1.0
+    pr_norms = [value / max_pr for value in pagerank]
+    scores = [
+        _impact_score(pr_norm, evidence, novelty, impact_weights)
+        for pr_norm, evidence, novelty in zip(pr_norms, table.evidence, table.novelty)
+    ]
+
+    return [
+        _paper_row(
+            table.paper(index),
+            pr_norms[index],
+            scores[index],
+            table.citation_policy,
+            selected_fields,
+            citations.counts(index),
+        )
+        for index in _page_indices(scores, top_k, offset, limit)
+    ]
@@ -0,0 +1,130 @@
+"""Single-pass phrase matching for claim cues, breakthrough cues and keywords.
+
+All phrase lists from ``pipeline.config`` are folded into one trie-shaped regex
+so a sentence is lowercased and scanned once, instead of once per phrase.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+
+from pipeline.config import (
+    BREAKTHROUGH_CUES,
+    CUE_PHRASES,
+    CUE_WORD_BOUNDARIES,
+    NEUROSCIENCE_KEYWORDS,
+)
+
+
+_END = ""
+
+
+@dataclass(frozen=True)
+class PhraseHits:
+    cues: Tuple[str, ...]
+    breakthrough: Tuple[str, ...]
+    neuroscience: Tuple[str, ...]
+
+
+class PhraseMatcher:
+    """Find every phrase of several groups in a sentence with one regex scan.
+
+    Each group is ``(phrases, whole_word)``. With ``whole_word`` a phrase must
+    start and end on a word boundary; otherwise it only has to start one, so
+    inflections like "synapses" still hit "synapse". ``word_boundaries=False``
+    restores plain substring matching for every group.
+    """
+
+    def __init__(self, groups: Dict[str, Tuple[Sequence[str], bool]], word_boundaries: bool = True) -> None:
+        self.groups = {name: [p.lower() for p in phrases] for name, (phrases, _) in groups.items()}
+        self.word_boundaries = word_boundaries
+
+        suffixes: Dict[str, str] = {}
+        owners: Dict[str, set] = {}
+        for name, (phrases, whole_word) in groups.items():
+            for phrase in phrases:
+                phrase = phrase.lower()
+                owners.setdefault(phrase, set()).add(name)
+                if word_boundaries and whole_word:
+                    # A phrase shared by several groups keeps the stricter boundary.
+                    suffixes[phrase] = r"\b"
+                else:
+                    suffixes.setdefault(phrase, "")
+        self._owners: Dict[str, FrozenSet[str]] = {phrase: frozenset(names) for phrase, names in owners.items()}
+
+        prefix = r"\b" if word_boundaries else ""
+        self._pattern = re.compile(prefix + _trie_regex(suffixes))
+        # When a longer phrase wins at a position, shorter phrases that are its
+        # prefix may match there too; re-check them individually.
+        self._shadowed: Dict[str, List[Tuple[str, re.Pattern]]] = {}
+        for phrase in suffixes:
+            for other, suffix in suffixes.items():
+                if other != phrase and phrase.startswith(other):
+                    self._shadowed.setdefault(phrase, []).append(
+                        (other, re.compile(re.escape(other) + suffix))
+                    )
+
+    def find(self, sentence: str) -> Dict[str, FrozenSet[str]]:
+        lower = sentence.lower()
+        found = set()
+        search = self._pattern.search
+        match = search(lower)
+        while match is not None:
+            phrase = match.group()
+            found.add(phrase)
+            for other, pattern in self._shadowed.get(phrase, ()):
+                if pattern.match(lower, match.start()):
+                    found.add(other)
+            # Resume one character in so phrases overlapping this hit are found.
+            match = search(lower, match.start() + 1)
+
+        hits: Dict[str, set] = {name: set() for name in self.groups}
+        for phrase in found:
+            for name in self._owners[phrase]:
+                hits[name].add(phrase)
+        return {name: frozenset(phrases) for name, phrases in hits.items()}
+
+    def ordered(self, name: str, hits: FrozenSet[str]) -> Tuple[str, ...]:
+        """Return hits in the group's configured phrase order."""
+        return tuple(phrase for phrase in self.groups[name] if phrase in hits)
+
+
+def _trie_regex(phrases: Dict[str, str]) -> str:
+    trie: Dict = {}
+    for phrase, suffix in phrases.items():
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[_END] = suffix
+    return _node_regex(trie)
+
+
+def _node_regex(node: Dict) -> str:
+    alternatives = [re.escape(char) + _node_regex(child) for char, child in sorted(node.items()) if char != _END]
+    # The terminal alternative goes last so longer phrases win at a position.
+    if _END in node:
+        alternatives.append(node[_END])
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return "(?:" + "|".join(alternatives) + ")"
+
+
+_MATCHER = PhraseMatcher(
+    {
+        "cues": (CUE_PHRASES, True),
+        "breakthrough": (BREAKTHROUGH_CUES, True),
+        "neuroscience": (NEUROSCIENCE_KEYWORDS, False),
+    },
+    word_boundaries=CUE_WORD_BOUNDARIES,
+)
+
+
+@lru_cache(maxsize=16384)
+def match_phrases(sentence: str) -> PhraseHits:
+    hits = _MATCHER.find(sentence)
+    return PhraseHits(
+        cues=_MATCHER.ordered("cues", hits["cues"]),
+        breakthrough=_MATCHER.ordered("breakthrough", hits["breakthrough"]),
+        neuroscience=_MATCHER.ordered("neuroscience", hits["neuroscience"]),
+    )
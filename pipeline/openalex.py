@@ -0,0 +1,158 @@
+"""OpenAlex citation lookups for extracted papers and key ideas.
+
+A single pooled ``httpx.AsyncClient`` is shared across requests, and all
+lookups for one extraction run concurrently under a semaphore and an overall
+deadline, so a slow OpenAlex response only costs the ideas it affects.
+Results, including misses, are remembered in an optional ``CitationCache``
+keyed by normalized DOI or search string.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import quote
+
+import httpx
+
+from pipeline.citation_cache import CitationCache
+
+
+OPENALEX_BASE_URL = "https://api.openalex.org"
+USER_AGENT = "AgentScience/0.1"
+MAX_QUERY_CHARS = 280
+
+_DOI_PREFIX_RE = re.compile(r"^(?:https?://(?:dx\.)?doi\.org/|doi:)", re.I)
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+
+def normalize_doi(doi: str) -> str:
+    return _DOI_PREFIX_RE.sub("", doi.strip()).lower()
+
+
+def normalize_query(text: str) -> str:
+    """Collapse case, punctuation and whitespace so near-identical sentences share a key."""
+    return " ".join(_NON_WORD_RE.sub(" ", text.lower()).split())
+
+
+class OpenAlexClient:
+    def __init__(
+        self,
+        base_url: str = OPENALEX_BASE_URL,
+        max_concurrency: int = 8,
+        request_timeout: float = 5.0,
+        deadline: float = 10.0,
+        cache: Optional[CitationCache] = None,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self.deadline = deadline
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(request_timeout),
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _get_json(self, url: str, params: Optional[Dict] = None) -> Tuple[bool, Optional[Dict]]:
+        """Return ``(definitive, data)``.
+
+        Only 200 and 404 answers are definitive; transport errors, rate limits
+        and server errors must not be cached as misses.
+        """
+        async with self._semaphore:
+            try:
+                res = await self._client.get(url, params=params)
+            except httpx.HTTPError:
+                return False, None
+        if res.status_code == 404:
+            return True, None
+        if res.status_code != 200:
+            return False, None
+        try:
+            return True, res.json()
+        except ValueError:
+            return False, None
+
+    async def _cached(self, key: str, fetch: Callable[[], Awaitable[Tuple[bool, Optional[int]]]]) -> Optional[int]:
+        # CitationCache is blocking SQLite; run it off the event loop.
+        if self.cache is not None:
+            found, cited_by = await asyncio.to_thread(self.cache.get, key)
+            if found:
+                return cited_by
+        definitive, cited_by = await fetch()
+        if definitive and self.cache is not None:
+            await asyncio.to_thread(self.cache.put, key, cited_by)
+        return cited_by
+
+    async def _fetch_search(self, query: str) -> Tuple[bool, Optional[int]]:
+        definitive, data = await self._get_json(f"{self.base_url}/works", params={"search": query, "per-page": 1})
+        results = (data or {}).get("results") or []
+        if results:
+            cited_by = results[0].get("cited_by_count")
+            if isinstance(cited_by, int):
+                return True, cited_by
+        return definitive, None
+
+    async def _fetch_doi(self, doi: str) -> Tuple[bool, Optional[int]]:
+        definitive, data = await self._get_json(f"{self.base_url}/works/https://doi.org/{quote(doi)}")
+        cited_by = (data or {}).get("cited_by_count")
+        if isinstance(cited_by, int):
+            return True, cited_by
+        return definitive, None
+
+    async def _search_cited_by(self, query: str) -> Optional[int]:
+        return await self._cached(f"search:{normalize_query(query)}", lambda: self._fetch_search(query))
+
+    async def citation_count(self, doi: Optional[str], title: Optional[str]) -> Optional[int]:
+        if doi:
+            doi = normalize_doi(doi)
+            cited_by = await self._cached(f"doi:{doi}", lambda: self._fetch_doi(doi))
+            if cited_by is not None:
+                return cited_by
+        if title:
+            return await self._search_cited_by(title)
+        return None
+
+    async def citations_for_idea(self, idea_text: str) -> Optional[int]:
+        if not idea_text:
+            return None
+        query = " ".join(idea_text.split())
+        if len(query) > MAX_QUERY_CHARS:
+            query = query[:MAX_QUERY_CHARS]
+        return await self._search_cited_by(query)
+
+    async def enrich(self, payload: Dict, deadline: Optional[float] = None) -> Dict:
+        """Attach OpenAlex citation counts to an extraction payload in place.
+
+        The paper lookup and every key-idea lookup run concurrently. Lookups
+        still pending at the deadline are cancelled, their ideas get ``0`` and
+        ``payload["citations"]["partial"]`` is set.
+        """
+        metadata = payload.get("metadata") or {}
+        tasks: Dict[asyncio.Task, Optional[Dict]] = {
+            asyncio.ensure_future(self.citation_count(metadata.get("doi"), metadata.get("title"))): None
+        }
+        for idea in payload.get("key_ideas", []) or []:
+            text = idea.get("text") if isinstance(idea, dict) else None
+            if text:
+                tasks[asyncio.ensure_future(self.citations_for_idea(text))] = idea
+
+        done, pending = await asyncio.wait(tasks, timeout=self.deadline if deadline is None else deadline)
+        for task in pending:
+            task.cancel()
+
+        payload["citations"] = {"openalex": None, "partial": bool(pending)}
+        for task, idea in tasks.items():
+            count = task.result() if task in done and not task.exception() else None
+            if idea is None:
+                payload["citations"]["openalex"] = count
+            else:
+                scores = idea.setdefault("scores", {})
+                scores["openalex_citations"] = count if count is not None else 0
+        return payload
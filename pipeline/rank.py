@@ -0,0 +1,102 @@
+"""Rank large paper graphs straight from files.
+
+    python -m pipeline.rank --papers papers.jsonl --edges edges.jsonl --out leaderboard.jsonl
+
+Papers and edges are streamed from JSONL or Parquet into a ``PaperTable``
+instead of going through one ``/leaderboard`` POST, so 100k+ paper graphs
+never exist as Pydantic models or dataclass lists.
+"""
+
+import argparse
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from pipeline.jsonio import dumps, dumps_line, loads
+from pipeline.leaderboard import LEADERBOARD_FIELDS, PAGERANK_ENGINES, PaperTable, rank_paper_table
+
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+PARQUET_SUFFIXES = (".parquet", ".pq")
+
+
+def iter_records(path: Path, batch_size: int = 65536) -> Iterator[Dict]:
+    """Yield one dict per JSONL line or Parquet row, reading the file incrementally."""
+    suffix = path.suffix.lower()
+    if suffix in JSONL_SUFFIXES:
+        with path.open("rb") as handle:
+            for line_no, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield loads(line)
+                except ValueError as exc:
+                    raise ValueError(f"{path}:{line_no}: invalid JSON: {exc}") from exc
+        return
+    if suffix in PARQUET_SUFFIXES:
+        try:
+            import pyarrow.parquet as pq  # type: ignore
+        except ImportError as exc:
+            raise ImportError("Reading Parquet requires `pyarrow`. Install with: pip install pyarrow") from exc
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+            yield from batch.to_pylist()
+        return
+    raise ValueError(f"Unsupported input format {path.suffix!r}; use JSONL or Parquet.")
+
+
+def load_paper_table(
+    papers_path: Path,
+    edges_path: Optional[Path] = None,
+    citation_policy: str = "max",
+    edge_weights: Optional[Dict[str, float]] = None,
+) -> PaperTable:
+    table = PaperTable(citation_policy=citation_policy, edge_weights=edge_weights)
+    for record in iter_records(papers_path):
+        table.add_paper(record)
+    if edges_path is not None:
+        for record in iter_records(edges_path):
+            table.add_edge(record)
+    return table
+
+
+def write_ranking(rows: List[Dict], out_path: Path, count: int, offset: int = 0) -> None:
+    """JSONL gets one row per line; any other suffix gets the ``/leaderboard`` response object."""
+    if out_path.suffix.lower() in JSONL_SUFFIXES:
+        with out_path.open("wb") as out:
+            for row in rows:
+                out.write(dumps_line(row))
+    else:
+        out_path.write_bytes(dumps({"count": count, "offset": offset, "items": rows}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rank papers by impact from JSONL or Parquet files.")
+    parser.add_argument("--papers", type=Path, required=True, help="Papers file (.jsonl or .parquet)")
+    parser.add_argument("--edges", type=Path, help="Edges file with source_id, target_id, kind, confidence")
+    parser.add_argument("--out", type=Path, default=Path("leaderboard.jsonl"), help="Output .jsonl or .json path")
+    parser.add_argument("--citation-policy", choices=["max", "mean"], default="max")
+    parser.add_argument("--engine", choices=PAGERANK_ENGINES, default="auto")
+    parser.add_argument("--damping", type=float, default=0.85)
+    parser.add_argument("--iterations", type=int, default=80)
+    parser.add_argument("--top-k", type=int)
+    parser.add_argument("--offset", type=int, default=0)
+    parser.add_argument("--limit", type=int)
+    parser.add_argument("--fields", nargs="+", choices=LEADERBOARD_FIELDS, help="Columns to write per paper")
+    args = parser.parse_args()
+
+    table = load_paper_table(args.papers, args.edges, citation_policy=args.citation_policy)
+    rows = rank_paper_table(
+        table,
+        damping=args.damping,
+        iterations=args.iterations,
+        engine=args.engine,
+        top_k=args.top_k,
+        offset=args.offset,
+        limit=args.limit,
+        fields=args.fields,
+    )
+    count = len(table) if args.top_k is None else min(args.top_k, len(table))
+    write_ranking(rows, args.out, count, args.offset)
+    print(f"Ranked {len(table)} papers over {len(table.weights)} edges; wrote {len(rows)} rows to {args.out}.")
+
+
+if __name__ == "__main__":
+    main()
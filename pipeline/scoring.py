@@ -1,4 +1,5 @@
-from typing import List
+import heapq
+from typing import List, Tuple
 
 from pipeline.claim_extract import classify_breakthrough
 from pipeline.types import Claim
@@ -11,3 +12,28 @@ def select_key_ideas(claims: List[Claim], top_n: int = 5) -> List[Claim]:
 def select_breakthroughs(claims: List[Claim], top_n: int = 3) -> List[Claim]:
     breakthroughs = [c for c in claims if classify_breakthrough(c)]
     return sorted(breakthroughs, key=lambda c: c.scores.get("total", 0.0), reverse=True)[:top_n]
+
+
+class RunningTopK:
+    """Keep the ``n`` highest-scoring claims seen so far.
+
+    ``items()`` matches ``sorted(claims, key=total, reverse=True)[:n]``,
+    including the stable tie order, without holding every claim.
+    """
+
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self._seen = 0
+        self._heap: List[Tuple[float, int, Claim]] = []
+
+    def push(self, claim: Claim) -> None:
+        # Earlier claims win ties, so they get the larger second key.
+        entry = (claim.scores.get("total", 0.0), -self._seen, claim)
+        self._seen += 1
+        if len(self._heap) < self.n:
+            heapq.heappush(self._heap, entry)
+        elif self.n > 0 and entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> List[Claim]:
+        return [entry[2] for entry in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
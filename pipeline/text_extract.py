@@ -1,5 +1,13 @@
+from __future__ import annotations
+
+import importlib.util
+import io
+import os
 import re
-from typing import List, Optional, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from pipeline.config import Section, SECTION_ALIASES
 from pipeline.types import PaperMetadata
@@ -67,37 +75,338 @@ def _extract_abstract(text: str) -> Optional[str]:
     return None
 
 
-def extract_pdf_pages(pdf_path: str) -> List[Tuple[int, str]]:
-    try:
-        import pdfplumber  # type: ignore
+PdfSource = Union[str, Path, bytes]
+
+
+def _read_source(source: Union[str, bytes]) -> bytes:
+    return source if isinstance(source, bytes) else Path(source).read_bytes()
+
+
+class _PymupdfBackend:
+    name = "pymupdf"
+
+    @staticmethod
+    def available() -> bool:
+        return importlib.util.find_spec("fitz") is not None
+
+    def __init__(self, source: Union[str, bytes]) -> None:
+        try:
+            import fitz  # type: ignore
+        except ImportError as exc:
+            raise ImportError("The `pymupdf` PDF backend requires pymupdf (fitz).") from exc
+
+        if isinstance(source, bytes):
+            self._doc = fitz.open(stream=source, filetype="pdf")
+        else:
+            self._doc = fitz.open(source)
+
+    @property
+    def page_count(self) -> int:
+        return self._doc.page_count
+
+    def page_text(self, index: int) -> str:
+        return self._doc.load_page(index).get_text("text")
+
+    def close(self) -> None:
+        self._doc.close()
+
+
+class _PdfplumberBackend:
+    name = "pdfplumber"
+
+    @staticmethod
+    def available() -> bool:
+        return importlib.util.find_spec("pdfplumber") is not None
+
+    def __init__(self, source: Union[str, bytes]) -> None:
+        try:
+            import pdfplumber  # type: ignore
+        except ImportError as exc:
+            raise ImportError("The `pdfplumber` PDF backend requires pdfplumber.") from exc
+
+        self._pdf = pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source)
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pdf.pages)
+
+    def page_text(self, index: int) -> str:
+        page = self._pdf.pages[index]
+        text = page.extract_text() or ""
+        # pdfplumber keeps parsed layout objects cached on each page.
+        page.close()
+        return text
+
+    def close(self) -> None:
+        self._pdf.close()
+
+
+class _TextBackend:
+    """Plain-text input with pages separated by form feeds (``pdftotext`` output).
+
+    Needs no PDF library, so text dumps produced elsewhere (pdftotext, OCR)
+    can go through the same pipeline.
+    """
+
+    name = "text"
+
+    @staticmethod
+    def available() -> bool:
+        return True
+
+    def __init__(self, source: Union[str, bytes]) -> None:
+        data = _read_source(source)
+        if data.startswith(b"%PDF-"):
+            raise ValueError("The `text` backend reads plain text; use `pymupdf` or `pdfplumber` for PDF files.")
+        pages = data.decode("utf-8", errors="ignore").split("\f")
+        if len(pages) > 1 and not pages[-1].strip():
+            pages.pop()
+        self._pages = pages
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pages)
+
+    def page_text(self, index: int) -> str:
+        return self._pages[index]
+
+    def close(self) -> None:
+        self._pages = []
+
+
+PDF_BACKENDS: Dict[str, type] = {
+    "pymupdf": _PymupdfBackend,
+    "pdfplumber": _PdfplumberBackend,
+    "text": _TextBackend,
+}
+# ``auto`` picks the first installed PDF library; pymupdf is much faster.
+AUTO_PDF_BACKENDS = ("pymupdf", "pdfplumber")
+
+
+def register_pdf_backend(name: str, backend: type) -> None:
+    """Add a backend: a class taking a path or bytes, with ``available()``,
+    ``page_count``, ``page_text(index)`` and ``close()``."""
+    PDF_BACKENDS[name] = backend
+
+
+def default_pdf_backend() -> str:
+    return os.environ.get("AGENTSCIENCE_PDF_BACKEND", "auto")
+
 
-        pages = []
-        with pdfplumber.open(pdf_path) as pdf:
-            for idx, page in enumerate(pdf.pages, start=1):
-                text = page.extract_text() or ""
-                pages.append((idx, text))
-        return pages
-    except ImportError:
-        pass
+def resolve_pdf_backend(name: Optional[str] = None) -> str:
+    """Map ``auto``/``None`` to a concrete installed backend and validate names."""
+    name = name or default_pdf_backend()
+    if name == "auto":
+        for candidate in AUTO_PDF_BACKENDS:
+            if PDF_BACKENDS[candidate].available():
+                return candidate
+        raise ImportError("PDF extraction requires `pymupdf` (fitz) or `pdfplumber`.")
+    if name not in PDF_BACKENDS:
+        raise ValueError(f"Unsupported PDF backend: {name} (choose from auto, {', '.join(PDF_BACKENDS)})")
+    return name
 
+
+class PdfDocument:
+    """A PDF opened once, from a path or from bytes already in memory.
+
+    ``backend`` names an entry of ``PDF_BACKENDS`` or ``"auto"`` (the
+    default, overridable with ``AGENTSCIENCE_PDF_BACKEND``). The same handle
+    can answer ``page_count`` and then be passed to ``iter_pdf_pages`` or
+    ``run_pipeline`` without re-reading or re-parsing the file.
+    """
+
+    def __init__(self, source: PdfSource, backend: Optional[str] = None) -> None:
+        self.source: Union[str, bytes] = source if isinstance(source, bytes) else str(source)
+        self.backend = resolve_pdf_backend(backend)
+        self._impl = PDF_BACKENDS[self.backend](self.source)
+
+    @property
+    def page_count(self) -> int:
+        return self._impl.page_count
+
+    def iter_pages(self, page_range: Optional[range] = None) -> Iterator[Tuple[int, str]]:
+        if page_range is None:
+            page_range = range(self.page_count)
+        for idx in page_range:
+            yield idx + 1, self._impl.page_text(idx)
+
+    def close(self) -> None:
+        self._impl.close()
+
+    def __enter__(self) -> "PdfDocument":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def iter_pdf_pages(
+    pdf: PdfSource | PdfDocument,
+    workers: int = 1,
+    backend: Optional[str] = None,
+) -> Iterator[Tuple[int, str]]:
+    """Yield ``(page_number, text)`` one page at a time.
+
+    ``pdf`` is a path, the raw PDF bytes, or an open ``PdfDocument`` (which
+    is left open). Only the current page's text is held in memory. With
+    ``workers > 1`` page ranges are split across a process pool instead;
+    each worker opens the document itself and pages are still yielded in
+    order. ``backend`` is ignored for an open ``PdfDocument``.
+    """
+    if workers > 1:
+        if isinstance(pdf, PdfDocument):
+            yield from _iter_pdf_pages_parallel(pdf.source, workers, pdf.backend, pdf.page_count)
+        else:
+            yield from _iter_pdf_pages_parallel(pdf, workers, resolve_pdf_backend(backend))
+    elif isinstance(pdf, PdfDocument):
+        yield from pdf.iter_pages()
+    else:
+        with PdfDocument(pdf, backend) as doc:
+            yield from doc.iter_pages()
+
+
+def pdf_page_count(pdf: PdfSource | PdfDocument, backend: Optional[str] = None) -> int:
+    if isinstance(pdf, PdfDocument):
+        return pdf.page_count
+    with PdfDocument(pdf, backend) as doc:
+        return doc.page_count
+
+
+def _extract_page_range(source: PdfSource, backend: str, start: int, stop: int) -> List[Tuple[int, str]]:
+    with PdfDocument(source, backend) as doc:
+        return list(doc.iter_pages(range(start, stop)))
+
+
+def _iter_pdf_pages_parallel(
+    source: PdfSource,
+    workers: int,
+    backend: str,
+    count: Optional[int] = None,
+) -> Iterator[Tuple[int, str]]:
+    if count is None:
+        count = pdf_page_count(source, backend)
+    if count == 0:
+        return
+    # A few ranges per worker balance uneven pages and let the first pages
+    # stream out before the whole document is done.
+    chunk = max(1, -(-count // (workers * 4)))
+    starts = range(0, count, chunk)
+    pool = ProcessPoolExecutor(max_workers=min(workers, len(starts)))
+    # Keep only two ranges per worker submitted, so a slow consumer does not
+    # pile up every page's text in memory. Ranges are yielded in order.
+    pending: deque = deque()
     try:
-        import fitz  # type: ignore
+        for start in starts:
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+            pending.append(pool.submit(_extract_page_range, source, backend, start, min(start + chunk, count)))
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
 
-        pages = []
-        with fitz.open(pdf_path) as doc:
-            for idx, page in enumerate(doc, start=1):
-                text = page.get_text("text")
-                pages.append((idx, text))
-        return pages
-    except ImportError as exc:
-        raise ImportError(
-            "PDF extraction requires `pdfplumber` or `pymupdf` (fitz)."
-        ) from exc
 
+def extract_pdf_pages(
+    pdf: PdfSource | PdfDocument,
+    workers: int = 1,
+    backend: Optional[str] = None,
+) -> List[Tuple[int, str]]:
+    return list(iter_pdf_pages(pdf, workers=workers, backend=backend))
 
-def sections_from_pdf(pages: List[Tuple[int, str]]) -> List[Section]:
-    sections: List[Section] = []
+
+# Headings that end the previous section; the text under them is dropped
+# until the next section heading.
+PDF_BOUNDARY_HEADINGS = (
+    "references",
+    "bibliography",
+    "acknowledgments",
+    "acknowledgements",
+    "appendix",
+    "supplementary material",
+    "supplementary information",
+)
+
+_HEADING_NUMBER_RE = re.compile(r"^(?:\d+(?:\.\d+)*\.?|[ivx]+\.)\s+")
+_INLINE_ABSTRACT_RE = re.compile(r"^abstract\s*[.:\u2014\u2013-]\s*(?=\S)", re.I)
+_MAX_HEADING_CHARS = 40
+
+
+def _pdf_heading(line: str) -> Optional[Tuple[str, str]]:
+    """Return ``(section_name, trailing_text)`` if ``line`` starts a section."""
+    stripped = line.strip()
+    if not stripped:
+        return None
+    if len(stripped) > _MAX_HEADING_CHARS:
+        match = _INLINE_ABSTRACT_RE.match(stripped)
+        return ("abstract", stripped[match.end():]) if match else None
+    title = _HEADING_NUMBER_RE.sub("", stripped.lower()).rstrip(".:").strip()
+    if title in SECTION_ALIASES:
+        return SECTION_ALIASES[title], ""
+    if title in PDF_BOUNDARY_HEADINGS:
+        return title, ""
+    match = _INLINE_ABSTRACT_RE.match(stripped)
+    if match:
+        return "abstract", stripped[match.end():]
+    return None
+
+
+class _SectionBuilder:
+    def __init__(self, name: str, page: int) -> None:
+        self.name = name
+        self.page = page
+        self.skip = name in PDF_BOUNDARY_HEADINGS
+        self.lines: List[str] = []
+        self.size = 0
+        self.last_page = page
+        self.page_breaks: List[Tuple[int, int]] = []
+
+    def add(self, line: str, page: int) -> None:
+        if self.skip:
+            return
+        if page != self.last_page:
+            self.page_breaks.append((self.size, page))
+            self.last_page = page
+        self.lines.append(line)
+        self.size += len(line) + 1
+
+    def build(self) -> Optional[Section]:
+        text = "\n".join(self.lines)
+        if not text.strip():
+            return None
+        return Section(name=self.name, text=text, page=self.page, page_breaks=self.page_breaks)
+
+
+def iter_sections_from_pdf(pages: Iterable[Tuple[int, str]]) -> Iterator[Section]:
+    """Group page text into sections by detecting headings, in one pass over lines.
+
+    Lines naming a section in ``SECTION_ALIASES`` (optionally numbered, e.g.
+    "2. Methods") start a new section, which runs across page breaks until
+    the next heading. Text before the first heading, or in a document with
+    none, stays one ``pdf_page`` section per page. ``PDF_BOUNDARY_HEADINGS``
+    (references, acknowledgments, appendix, ...) close the previous section
+    and their text is not yielded, so it is never scored for claims. Bare
+    page numbers are dropped. Only the current section's text is held.
+    """
+    current: Optional[_SectionBuilder] = None
     for page_num, text in pages:
-        if text.strip():
-            sections.append(Section(name="pdf_page", text=text, page=page_num))
-    return sections
+        if current is None or current.name == "pdf_page":
+            if current is not None and (section := current.build()) is not None:
+                yield section
+            current = _SectionBuilder("pdf_page", page_num)
+        for line in text.splitlines():
+            heading = _pdf_heading(line)
+            if heading is not None:
+                if (section := current.build()) is not None:
+                    yield section
+                name, rest = heading
+                current = _SectionBuilder(name, page_num)
+                if rest:
+                    current.add(rest, page_num)
+            elif not line.strip().isdigit():
+                current.add(line, page_num)
+    if current is not None and (section := current.build()) is not None:
+        yield section
+
+
+def sections_from_pdf(pages: List[Tuple[int, str]]) -> List[Section]:
+    return list(iter_sections_from_pdf(pages))
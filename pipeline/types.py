@@ -1,10 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
 
-@dataclass
+# Marker stored in ``ExtractionResult.to_compact_dict`` output.
+COMPACT_LAYOUT = "compact-v1"
+
+
+# Claims and evidence are created by the tens of thousands in batch runs, so
+# these types use __slots__ and flat hand-written serializers instead of the
+# recursive, deep-copying ``dataclasses.asdict``.
+
+
+@dataclass(slots=True)
 class Evidence:
     text: str
     section: str
@@ -12,10 +21,14 @@ class Evidence:
     source: str
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {"text": self.text, "section": self.section, "page": self.page, "source": self.source}
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Evidence":
+        return cls(text=data["text"], section=data["section"], page=data.get("page"), source=data["source"])
 
-@dataclass
+
+@dataclass(slots=True)
 class Claim:
     text: str
     section: str
@@ -26,12 +39,32 @@ class Claim:
     scores: Dict[str, float] = field(default_factory=dict)
 
     def to_dict(self) -> Dict:
-        data = asdict(self)
-        data["evidence"] = [e.to_dict() for e in self.evidence]
-        return data
+        # Containers are copied one level deep so callers (e.g. OpenAlex
+        # enrichment) can annotate the output without touching the claim.
+        return {
+            "text": self.text,
+            "section": self.section,
+            "page": self.page,
+            "source": self.source,
+            "cues": list(self.cues),
+            "evidence": [e.to_dict() for e in self.evidence],
+            "scores": dict(self.scores),
+        }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Claim":
+        return cls(
+            text=data["text"],
+            section=data["section"],
+            page=data.get("page"),
+            source=data["source"],
+            cues=list(data.get("cues", [])),
+            evidence=[Evidence.from_dict(e) for e in data.get("evidence", [])],
+            scores=dict(data.get("scores", {})),
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class PaperMetadata:
     title: Optional[str] = None
     authors: Optional[str] = None
@@ -41,7 +74,18 @@ class PaperMetadata:
     arxiv_id: Optional[str] = None
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            "title": self.title,
+            "authors": self.authors,
+            "year": self.year,
+            "venue": self.venue,
+            "doi": self.doi,
+            "arxiv_id": self.arxiv_id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PaperMetadata":
+        return cls(**{key: data.get(key) for key in cls.__dataclass_fields__})
 
 
 @dataclass
@@ -62,3 +106,100 @@ class ExtractionResult:
             "all_claims": [c.to_dict() for c in self.all_claims],
             "leaderboard_fields": self.leaderboard_fields,
         }
+
+    def to_compact_dict(self) -> Dict:
+        """Serialize with every evidence sentence and claim stored once.
+
+        ``evidence`` and ``claims`` are tables; claims list evidence by index
+        and ``all_claims``/``key_ideas``/``breakthroughs`` list claims by index.
+        """
+        evidence_index: Dict[Tuple, int] = {}
+        evidence_rows: List[Dict] = []
+        claim_index: Dict[Tuple, int] = {}
+        claim_rows: List[Dict] = []
+
+        def evidence_ref(item: Evidence) -> int:
+            key = (item.text, item.section, item.page, item.source)
+            if key not in evidence_index:
+                evidence_index[key] = len(evidence_rows)
+                evidence_rows.append(item.to_dict())
+            return evidence_index[key]
+
+        def claim_ref(claim: Claim) -> int:
+            refs = [evidence_ref(item) for item in claim.evidence]
+            key = (
+                claim.text,
+                claim.section,
+                claim.page,
+                claim.source,
+                tuple(claim.cues),
+                tuple(refs),
+                tuple(sorted(claim.scores.items())),
+            )
+            if key not in claim_index:
+                claim_index[key] = len(claim_rows)
+                claim_rows.append(
+                    {
+                        "text": claim.text,
+                        "section": claim.section,
+                        "page": claim.page,
+                        "source": claim.source,
+                        "cues": list(claim.cues),
+                        "evidence": refs,
+                        "scores": dict(claim.scores),
+                    }
+                )
+            return claim_index[key]
+
+        all_claims = [claim_ref(c) for c in self.all_claims]
+        return {
+            "layout": COMPACT_LAYOUT,
+            "paper_id": self.paper_id,
+            "metadata": self.metadata.to_dict(),
+            "key_ideas": [claim_ref(c) for c in self.key_ideas],
+            "breakthroughs": [claim_ref(c) for c in self.breakthroughs],
+            "all_claims": all_claims,
+            "claims": claim_rows,
+            "evidence": evidence_rows,
+            "leaderboard_fields": self.leaderboard_fields,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ExtractionResult":
+        """Load either the verbose ``to_dict`` or the ``to_compact_dict`` layout."""
+        if data.get("layout") == COMPACT_LAYOUT:
+            return cls._from_compact_dict(data)
+        return cls(
+            paper_id=data["paper_id"],
+            metadata=PaperMetadata.from_dict(data.get("metadata") or {}),
+            key_ideas=[Claim.from_dict(c) for c in data.get("key_ideas", [])],
+            breakthroughs=[Claim.from_dict(c) for c in data.get("breakthroughs", [])],
+            all_claims=[Claim.from_dict(c) for c in data.get("all_claims", [])],
+            leaderboard_fields=dict(data.get("leaderboard_fields", {})),
+        )
+
+    @classmethod
+    def _from_compact_dict(cls, data: Dict) -> "ExtractionResult":
+        # Rehydrated claims share Evidence objects, and key ideas/breakthroughs
+        # are the same Claim objects as in all_claims, just like a fresh run.
+        evidence = [Evidence.from_dict(e) for e in data.get("evidence", [])]
+        claims = [
+            Claim(
+                text=row["text"],
+                section=row["section"],
+                page=row.get("page"),
+                source=row["source"],
+                cues=list(row.get("cues", [])),
+                evidence=[evidence[i] for i in row.get("evidence", [])],
+                scores=dict(row.get("scores", {})),
+            )
+            for row in data.get("claims", [])
+        ]
+        return cls(
+            paper_id=data["paper_id"],
+            metadata=PaperMetadata.from_dict(data.get("metadata") or {}),
+            key_ideas=[claims[i] for i in data.get("key_ideas", [])],
+            breakthroughs=[claims[i] for i in data.get("breakthroughs", [])],
+            all_claims=[claims[i] for i in data.get("all_claims", [])],
+            leaderboard_fields=dict(data.get("leaderboard_fields", {})),
+        )
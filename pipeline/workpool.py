@@ -0,0 +1,169 @@
+"""Bounded worker pool for running blocking extraction work from async code."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Callable, Iterable, List, Optional
+
+
+class PoolFullError(RuntimeError):
+    """Raised when a job is submitted while the pool's queue is full."""
+
+
+class WorkerLostError(RuntimeError):
+    """Raised when a job's worker process died before returning a result."""
+
+
+class WorkPool:
+    """Run blocking callables off the event loop with admission control.
+
+    At most ``workers`` jobs execute at once (threads or processes, per
+    ``kind``) and at most ``queue_depth`` more wait for a free worker; any
+    further submission fails fast with ``PoolFullError`` so callers can shed
+    load instead of queueing without bound.
+
+    If a worker process dies, the process pool is broken for good: jobs
+    still waiting on it fail with ``WorkerLostError`` and the next
+    submission starts a fresh pool.
+    """
+
+    def __init__(self, kind: str = "thread", workers: int = 2, queue_depth: int = 8, stream_buffer: int = 16) -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unsupported pool kind: {kind}")
+        if workers < 1 or queue_depth < 0 or stream_buffer < 1:
+            raise ValueError("workers and stream_buffer must be >= 1 and queue_depth >= 0.")
+        self.kind = kind
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self.stream_buffer = stream_buffer
+        self._executor: Optional[Executor] = None
+        # Only touched from the event loop thread, so no lock is needed.
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="extract")
+        return self._executor
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await self._result(self._submit(loop, fn, *args))
+
+    async def _result(self, future: Future) -> Any:
+        executor = self._executor
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool as exc:
+            self._discard(executor)
+            raise WorkerLostError("The worker process died before the job finished.") from exc
+
+    async def stream(self, fn: Callable[..., Iterable[Any]], *args: Any) -> AsyncIterator[Any]:
+        """Run generator function ``fn`` in the pool and yield its items.
+
+        Thread pools hand each item to the event loop as soon as it is
+        produced, through a queue of at most ``stream_buffer`` items: when
+        the consumer falls behind, the worker waits for room. Process pools
+        cannot share the loop's queue, so there the items arrive together
+        once the job finishes. Closing the iterator early stops the worker
+        at its next item.
+        """
+        loop = asyncio.get_running_loop()
+        if self.kind == "process":
+            future = self._submit(loop, _drain, fn, args)
+            for item in await self._result(future):
+                yield item
+            return
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.stream_buffer)
+        stop = threading.Event()
+
+        def emit(item: Any) -> None:
+            put = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+            # Poll so a worker blocked on a full queue notices when the
+            # consumer has gone away.
+            while not stop.is_set():
+                try:
+                    put.result(timeout=0.1)
+                    return
+                except FutureTimeoutError:
+                    continue
+            put.cancel()
+
+        finished = asyncio.wrap_future(self._submit(loop, _pump, fn, args, emit, stop))
+        getter: Optional[asyncio.Future] = None
+        try:
+            while True:
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait({getter, finished}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield getter.result()
+                    continue
+                # Items are queued before the job's completion is delivered,
+                # so everything it produced is already waiting here.
+                while not queue.empty():
+                    yield queue.get_nowait()
+                finished.result()
+                return
+        finally:
+            stop.set()
+            if getter is not None and not getter.done():
+                getter.cancel()
+
+    def _submit(self, loop: asyncio.AbstractEventLoop, fn: Callable[..., Any], *args: Any) -> Future:
+        if self._in_flight >= self.workers + self.queue_depth:
+            raise PoolFullError(f"{self._in_flight} jobs already running or queued.")
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BrokenProcessPool:
+            # An earlier job killed a worker; this one was never started.
+            self._discard(self._executor)
+            future = self._get_executor().submit(fn, *args)
+        self._in_flight += 1
+        # Release the slot when the job really finishes, even if the awaiting
+        # request was cancelled, so abandoned work still counts against capacity.
+        future.add_done_callback(lambda _: self._release_from(loop))
+        return future
+
+    def _release_from(self, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            # The loop is already closed; nothing is left to admit.
+            pass
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+
+    def _discard(self, executor: Optional[Executor]) -> None:
+        # Only drop the pool that broke, not one already started in its place.
+        if executor is not None and executor is self._executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def _drain(fn: Callable[..., Iterable[Any]], args: tuple) -> List[Any]:
+    return list(fn(*args))
+
+
+def _pump(fn: Callable[..., Iterable[Any]], args: tuple, emit: Callable[[Any], None], stop: threading.Event) -> None:
+    for item in fn(*args):
+        if stop.is_set():
+            break
+        emit(item)
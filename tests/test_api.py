@@ -0,0 +1,65 @@
+import threading
+import unittest
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from pipeline import api
+from pipeline.workpool import WorkPool
+
+PDF_UPLOAD = {"pdf": ("paper.pdf", b"%PDF-1.4 not parsed", "application/pdf")}
+
+
+class ExtractAdmissionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+        def blocked(*args):
+            self.started.set()
+            self.release.wait(10)
+            raise api.PageLimitError("released")
+
+        def blocked_stream(*args):
+            blocked(*args)
+            yield
+
+        # One worker and no queue: a single upload in progress fills the pool.
+        patches = [
+            mock.patch.object(api, "EXTRACT_POOL", WorkPool("thread", workers=1, queue_depth=0)),
+            mock.patch.object(api, "_run_extraction", blocked),
+            mock.patch.object(api, "_stream_extraction", blocked_stream),
+            mock.patch.object(api, "_pdf_backend", return_value="pymupdf"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _post_while_busy(self, path: str):
+        with TestClient(api.app) as client:
+            first = []
+            thread = threading.Thread(target=lambda: first.append(client.post(path, files=PDF_UPLOAD)))
+            thread.start()
+            self.assertTrue(self.started.wait(5))
+            response = client.post(path, files=PDF_UPLOAD)
+            self.release.set()
+            thread.join(10)
+        # The admitted upload still runs to completion.
+        self.assertEqual(first[0].status_code, 400)
+        return response
+
+    def _assert_queue_full(self, response) -> None:
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["Retry-After"], str(api.EXTRACT_RETRY_AFTER_SECONDS))
+        self.assertEqual(response.json(), {"detail": "Extraction queue is full; retry later."})
+
+    def test_extract_rejects_uploads_when_the_pool_is_full(self) -> None:
+        self._assert_queue_full(self._post_while_busy("/extract"))
+
+    def test_extract_stream_rejects_uploads_when_the_pool_is_full(self) -> None:
+        self._assert_queue_full(self._post_while_busy("/extract/stream"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,415 @@
+import asyncio
+import hashlib
+import json
+import math
+import os
+import statistics
+import tempfile
+import threading
+import time
+import unittest
+import zlib
+from pathlib import Path
+from typing import Optional
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+from pipeline.datasets.cache import DatasetCache
+from pipeline.datasets import allen_brain, dandi, session
+from pipeline.datasets.paging import to_columns
+from pipeline.datasets.session import AsyncDatasetSession, DatasetSession, OfflineCacheMiss
+from pipeline.datasets.tables import to_arrays
+
+
+class _StubDatasets(ThreadingHTTPServer):
+    daemon_threads = True
+    # The async test opens 20 connections at once.
+    request_queue_size = 64
+
+    def __init__(self, delay: float = 0.0, failures: int = 0) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.delay = delay
+        self.failures = failures
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.not_modified = 0
+        self.paged_criteria = []
+        self.connections = set()
+        self.missing_specimens = set()
+        self.total_rows = 1
+        self.total_assets = 1
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _StubDatasets
+
+    def do_GET(self) -> None:
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.connections.add(self.client_address)
+            fail = self.server.failures > 0
+            self.server.failures -= fail
+        time.sleep(self.server.delay)
+        if fail:
+            self._send(503, {"error": "busy"}, {"Retry-After": "0"})
+            return
+
+        url = urlparse(self.path)
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+        if url.path.endswith("/data/query.json") and "start_row" in query:
+            start = int(query["start_row"])
+            criteria = query["criteria"]
+            self.server.paged_criteria.append(criteria)
+            total = range(self.server.total_rows)
+            if "EphysFeature" in criteria:
+                rows = [{"id": i, "specimen_id": i, "tau": i / 10} for i in total]
+            elif "NeuronReconstruction" in criteria:
+                # Only even specimens have a reconstruction.
+                rows = [{"id": i, "specimen_id": 2 * i, "total_length": float(i)} for i in total]
+            else:
+                rows = [{"specimen__id": i} for i in total]
+            if "specimen_id$in" in criteria:
+                wanted = criteria.split("specimen_id$in", 1)[1].split("]", 1)[0].split(",")
+                rows = [row for row in rows if str(row["specimen_id"]) in wanted]
+            page = rows[start:start + int(query["num_rows"])]
+            self._send(200, {"msg": page, "total_rows": len(rows)})
+        elif url.path.endswith("/data/query.json"):
+            criteria = query["criteria"]
+            if "$in" in criteria:
+                specimens = criteria.rsplit("$in", 1)[-1].rstrip("]").split(",")
+            else:
+                specimens = [criteria.rsplit("$eq", 1)[-1].rstrip("]") if "$eq" in criteria else "0"]
+            rows = [{"specimen__id": int(s)} for s in specimens if int(s) not in self.server.missing_specimens]
+            self._send(200, {"msg": rows})
+        elif url.path.endswith("/assets/"):
+            page, page_size = int(query.get("page", 1)), int(query["page_size"])
+            start = (page - 1) * page_size
+            stop = min(start + page_size, self.server.total_assets)
+            results = [{"asset_id": f"a{i}", "path": f"sub-{i}.nwb", "size": 2_000_000} for i in range(start, stop)]
+            more = stop < self.server.total_assets
+            next_url = f"{self.server.url}{url.path}?page={page + 1}&page_size={page_size}" if more else None
+            self._send(200, {"count": self.server.total_assets, "next": next_url, "results": results})
+        else:
+            self._send(200, {"name": "Example", "asset_count": 1, "size": 3_000_000_000})
+
+    def _send(self, status: int, body: dict, headers: Optional[dict] = None) -> None:
+        data = json.dumps(body).encode("utf-8")
+        etag = f'"{hashlib.sha1(data).hexdigest()}"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            with self.server.lock:
+                self.server.not_modified += 1
+            status, data = 304, b""
+        headers = {"ETag": etag, **(headers or {})}
+        self.send_response(status)
+        for name, value in {"Content-Type": "application/json", "Content-Length": str(len(data)), **headers}.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class DatasetSessionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # The shared session must not read or fill the user's cache.
+        env = mock.patch.dict(os.environ, {"AGENTSCIENCE_DATASET_CACHE_PATH": ""})
+        env.start()
+        self.addCleanup(env.stop)
+        session.close_session()
+
+    def _serve(self, **kwargs) -> _StubDatasets:
+        server = _StubDatasets(**kwargs)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(session.close_session)
+        return server
+
+    def test_sync_calls_reuse_one_connection(self) -> None:
+        server = self._serve()
+        with mock.patch.object(allen_brain, "BASE_URL", server.url), mock.patch.object(dandi, "BASE_URL", server.url):
+            cells = [allen_brain.get_cell(specimen_id) for specimen_id in range(5)]
+            summary = dandi.get_summary("000006")
+
+        self.assertEqual([cell["specimen__id"] for cell in cells], list(range(5)))
+        self.assertEqual((summary["name"], summary["total_size_gb"], len(summary["sample_files"])), ("Example", 3.0, 1))
+        self.assertEqual(server.requests, 7)
+        self.assertEqual(len(server.connections), 1)
+
+    def test_retries_busy_responses_with_backoff(self) -> None:
+        server = self._serve(failures=2)
+        client = DatasetSession(retries=2, backoff=0.01)
+        self.addCleanup(client.close)
+        self.assertEqual(client.get_json(f"{server.url}/data/query.json", {"criteria": "x$eq7]"}), {"msg": [{"specimen__id": 7}]})
+        self.assertEqual(server.requests, 3)
+
+        server.failures = 5
+        with self.assertRaises(httpx.HTTPStatusError):
+            client.get_json(f"{server.url}/data/query.json", {"criteria": "x"})
+        self.assertEqual(server.requests, 6)
+
+    def test_response_cache_revalidates_and_serves_offline(self) -> None:
+        server = self._serve()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        url = f"{server.url}/data/query.json"
+        cache = DatasetCache(Path(temp_dir.name) / "datasets.sqlite3", ttls=[(r"/data/", 60)], default_ttl=-1)
+        client = DatasetSession(cache=cache, offline=False)
+        self.addCleanup(client.close)
+
+        first = client.get_json(url, {"num_rows": 1, "criteria": "x$eq7]"})
+        self.assertEqual(client.get_json(url, {"criteria": "x$eq7]", "num_rows": 1}), first)
+        self.assertEqual(server.requests, 1)
+
+        # Dandiset metadata is always stale here, so each call revalidates.
+        meta_url = f"{server.url}/dandisets/000006/versions/draft/"
+        for _ in range(3):
+            self.assertEqual(client.get_json(meta_url)["name"], "Example")
+        self.assertEqual((server.requests, server.not_modified), (4, 2))
+
+        offline = DatasetSession(cache=cache, offline=True)
+        self.addCleanup(offline.close)
+        self.assertEqual(offline.get_json(meta_url)["name"], "Example")
+        with self.assertRaises(OfflineCacheMiss):
+            offline.get_json(url, {"criteria": "x$eq8]"})
+        self.assertEqual(server.requests, 4)
+
+        stats = cache.stats()
+        self.assertEqual(
+            {name: stats[name] for name in ("entries", "hits", "stale", "revalidated", "misses")},
+            {"entries": 2, "hits": 1, "stale": 3, "revalidated": 2, "misses": 3},
+        )
+
+        async def scenario() -> dict:
+            client = AsyncDatasetSession(cache=cache, offline=False)
+            try:
+                return await client.get_json(meta_url)
+            finally:
+                await client.aclose()
+
+        self.assertEqual(asyncio.run(scenario())["name"], "Example")
+        self.assertEqual((server.requests, server.not_modified, cache.revalidated), (5, 3, 3))
+
+    def test_dataset_cache_tracks_size_and_evicts(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            bodies = {name: json.dumps({"name": name, "pad": name * 200}).encode() for name in "abc"}
+            sizes = {name: len(zlib.compress(body)) for name, body in bodies.items()}
+            max_bytes = sum(sizes.values()) - 1
+            cache = DatasetCache(Path(temp_dir) / "datasets.sqlite3", max_bytes=max_bytes)
+            cache.put("a", bodies["a"])
+            cache.put("a", bodies["a"])
+            cache.put("b", bodies["b"])
+            self.assertEqual(cache.stats()["bytes"], sizes["a"] + sizes["b"])
+
+            cache.get("a")
+            cache.put("c", bodies["c"])
+            self.assertIsNone(cache.get("b"))
+            self.assertEqual(cache.get("a").json()["name"], "a")
+            self.assertEqual(cache.evictions, 1)
+            self.assertEqual(cache.stats()["bytes"], sizes["a"] + sizes["c"])
+
+            reopened = DatasetCache(Path(temp_dir) / "datasets.sqlite3", max_bytes=max_bytes)
+            self.assertEqual(reopened.stats()["bytes"], cache.stats()["bytes"])
+            reopened.clear()
+            self.assertEqual((reopened.stats()["entries"], reopened.stats()["bytes"]), (0, 0))
+
+    def test_get_cells_batches_ids_into_chunks(self) -> None:
+        server = self._serve()
+        server.missing_specimens = {7, 240}
+        ids = list(range(250)) + [3, 3]
+
+        with mock.patch.object(allen_brain, "BASE_URL", server.url):
+            result = allen_brain.get_cells(ids, chunk_size=100)
+            self.assertEqual(server.requests, 3)
+
+            async def scenario() -> dict:
+                try:
+                    return await allen_brain.async_get_cells(ids, chunk_size=60)
+                finally:
+                    await session.aclose_async_session()
+
+            async_result = asyncio.run(scenario())
+            self.assertEqual(server.requests, 3 + 5)
+
+        self.assertEqual(result["missing"], [7, 240])
+        self.assertEqual(list(result["cells"]), [i for i in range(250) if i not in (7, 240)])
+        self.assertEqual(result["cells"][42], {"specimen__id": 42})
+        self.assertEqual(async_result, result)
+
+    def test_iterators_walk_every_page(self) -> None:
+        server = self._serve()
+        server.total_rows = 250
+        server.total_assets = 230
+
+        with mock.patch.object(allen_brain, "BASE_URL", server.url), mock.patch.object(dandi, "BASE_URL", server.url):
+            cells = [cell["specimen__id"] for cell in allen_brain.iter_cells(page_size=100)]
+            self.assertEqual(cells, list(range(250)))
+            self.assertEqual(server.requests, 3)
+
+            features = list(allen_brain.iter_ephys_features(page_size=100, limit=150))
+            self.assertEqual(len(features), 150)
+            self.assertEqual(server.requests, 5)
+            self.assertTrue(server.paged_criteria[0].endswith("rma::options[order$eq'specimen__id']"))
+            self.assertTrue(server.paged_criteria[-1].endswith("rma::options[order$eq'id']"))
+
+            columns = to_columns(dandi.iter_assets("000006", page_size=100))
+            self.assertEqual(columns["path"][-1], "sub-229.nwb")
+            self.assertEqual(len(columns["asset_id"]), 230)
+            self.assertEqual(server.requests, 8)
+
+            async def scenario() -> list:
+                try:
+                    return [asset["asset_id"] async for asset in dandi.async_iter_assets("000006", page_size=50, limit=120)]
+                finally:
+                    await session.aclose_async_session()
+
+            self.assertEqual(asyncio.run(scenario()), [f"a{i}" for i in range(120)])
+            self.assertEqual(server.requests, 11)
+
+    def test_feature_table_joins_features_on_specimen_id(self) -> None:
+        server = self._serve()
+        server.total_rows = 5
+
+        with mock.patch.object(allen_brain, "BASE_URL", server.url):
+            table = allen_brain.get_feature_table(page_size=2)
+            ephys = allen_brain.get_ephys_features(num_rows=1, format="numpy")
+            requests = server.requests
+            with self.assertRaises(ValueError):
+                allen_brain.get_morphology_features(format="csv")
+            with self.assertRaises(ValueError):
+                allen_brain.get_feature_table(format="records")
+            self.assertEqual(server.requests, requests)
+
+        self.assertEqual(table["specimen__id"].tolist(), [0, 1, 2, 3, 4])
+        self.assertEqual(table["tau"].tolist(), [0.0, 0.1, 0.2, 0.3, 0.4])
+        self.assertEqual(table["id"].dtype.kind, "i")
+        self.assertEqual(str(table["morphology__id"].tolist()), "[0.0, nan, 1.0, nan, 2.0]")
+        self.assertEqual(ephys["specimen__id"].tolist(), [0])
+
+        stats = allen_brain.get_summary_stats(table, features=["tau", "total_length"])
+        self.assertEqual(stats["total_cells"], 5)
+        self.assertEqual(stats["features"]["total_length"]["by_region"]["unknown"]["count"], 3)
+        self.assertEqual(stats["features"]["tau"]["by_dendrite_type"]["unknown"]["median"], 0.2)
+
+    def test_limited_feature_table_fetches_only_its_cells_features(self) -> None:
+        def to_records(table):
+            return {name: column.tolist() for name, column in table.items()}
+
+        server = self._serve()
+        server.total_rows = 50
+
+        with mock.patch.object(allen_brain, "BASE_URL", server.url):
+            table = allen_brain.get_feature_table(limit=3, page_size=2)
+            async_table = asyncio.run(allen_brain.async_get_feature_table(limit=3, page_size=2))
+
+        self.assertEqual(table["specimen__id"].tolist(), [0, 1, 2])
+        self.assertEqual(table["tau"].tolist(), [0.0, 0.1, 0.2])
+        self.assertEqual(str(table["total_length"].tolist()), "[0.0, nan, 1.0]")
+        self.assertEqual(repr(to_records(async_table)), repr(to_records(table)))
+        # Per run: two ephys pages (three rows) and one morphology page.
+        features = [c for c in server.paged_criteria if "Feature" in c or "Reconstruction" in c]
+        self.assertEqual(len(features), 6)
+        self.assertTrue(all("[specimen_id$in0,1,2]" in criteria for criteria in features))
+
+    def test_summary_stats_group_by_region_and_dendrite_type(self) -> None:
+        regions = ["Primary visual area", None, "Primary motor area"]
+        cells = [
+            {
+                "specimen__id": i,
+                "donor__species": "Mus musculus" if i % 3 else "Homo Sapiens",
+                "structure__name": regions[i % 3],
+                "structure__acronym": "ACA" if i % 3 == 1 and i % 2 else None,
+                "tag__dendrite_type": ["spiny", "aspiny", ""][i % 4 % 3],
+                "ef__tau": None if i % 7 == 0 else (i * 37 % 101) / 3,
+                "ef__ri": float(i),
+            }
+            for i in range(120)
+        ]
+        stats = allen_brain.get_summary_stats(cells)
+        self.assertEqual(stats, allen_brain.get_summary_stats(to_arrays(cells)))
+        self.assertEqual(stats["species"], {"Mus musculus": 80, "Homo Sapiens": 40})
+        self.assertEqual(stats["brain_regions"], {"Primary motor area": 40, "Primary visual area": 40, "unknown": 20, "ACA": 20})
+        self.assertEqual(sum(sum(row.values()) for row in stats["region_dendrite_types"].values()), 120)
+        self.assertEqual(set(stats["features"]), {"ef__tau", "ef__ri"})
+
+        for region, summary in stats["features"]["ef__tau"]["by_region"].items():
+            values = [
+                cell["ef__tau"]
+                for cell in cells
+                if (cell["structure__name"] or cell["structure__acronym"] or "unknown") == region and cell["ef__tau"] is not None
+            ]
+            self.assertEqual(summary["count"], len(values))
+            self.assertEqual((summary["min"], summary["max"]), (min(values), max(values)))
+            self.assertEqual(summary["median"], statistics.median(values))
+            self.assertTrue(math.isclose(summary["mean"], statistics.fmean(values)))
+            self.assertTrue(math.isclose(summary["std"], statistics.pstdev(values)))
+
+        with self.assertRaises(ValueError):
+            allen_brain.get_summary_stats(cells, features=["ef__missing"])
+
+    def test_to_columns_fills_missing_keys(self) -> None:
+        rows = [{"a": 1}, {"a": 2, "b": "x"}, {"b": "y"}]
+        self.assertEqual(to_columns(rows), {"a": [1, 2, None], "b": [None, "x", "y"]})
+        self.assertEqual(to_columns([]), {})
+
+    def test_each_event_loop_keeps_its_own_async_session(self) -> None:
+        barrier = threading.Barrier(2)
+        results = {}
+
+        def run(name: str) -> None:
+            async def scenario() -> tuple:
+                first = session.get_async_session()
+                # Both loops are alive at once, on different threads.
+                await asyncio.to_thread(barrier.wait, 5)
+                second = session.get_async_session()
+                await session.aclose_async_session()
+                return first, second, first._client.is_closed
+
+            results[name] = asyncio.run(scenario())
+
+        threads = [threading.Thread(target=run, args=(name,)) for name in "ab"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        (a_first, a_second, a_closed), (b_first, b_second, b_closed) = results["a"], results["b"]
+        self.assertIs(a_first, a_second)
+        self.assertIs(b_first, b_second)
+        self.assertIsNot(a_first, b_first)
+        self.assertTrue(a_closed and b_closed)
+        self.assertEqual(len(session._async_sessions), 0)
+
+    def test_async_get_cell_fans_out(self) -> None:
+        server = self._serve(delay=0.1)
+
+        async def scenario() -> tuple:
+            try:
+                start = time.perf_counter()
+                cells = await asyncio.gather(*(allen_brain.async_get_cell(i) for i in range(20)))
+                summary = await dandi.async_get_summary("000006")
+                return cells, summary, time.perf_counter() - start
+            finally:
+                await session.aclose_async_session()
+
+        with mock.patch.object(allen_brain, "BASE_URL", server.url), mock.patch.object(dandi, "BASE_URL", server.url):
+            cells, summary, elapsed = asyncio.run(scenario())
+
+        self.assertEqual([cell["specimen__id"] for cell in cells], list(range(20)))
+        self.assertEqual(summary["asset_count"], 1)
+        # Sequential requests would take 22 * 0.1s.
+        self.assertLess(elapsed, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
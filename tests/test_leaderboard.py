@@ -1,12 +1,22 @@
+import json
+import random
+import tempfile
 import unittest
+from dataclasses import asdict
+from pathlib import Path
 
 from pipeline.leaderboard import (
     CitationCounts,
+    IncrementalLeaderboard,
     InfluenceEdge,
     LeaderboardPaper,
     compute_impact_leaderboard,
+    rank_paper_table,
     resolve_citation_count,
+    resolve_citations,
+    resolve_inherited_citations,
 )
+from pipeline.rank import load_paper_table
 
 
 class LeaderboardTests(unittest.TestCase):
@@ -48,6 +58,194 @@ class LeaderboardTests(unittest.TestCase):
         self.assertEqual(resolve_citation_count(citations, policy="max"), 100)
         self.assertEqual(resolve_citation_count(citations, policy="mean"), 77)
 
+    def test_resolve_citations_matches_per_paper_resolution(self) -> None:
+        rng = random.Random(9)
+
+        def counts() -> CitationCounts:
+            return CitationCounts(*(rng.choice([None, 0, 1, 2, 5, -3, 250]) for _ in range(3)))
+
+        papers = []
+        for i in range(80):
+            references = [counts() for _ in range(rng.randrange(4))]
+            weights = [rng.choice([None, 0.0, 0.5, 2.0]) for _ in references] if i % 2 else None
+            papers.append(LeaderboardPaper(f"p{i}", citations=counts(), reference_citations=references, reference_weights=weights))
+
+        for policy in ("max", "mean"):
+            direct = [resolve_citation_count(paper.citations, policy) for paper in papers]
+            inherited = [
+                resolve_inherited_citations(paper.reference_citations, policy, paper.reference_weights) for paper in papers
+            ]
+            reference = resolve_citations(papers, policy)
+            self.assertEqual((reference.direct, reference.inherited), (direct, inherited))
+            self.assertEqual(reference.effective, [d if d > 0 else i for d, i in zip(direct, inherited)])
+            self.assertEqual(resolve_citations(papers, policy, vectorized=True), reference)
+
+        with self.assertRaises(ValueError):
+            resolve_citations(papers, "median")
+
+    def test_numpy_engine_matches_python_reference(self) -> None:
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("numpy not installed")
+
+        rng = random.Random(7)
+        papers = [
+            LeaderboardPaper(
+                paper_id=f"p{i}",
+                novelty_score=rng.random(),
+                evidence_score=rng.random(),
+                citations=CitationCounts(openalex=rng.choice([None, 0, 5, 500])),
+            )
+            for i in range(60)
+        ]
+        ids = [paper.paper_id for paper in papers] + ["missing"]
+        edges = [
+            InfluenceEdge(
+                source_id=rng.choice(ids[:40]),
+                target_id=rng.choice(ids),
+                kind=rng.choice(["citation", "llm_inferred", "other"]),
+                confidence=rng.random(),
+            )
+            for _ in range(200)
+        ]
+
+        reference = compute_impact_leaderboard(papers=papers, edges=edges, engine="python")
+        vectorized = compute_impact_leaderboard(papers=papers, edges=edges, engine="numpy")
+
+        self.assertEqual([item["paper_id"] for item in vectorized], [item["paper_id"] for item in reference])
+        for fast, slow in zip(vectorized, reference):
+            self.assertAlmostEqual(fast["pagerank_score"], slow["pagerank_score"], places=6)
+            self.assertAlmostEqual(fast["impact_score"], slow["impact_score"], places=6)
+
+    def test_unknown_engine_is_rejected(self) -> None:
+        papers = [LeaderboardPaper(paper_id="p1")]
+        with self.assertRaises(ValueError):
+            compute_impact_leaderboard(papers=papers, edges=[], engine="gpu")
+
+    def test_top_k_pages_and_fields_match_full_ranking(self) -> None:
+        rng = random.Random(11)
+        papers = [
+            LeaderboardPaper(
+                paper_id=f"p{i}",
+                novelty_score=rng.choice([0.1, 0.5]),
+                evidence_score=rng.choice([0.2, 0.8]),
+                citations=CitationCounts(openalex=rng.choice([None, 3, 30])),
+            )
+            for i in range(40)
+        ]
+        edges = [
+            InfluenceEdge(source_id=f"p{rng.randrange(40)}", target_id=f"p{rng.randrange(10)}")
+            for _ in range(60)
+        ]
+        full = compute_impact_leaderboard(papers=papers, edges=edges)
+
+        self.assertEqual(compute_impact_leaderboard(papers=papers, edges=edges, top_k=5), full[:5])
+        self.assertEqual(compute_impact_leaderboard(papers=papers, edges=edges, offset=10, limit=7), full[10:17])
+        self.assertEqual(compute_impact_leaderboard(papers=papers, edges=edges, top_k=12, offset=10, limit=7), full[10:12])
+        self.assertEqual(compute_impact_leaderboard(papers=papers, edges=edges, offset=50), [])
+
+        slim = compute_impact_leaderboard(papers=papers, edges=edges, limit=3, fields=["impact_score", "paper_id"])
+        self.assertEqual(slim, [{"paper_id": item["paper_id"], "impact_score": item["impact_score"]} for item in full[:3]])
+
+        with self.assertRaises(ValueError):
+            compute_impact_leaderboard(papers=papers, edges=edges, fields=["abstract"])
+        with self.assertRaises(ValueError):
+            compute_impact_leaderboard(papers=papers, edges=edges, offset=-1)
+
+    def test_paper_table_from_files_matches_in_memory_ranking(self) -> None:
+        rng = random.Random(5)
+        papers = [
+            LeaderboardPaper(
+                paper_id=f"p{i}",
+                title=f"Paper {i}",
+                novelty_score=rng.random(),
+                evidence_score=rng.random(),
+                citations=CitationCounts(openalex=rng.choice([None, 0, 8]), scholar_csv=rng.choice([None, 40])),
+                reference_citations=[CitationCounts(semantic_scholar=rng.randrange(100))] if i % 4 == 0 else [],
+            )
+            for i in range(50)
+        ]
+        edges = [
+            InfluenceEdge(
+                source_id=f"p{rng.randrange(50)}",
+                target_id=rng.choice([f"p{rng.randrange(50)}", "missing"]),
+                kind=rng.choice(["citation", "llm_inferred"]),
+                confidence=rng.random(),
+            )
+            for _ in range(150)
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            papers_path = Path(temp_dir) / "papers.jsonl"
+            edges_path = Path(temp_dir) / "edges.jsonl"
+            lines = []
+            for index, paper in enumerate(papers):
+                record = asdict(paper)
+                if index % 2:
+                    # Flat citation columns, as a Parquet export would have them.
+                    record.update(record.pop("citations"))
+                lines.append(json.dumps(record))
+            papers_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            edges_path.write_text("".join(json.dumps(asdict(edge)) + "\n" for edge in edges), encoding="utf-8")
+
+            for policy in ("max", "mean"):
+                table = load_paper_table(papers_path, edges_path, citation_policy=policy)
+                self.assertEqual(len(table), 50)
+                for engine in ("python", "numpy"):
+                    expected = compute_impact_leaderboard(papers, edges, citation_policy=policy, engine=engine)
+                    self.assertEqual(rank_paper_table(table, engine=engine), expected)
+                    self.assertEqual(rank_paper_table(table, engine=engine, top_k=8, offset=3), expected[3:8])
+
+            with self.assertRaises(ValueError):
+                load_paper_table(papers_path).add_paper({"paper_id": "p1"})
+
+    def test_incremental_leaderboard_tracks_full_recompute(self) -> None:
+        rng = random.Random(3)
+        papers = [
+            LeaderboardPaper(
+                paper_id=f"p{i}",
+                novelty_score=rng.random(),
+                evidence_score=rng.random(),
+                citations=CitationCounts(openalex=rng.choice([None, 3, 40])),
+            )
+            for i in range(30)
+        ]
+        edges = [
+            InfluenceEdge(source_id=f"p{rng.randrange(30)}", target_id=f"p{rng.randrange(30)}", confidence=rng.random())
+            for _ in range(80)
+        ]
+        board = IncrementalLeaderboard(
+            papers[:25],
+            edges,
+            engine="python",
+            iterations=1000,
+            tolerance=1e-14,
+            push_tolerance=1e-13,
+            max_pushes=10**6,
+        )
+
+        def assert_matches(current_papers, current_edges) -> None:
+            expected = compute_impact_leaderboard(
+                current_papers, current_edges, engine="python", iterations=1000, tolerance=1e-14
+            )
+            actual = {item["paper_id"]: item for item in board.leaderboard()}
+            self.assertEqual(len(actual), len(expected))
+            for item in expected:
+                self.assertAlmostEqual(actual[item["paper_id"]]["pagerank_score"], item["pagerank_score"], places=5)
+
+        initial_ids = {paper.paper_id for paper in papers[:25]}
+        initial_edges = [e for e in edges if e.source_id in initial_ids and e.target_id in initial_ids]
+        board.update(add_papers=papers[25:], add_edges=edges)
+        assert_matches(papers, initial_edges + edges)
+
+        self.assertTrue(board.remove_edge(edges[0]))
+        board.remove_paper("p3")
+        remaining_papers = [p for p in papers if p.paper_id != "p3"]
+        assert_matches(remaining_papers, initial_edges + edges[1:])
+        self.assertEqual(board.rebuilds, 1)
+        self.assertGreater(board.pushes, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,168 @@
+import asyncio
+import json
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from pipeline.citation_cache import CitationCache
+from pipeline.openalex import OpenAlexClient, normalize_doi, normalize_query
+
+
+class _StubOpenAlex(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, delay: float) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.requests = 0
+        self.empty_queries = set()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: _StubOpenAlex
+
+    def do_GET(self) -> None:
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+        try:
+            time.sleep(self.server.delay)
+            if self.path.startswith("/works/https://doi.org/"):
+                body = {"cited_by_count": 42}
+            elif any(query in self.path for query in self.server.empty_queries):
+                body = {"results": []}
+            else:
+                body = {"results": [{"cited_by_count": 7}]}
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def _payload(n_ideas: int) -> dict:
+    return {
+        "metadata": {"doi": "10.1000/example", "title": "Example"},
+        "key_ideas": [{"text": f"We show idea {i}.", "scores": {}} for i in range(n_ideas)],
+    }
+
+
+class OpenAlexTests(unittest.TestCase):
+    def _serve(self, delay: float) -> _StubOpenAlex:
+        server = _StubOpenAlex(delay)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_enrich_fans_out_idea_lookups(self) -> None:
+        server = self._serve(delay=0.3)
+
+        async def scenario() -> tuple:
+            client = OpenAlexClient(server.url, max_concurrency=8)
+            try:
+                start = time.perf_counter()
+                payload = await client.enrich(_payload(6))
+                return payload, time.perf_counter() - start
+            finally:
+                await client.aclose()
+
+        payload, elapsed = asyncio.run(scenario())
+
+        self.assertEqual(payload["citations"], {"openalex": 42, "partial": False})
+        self.assertEqual([idea["scores"]["openalex_citations"] for idea in payload["key_ideas"]], [7] * 6)
+        self.assertEqual(server.requests, 7)
+        self.assertGreaterEqual(server.max_active, 4)
+        # Sequential lookups would take 7 * 0.3s.
+        self.assertLess(elapsed, 1.5)
+
+    def test_enrich_returns_partial_results_at_deadline(self) -> None:
+        server = self._serve(delay=1.0)
+
+        async def scenario() -> tuple:
+            client = OpenAlexClient(server.url, max_concurrency=2)
+            try:
+                start = time.perf_counter()
+                payload = await client.enrich(_payload(4), deadline=0.2)
+                return payload, time.perf_counter() - start
+            finally:
+                await client.aclose()
+
+        payload, elapsed = asyncio.run(scenario())
+
+        self.assertTrue(payload["citations"]["partial"])
+        self.assertIsNone(payload["citations"]["openalex"])
+        self.assertEqual([idea["scores"]["openalex_citations"] for idea in payload["key_ideas"]], [0] * 4)
+        self.assertLess(elapsed, 0.9)
+        self.assertLessEqual(server.max_active, 2)
+
+    def test_citation_cache_serves_repeats_and_caches_misses(self) -> None:
+        server = self._serve(delay=0.0)
+        server.empty_queries.add("unknown")
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        cache = CitationCache(Path(temp_dir.name) / "openalex.sqlite3", ttl=60, negative_ttl=60)
+
+        async def scenario() -> list:
+            client = OpenAlexClient(server.url, cache=cache)
+            try:
+                return [
+                    await client.citation_count("https://doi.org/10.1000/EXAMPLE", None),
+                    await client.citation_count("10.1000/example", None),
+                    await client.citations_for_idea("We show idea one."),
+                    await client.citations_for_idea("we show  idea one"),
+                    await client.citations_for_idea("An unknown result."),
+                    await client.citations_for_idea("An unknown result!"),
+                ]
+            finally:
+                await client.aclose()
+
+        counts = asyncio.run(scenario())
+
+        self.assertEqual(counts, [42, 42, 7, 7, None, None])
+        self.assertEqual(server.requests, 3)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["negative_hits"], stats["misses"]), (2, 1, 3))
+        self.assertEqual(stats["entries"], 3)
+
+    def test_citation_cache_expires_and_evicts(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = CitationCache(Path(temp_dir) / "openalex.sqlite3", ttl=60, negative_ttl=-1, max_entries=2)
+            cache.put("search:missing", None)
+            self.assertEqual(cache.get("search:missing"), (False, None))
+            self.assertEqual(cache.expired, 1)
+
+            cache.put("doi:a", 1)
+            cache.put("doi:b", 2)
+            cache.put("doi:c", 3)
+            self.assertEqual(cache.get("doi:a"), (False, None))
+            self.assertEqual(cache.get("doi:c"), (True, 3))
+            self.assertEqual(cache.evictions, 1)
+
+    def test_lookup_key_normalization(self) -> None:
+        self.assertEqual(normalize_doi("https://dx.doi.org/10.1000/ABC"), "10.1000/abc")
+        self.assertEqual(normalize_doi("doi:10.1000/abc"), "10.1000/abc")
+        self.assertEqual(normalize_query("  We show: a NEW map!"), "we show a new map")
+
+
+if __name__ == "__main__":
+    unittest.main()
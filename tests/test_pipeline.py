@@ -1,11 +1,32 @@
+import asyncio
 import json
+import multiprocessing
+import os
 import tempfile
+import threading
 import unittest
+from dataclasses import fields
 from pathlib import Path
+from typing import List, Optional
+from unittest import mock
 
+from pipeline import jsonio
+from pipeline.cache import ExtractionCache
 from pipeline.claim_extract import extract_claims
-from pipeline.extract import run_pipeline
-from pipeline.text_extract import extract_metadata_from_tex, parse_latex_sections
+from pipeline.extract import BatchJob, PageClaims, jobs_from_dir, run_batch, run_pipeline, stream_pipeline
+from pipeline.matching import PhraseMatcher, match_phrases
+from pipeline.scoring import RunningTopK, select_breakthroughs, select_key_ideas
+from pipeline.text_extract import (
+    PDF_BACKENDS,
+    PdfDocument,
+    extract_metadata_from_tex,
+    extract_pdf_pages,
+    iter_sections_from_pdf,
+    parse_latex_sections,
+    resolve_pdf_backend,
+)
+from pipeline.types import Claim, Evidence, ExtractionResult, PaperMetadata
+from pipeline.workpool import PoolFullError, WorkerLostError, WorkPool
 
 
 TEX_SAMPLE = r"""
@@ -28,6 +49,19 @@ We report previously unknown synaptic dynamics.
 """
 
 
+def _crash_worker() -> None:
+    os._exit(1)
+
+
+def _crash_on_tex(stem: str):
+    def run(pdf, tex, *args, **kwargs):
+        if tex is not None and Path(tex).stem == stem:
+            _crash_worker()
+        return run_pipeline(pdf, tex, *args, **kwargs)
+
+    return run
+
+
 class PipelineTests(unittest.TestCase):
     def test_metadata_and_sections_from_tex(self) -> None:
         metadata = extract_metadata_from_tex(TEX_SAMPLE)
@@ -46,18 +80,464 @@ class PipelineTests(unittest.TestCase):
         self.assertTrue(any("demonstrate" in c.cues[0] for c in claims))
         self.assertGreaterEqual(len(claims), 1)
 
+    def test_evidence_linking_skips_claim_sentence(self) -> None:
+        text = (
+            "We show a novel effect (p < 0.01). "
+            "We report new hippocampal dynamics. "
+            "Accuracy rose by 12% (Figure 2)."
+        )
+        claims = extract_claims("results", text, 3, "pdf")
+        by_text = {c.text: c for c in claims}
+
+        evidence_claim = by_text["We show a novel effect (p < 0.01)."]
+        self.assertEqual([e.text for e in evidence_claim.evidence], ["Accuracy rose by 12% (Figure 2)."])
+        self.assertEqual(evidence_claim.scores["evidence"], 1.0)
+
+        plain_claim = by_text["We report new hippocampal dynamics."]
+        self.assertEqual(
+            [e.text for e in plain_claim.evidence],
+            ["We show a novel effect (p < 0.01).", "Accuracy rose by 12% (Figure 2)."],
+        )
+        self.assertEqual(plain_claim.scores["evidence"], 0.0)
+        self.assertEqual(plain_claim.evidence[0].page, 3)
+
+    def test_phrase_matcher_respects_word_boundaries(self) -> None:
+        hits = match_phrases("The renewal of synapses is a new, first-of-its-kind neuronal finding.")
+        self.assertEqual(hits.cues, ("first", "new"))
+        self.assertEqual(hits.breakthrough, ("first",))
+        self.assertEqual(hits.neuroscience, ("neuron", "synapse"))
+        self.assertEqual(match_phrases("Renewal rates were stable.").cues, ())
+
+    def test_phrase_matcher_substring_mode_finds_overlaps(self) -> None:
+        matcher = PhraseMatcher({"kw": (["neuron", "neurons", "on"], False)}, word_boundaries=False)
+        self.assertEqual(matcher.find("Recorded NEURONS")["kw"], frozenset({"neuron", "neurons", "on"}))
+
     def test_run_pipeline_tex_only(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             tex_path = Path(temp_dir) / "paper.tex"
             tex_path.write_text(TEX_SAMPLE, encoding="utf-8")
 
-            result = run_pipeline(pdf_path=None, tex_path=tex_path, top_key_ideas=3, top_breakthroughs=2)
+            result = run_pipeline(pdf=None, tex=tex_path, top_key_ideas=3, top_breakthroughs=2)
             data = result.to_dict()
 
             self.assertEqual(data["metadata"]["title"], "Neural Circuit Discovery")
             self.assertGreaterEqual(len(data["key_ideas"]), 1)
             self.assertIsInstance(json.dumps(data), str)
 
+    def test_serializers_cover_every_field(self) -> None:
+        evidence = Evidence(text="Accuracy rose by 12%.", section="results", page=2, source="pdf")
+        claim = Claim(text="We show X.", section="results", page=2, source="pdf", cues=["we show"], evidence=[evidence])
+        metadata = PaperMetadata(title="T", doi="10.1/x")
+
+        for item in (evidence, claim, metadata):
+            self.assertFalse(hasattr(item, "__dict__"))
+            self.assertEqual(list(item.to_dict()), [f.name for f in fields(item)])
+            self.assertEqual(type(item).from_dict(item.to_dict()), item)
+
+        data = claim.to_dict()
+        data["scores"]["openalex_citations"] = 3
+        data["cues"].append("novel")
+        self.assertEqual((claim.scores, claim.cues), ({}, ["we show"]))
+
+    def test_compact_layout_round_trips(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tex_path = Path(temp_dir) / "paper.tex"
+            tex_path.write_text(TEX_SAMPLE, encoding="utf-8")
+            result = run_pipeline(pdf=None, tex=tex_path, top_key_ideas=3, top_breakthroughs=2)
+
+            compact = json.loads(json.dumps(result.to_compact_dict()))
+            loaded = ExtractionResult.from_dict(compact)
+
+            self.assertEqual(loaded.to_dict(), result.to_dict())
+            self.assertEqual(len(compact["claims"]), len(result.all_claims))
+            self.assertEqual(len({tuple(e.values()) for e in compact["evidence"]}), len(compact["evidence"]))
+            self.assertTrue(any(k is c for k in loaded.key_ideas for c in loaded.all_claims))
+            self.assertLess(len(json.dumps(compact)), len(json.dumps(result.to_dict())))
+
+    def test_both_layouts_match_schema(self) -> None:
+        try:
+            import jsonschema  # type: ignore
+        except ImportError:
+            self.skipTest("jsonschema not installed")
+
+        schema = json.loads((Path(__file__).resolve().parents[1] / "pipeline" / "schema.json").read_text())
+        result = run_pipeline(pdf=None, tex=TEX_SAMPLE.encode("utf-8"), top_key_ideas=3, top_breakthroughs=2, cache=None)
+        compact = json.loads(json.dumps(result.to_compact_dict()))
+        verbose = json.loads(json.dumps(result.to_dict()))
+        jsonschema.validate(compact, schema)
+        jsonschema.validate(verbose, schema)
+
+        with self.assertRaises(jsonschema.ValidationError):
+            jsonschema.validate({**verbose, "layout": "compact-v1"}, schema)
+        with self.assertRaises(jsonschema.ValidationError):
+            jsonschema.validate({**compact, "all_claims": verbose["all_claims"]}, schema)
+
+    def test_json_backends_encode_identically(self) -> None:
+        result = run_pipeline(pdf=None, tex=TEX_SAMPLE.encode("utf-8"), top_key_ideas=3, top_breakthroughs=2, cache=None)
+        payload = {**result.to_dict(), "note": "Ca²⁺ imaging", "counts": {1: 3}}
+
+        backends = ["stdlib"] + (["orjson"] if jsonio.orjson is not None else [])
+        encoded = [jsonio.dumps(payload, backend=backend) for backend in backends]
+        for data in encoded:
+            self.assertNotIn(b"\n", data)
+            self.assertEqual(json.loads(data), json.loads(encoded[0]))
+        self.assertEqual(json.loads(encoded[0])["counts"], {"1": 3})
+        self.assertEqual(json.loads(jsonio.dumps(payload, pretty=True)), json.loads(encoded[0]))
+
+    def test_stream_pipeline_emits_sections_then_result(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tex_path = Path(temp_dir) / "paper.tex"
+            tex_path.write_text(TEX_SAMPLE, encoding="utf-8")
+
+            events = list(stream_pipeline(pdf=None, tex=tex_path, top_key_ideas=2, top_breakthroughs=2))
+            result = events[-1]
+            pages = events[:-1]
+
+            self.assertIsInstance(result, ExtractionResult)
+            self.assertTrue(all(isinstance(event, PageClaims) for event in pages))
+            self.assertEqual([c for event in pages for c in event.claims], result.all_claims)
+            self.assertEqual(result.key_ideas, select_key_ideas(result.all_claims, top_n=2))
+            self.assertEqual(result.breakthroughs, select_breakthroughs(result.all_claims, top_n=2))
+
+    def _write_pdf(self, path: Path, n_pages: int = 0, texts: Optional[List[str]] = None) -> None:
+        try:
+            import fitz  # type: ignore
+        except ImportError:
+            self.skipTest("pymupdf not installed")
+
+        if texts is None:
+            texts = [f"Page {i + 1}: we show a novel neuron effect." for i in range(n_pages)]
+        doc = fitz.open()
+        for text in texts:
+            doc.new_page().insert_text((72, 72), text)
+        doc.save(str(path))
+        doc.close()
+
+    def test_pdf_sections_follow_headings_across_pages(self) -> None:
+        pages = [
+            (1, "A Circuit Paper\nAbstract: We propose a novel circuit model.\n1"),
+            (2, "1. Introduction\nWe introduce a new hypothesis.\n2 Results\nWe show that decoding\n2"),
+            (3, "improved by 12 % (Figure 2). We report new synaptic dynamics.\nREFERENCES\n[1] First paper."),
+        ]
+        sections = list(iter_sections_from_pdf(pages))
+
+        self.assertEqual([(s.name, s.page) for s in sections], [
+            ("pdf_page", 1),
+            ("abstract", 1),
+            ("introduction", 2),
+            ("results", 2),
+        ])
+        results = sections[3]
+        self.assertNotIn("\n2\n", results.text)
+        self.assertEqual(len(results.page_breaks), 1)
+
+        claims = extract_claims(results.name, results.text, results.page, "pdf", results.page_breaks)
+        by_text = {claim.text: claim for claim in claims}
+        crossing = by_text["We show that decoding improved by 12 % (Figure 2)."]
+        self.assertEqual(crossing.page, 2)
+        self.assertEqual(by_text["We report new synaptic dynamics."].page, 3)
+        self.assertEqual([(e.text, e.page) for e in by_text["We report new synaptic dynamics."].evidence], [
+            ("We show that decoding improved by 12 % (Figure 2).", 2),
+        ])
+
+        no_headings = list(iter_sections_from_pdf([(1, "We show a thing."), (2, "We report more.")]))
+        self.assertEqual([(s.name, s.page) for s in no_headings], [("pdf_page", 1), ("pdf_page", 2)])
+
+    def test_text_after_references_yields_no_claims(self) -> None:
+        pages = [
+            (1, "2 Results\nWe show that decoding improved by 12 %."),
+            (2, "References\n[1] A novel map of cortex.\nWe show the first atlas.\n"
+                "Acknowledgments\nWe propose to thank our funders."),
+            (3, "Appendix\nWe demonstrate a novel supplementary effect."),
+        ]
+        sections = list(iter_sections_from_pdf(pages))
+        self.assertEqual([s.name for s in sections], ["results"])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = Path(temp_dir) / "paper.pdf"
+            self._write_pdf(pdf_path, texts=[text for _, text in pages])
+            result = run_pipeline(pdf=pdf_path, tex=None, top_key_ideas=3, top_breakthroughs=2)
+
+        self.assertEqual([claim.text for claim in result.all_claims], ["We show that decoding improved by 12 %."])
+
+    def test_parallel_pdf_pages_match_sequential(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = Path(temp_dir) / "paper.pdf"
+            self._write_pdf(pdf_path, 5)
+
+            sequential = extract_pdf_pages(str(pdf_path))
+            parallel = extract_pdf_pages(str(pdf_path), workers=2)
+
+            self.assertEqual([page for page, _ in sequential], [1, 2, 3, 4, 5])
+            self.assertIn("Page 4", sequential[3][1])
+            self.assertEqual(parallel, sequential)
+
+    def test_run_pipeline_accepts_pdf_bytes_and_open_document(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = Path(temp_dir) / "paper.pdf"
+            self._write_pdf(pdf_path, 3)
+            pdf_bytes = pdf_path.read_bytes()
+
+            from_path = run_pipeline(pdf=pdf_path, tex=None, top_key_ideas=3, top_breakthroughs=2)
+            from_bytes = run_pipeline(pdf=pdf_bytes, tex=None, top_key_ideas=3, top_breakthroughs=2)
+            with PdfDocument(pdf_bytes) as document:
+                self.assertEqual(document.page_count, 3)
+                from_document = run_pipeline(pdf=document, tex=None, top_key_ideas=3, top_breakthroughs=2)
+                # The caller's handle stays usable after extraction.
+                self.assertEqual(len(extract_pdf_pages(document)), 3)
+
+            self.assertEqual(len(from_path.all_claims), 3)
+            self.assertEqual(from_bytes.to_dict(), from_path.to_dict())
+            self.assertEqual(from_document.to_dict(), from_path.to_dict())
+
+    def test_pdf_backends_are_selectable(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = Path(temp_dir) / "paper.pdf"
+            self._write_pdf(pdf_path, 2)
+
+            for backend in ("pymupdf", "pdfplumber"):
+                if not PDF_BACKENDS[backend].available():
+                    continue
+                with PdfDocument(pdf_path, backend) as document:
+                    self.assertEqual(document.backend, backend)
+                    pages = list(document.iter_pages())
+                self.assertEqual([page for page, _ in pages], [1, 2])
+                self.assertIn("novel neuron effect", pages[1][1])
+
+            text_path = Path(temp_dir) / "paper.txt"
+            text_path.write_text("We show a novel effect.\fWe report new dynamics.\f", encoding="utf-8")
+            self.assertEqual(
+                extract_pdf_pages(str(text_path), backend="text"),
+                [(1, "We show a novel effect."), (2, "We report new dynamics.")],
+            )
+            result = run_pipeline(text_path, None, top_key_ideas=3, top_breakthroughs=2, pdf_backend="text")
+            self.assertEqual([claim.page for claim in result.all_claims], [1, 2])
+
+            with self.assertRaises(ValueError):
+                PdfDocument(pdf_path, "text")
+            with self.assertRaises(ValueError):
+                resolve_pdf_backend("ocr")
+
+    def test_running_top_k_matches_stable_sort(self) -> None:
+        claims = [
+            Claim(text=str(i), section="results", page=None, source="tex", scores={"total": score})
+            for i, score in enumerate([0.5, 0.9, 0.5, 0.1, 0.9, 0.5])
+        ]
+        top = RunningTopK(4)
+        for claim in claims:
+            top.push(claim)
+        self.assertEqual([c.text for c in top.items()], [c.text for c in select_key_ideas(claims, top_n=4)])
+
+    def test_run_pipeline_cache_hit_is_identical(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tex_path = Path(temp_dir) / "paper.tex"
+            tex_path.write_text(TEX_SAMPLE, encoding="utf-8")
+            cache = ExtractionCache(Path(temp_dir) / "cache.sqlite3")
+
+            first = run_pipeline(pdf=None, tex=tex_path, top_key_ideas=3, top_breakthroughs=2, cache=cache)
+            second = run_pipeline(pdf=None, tex=tex_path, top_key_ideas=3, top_breakthroughs=2, cache=cache)
+            uncached = run_pipeline(pdf=None, tex=tex_path, top_key_ideas=3, top_breakthroughs=2)
+
+            self.assertEqual(first.to_dict(), second.to_dict())
+            self.assertEqual(first.paper_id, uncached.paper_id)
+
+    def test_extraction_cache_evicts_least_recently_used(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tex_path = Path(temp_dir) / "paper.tex"
+            tex_path.write_text(TEX_SAMPLE, encoding="utf-8")
+            result = run_pipeline(pdf=None, tex=tex_path, top_key_ideas=3, top_breakthroughs=2)
+
+            probe = ExtractionCache(Path(temp_dir) / "probe.sqlite3")
+            probe.put("probe", result)
+            with probe._connect() as conn:
+                entry_size = conn.execute("SELECT size FROM entries").fetchone()[0]
+
+            cache = ExtractionCache(Path(temp_dir) / "cache.sqlite3", max_bytes=entry_size * 2)
+            cache.put("a", result)
+            cache.put("b", result)
+            self.assertIsNotNone(cache.get("a"))
+            cache.put("c", result)
+
+            self.assertIsNotNone(cache.get("a"))
+            self.assertIsNone(cache.get("b"))
+            self.assertIsNotNone(cache.get("c"))
+
+    def test_run_batch_streams_results_and_records_failures(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "a.tex").write_text(TEX_SAMPLE, encoding="utf-8")
+            (root / "b.tex").write_text(TEX_SAMPLE, encoding="utf-8")
+            jobs = jobs_from_dir(root)
+            jobs.append(BatchJob(pdf_path=root / "missing.pdf"))
+            out_path = root / "out.jsonl"
+
+            counts = run_batch(jobs, out_path, top_key_ideas=3, top_breakthroughs=2, workers=2)
+            records = [json.loads(line) for line in out_path.read_text(encoding="utf-8").splitlines()]
+
+            self.assertEqual(counts, {"ok": 2, "failed": 1})
+            self.assertEqual(len(records), 3)
+            failed = [r for r in records if "error" in r]
+            self.assertEqual(failed[0]["pdf"], str(root / "missing.pdf"))
+            ok = [r for r in records if "result" in r]
+            self.assertEqual(ok[0]["result"]["metadata"]["title"], "Neural Circuit Discovery")
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == "fork", "workers must inherit the patched pipeline")
+    def test_run_batch_survives_a_crashing_worker(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            for i in range(12):
+                (root / f"paper{i:02}.tex").write_text(TEX_SAMPLE, encoding="utf-8")
+            out_path = root / "out.jsonl"
+
+            with mock.patch("pipeline.extract.run_pipeline", _crash_on_tex("paper04")):
+                counts = run_batch(jobs_from_dir(root), out_path, top_key_ideas=3, top_breakthroughs=2, workers=1)
+            records = [json.loads(line) for line in out_path.read_text(encoding="utf-8").splitlines()]
+
+            self.assertEqual(counts, {"ok": 11, "failed": 1})
+            self.assertEqual(sorted(r["tex"] for r in records), sorted(str(job.tex_path) for job in jobs_from_dir(root)))
+            failed = [r for r in records if "error" in r]
+            self.assertEqual(failed[0]["tex"], str(root / "paper04.tex"))
+            self.assertIn("BrokenProcessPool", failed[0]["error"])
+
+    def test_run_batch_submits_through_a_bounded_window(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "a.tex").write_text(TEX_SAMPLE, encoding="utf-8")
+            out_path = root / "out.jsonl"
+            written_when_pulled = []
+
+            def jobs():
+                for _ in range(6):
+                    written = out_path.read_bytes().count(b"\n") if out_path.exists() else 0
+                    written_when_pulled.append(written)
+                    yield BatchJob(tex_path=root / "a.tex")
+
+            counts = run_batch(jobs(), out_path, top_key_ideas=3, top_breakthroughs=2, workers=1)
+
+            self.assertEqual(counts, {"ok": 6, "failed": 0})
+            # One worker keeps at most two jobs submitted, so job i is only
+            # pulled once all but the last two before it were written.
+            for i, written in enumerate(written_when_pulled):
+                self.assertGreaterEqual(written, i - 2)
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == "fork", "workers must inherit the patched backend")
+    def test_papers_with_tex_need_no_pdf_backend(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "a.tex").write_text(TEX_SAMPLE, encoding="utf-8")
+            # Never parsed: the TeX sections win, and b.pdf fails first.
+            (root / "a.pdf").write_bytes(b"%PDF-1.4 not parsed")
+            (root / "b.pdf").write_bytes(b"%PDF-1.4 not parsed")
+            out_path = root / "out.jsonl"
+            missing = ImportError("PDF extraction requires `pymupdf` (fitz) or `pdfplumber`.")
+
+            with mock.patch("pipeline.extract.resolve_pdf_backend", side_effect=missing):
+                result = run_pipeline(root / "a.pdf", root / "a.tex", top_key_ideas=3, top_breakthroughs=2)
+                self.assertEqual({claim.source for claim in result.all_claims}, {"tex"})
+
+                counts = run_batch(jobs_from_dir(root), out_path, top_key_ideas=3, top_breakthroughs=2, workers=1)
+            records = {Path(r["pdf"]).stem: r for r in map(json.loads, out_path.read_text(encoding="utf-8").splitlines())}
+
+            self.assertEqual(counts, {"ok": 1, "failed": 1})
+            self.assertIn("result", records["a"])
+            self.assertTrue(records["b"]["error"].startswith("ImportError"))
+
+    def test_work_pool_rejects_when_queue_is_full(self) -> None:
+        release = threading.Event()
+
+        async def scenario() -> None:
+            pool = WorkPool("thread", workers=1, queue_depth=1)
+            try:
+                running = asyncio.ensure_future(pool.run(release.wait))
+                queued = asyncio.ensure_future(pool.run(lambda: "queued"))
+                await asyncio.sleep(0)
+                self.assertEqual(pool.in_flight, 2)
+                with self.assertRaises(PoolFullError):
+                    await pool.run(lambda: "rejected")
+
+                release.set()
+                self.assertTrue(await running)
+                self.assertEqual(await queued, "queued")
+                await asyncio.sleep(0)
+                self.assertEqual(pool.in_flight, 0)
+                self.assertEqual(await pool.run(lambda: "admitted"), "admitted")
+            finally:
+                release.set()
+                pool.shutdown()
+
+        asyncio.run(scenario())
+
+    def test_work_pool_stream_holds_back_a_fast_worker(self) -> None:
+        produced = []
+
+        def numbers():
+            for i in range(40):
+                produced.append(i)
+                yield i
+
+        async def scenario() -> None:
+            pool = WorkPool("thread", workers=1, queue_depth=0, stream_buffer=4)
+            try:
+                received = []
+                async for item in pool.stream(numbers):
+                    received.append(item)
+                    await asyncio.sleep(0.01)
+                    # Buffered items, plus at most one the worker is waiting to put.
+                    self.assertLessEqual(len(produced) - len(received), 4 + 1)
+                self.assertEqual(received, list(range(40)))
+            finally:
+                pool.shutdown()
+
+        asyncio.run(scenario())
+
+    def test_work_pool_restarts_after_worker_crash(self) -> None:
+        async def scenario() -> None:
+            pool = WorkPool("process", workers=1, queue_depth=0)
+            try:
+                with self.assertRaises(WorkerLostError):
+                    await pool.run(_crash_worker)
+                await asyncio.sleep(0)
+                self.assertEqual(pool.in_flight, 0)
+                self.assertEqual(await pool.run(abs, -3), 3)
+            finally:
+                pool.shutdown()
+
+        asyncio.run(scenario())
+
+    def test_work_pool_streams_items_as_produced(self) -> None:
+        step = threading.Event()
+        produced = []
+
+        def numbers():
+            for i in range(100):
+                produced.append(i)
+                yield i
+                if i == 0:
+                    step.wait(5)
+
+        async def scenario() -> None:
+            pool = WorkPool("thread", workers=1, queue_depth=0)
+            try:
+                events = pool.stream(numbers)
+                # The first item arrives while the worker is still blocked.
+                self.assertEqual(await events.__anext__(), 0)
+                self.assertEqual(produced, [0])
+                step.set()
+                self.assertEqual(await events.__anext__(), 1)
+                await events.aclose()
+                for _ in range(50):
+                    if pool.in_flight == 0:
+                        break
+                    await asyncio.sleep(0.01)
+                self.assertEqual(pool.in_flight, 0)
+                self.assertEqual(await pool.run(lambda: "admitted"), "admitted")
+                self.assertEqual([item async for item in pool.stream(range, 3)], [0, 1, 2])
+            finally:
+                step.set()
+                pool.shutdown()
+
+        asyncio.run(scenario())
+
 
 if __name__ == "__main__":
     unittest.main()